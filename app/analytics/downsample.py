@@ -0,0 +1,79 @@
+# app/analytics/downsample.py
+"""
+Server-side downsampling so charts ship a bounded number of points per
+series, however much history is selected.
+
+lttb() keeps the shape of a line (peaks and troughs survive) and suits
+close-price lines; ohlc_buckets() aggregates bars into equal-count buckets
+and suits candlesticks and volume.
+"""
+import numpy as np
+import pandas as pd
+
+
+def lttb(x, y, threshold: int):
+    """
+    Indices of the points Largest-Triangle-Three-Buckets keeps from (x, y),
+    always including the first and last. x must be ascending and numeric.
+    """
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+    x = np.asarray(x, dtype="float64")
+    y = np.asarray(y, dtype="float64")
+    # threshold - 2 buckets over the interior points 1 .. n-2, plus the last point
+    edges = np.append(np.linspace(1, n - 1, threshold - 1).astype(int), n)
+    counts = np.diff(edges)
+    mean_x = np.add.reduceat(x, edges[:-1]) / counts
+    mean_y = np.add.reduceat(y, edges[:-1]) / counts
+    keep = np.empty(threshold, dtype=int)
+    keep[0], keep[-1] = 0, n - 1
+    a = 0
+    for i in range(threshold - 2):
+        lo, hi = edges[i], edges[i + 1]
+        # Twice the triangle area (a, candidate, next bucket's mean) is
+        # |c1 * y + c2 * x + c0| for each candidate
+        xa, ya = x[a], y[a]
+        c1 = xa - mean_x[i + 1]
+        c2 = mean_y[i + 1] - ya
+        area = np.abs(c1 * y[lo:hi] + c2 * x[lo:hi] - (c1 * ya + c2 * xa))
+        a = lo + int(np.argmax(area))
+        keep[i + 1] = a
+    return keep
+
+
+def downsample(df, points: int = 500, x: str = "date", y: str = "close", by: str = "ticker"):
+    """
+    Long frame reduced to at most `points` rows per `by` group with LTTB on
+    (x, y). Rows with a missing y are dropped first.
+    """
+    if df.empty:
+        return df
+    parts = []
+    for _, group in df.dropna(subset=[y]).sort_values([by, x]).groupby(by, sort=False):
+        xs = group[x]
+        if pd.api.types.is_datetime64_any_dtype(xs):
+            xs = xs.astype("int64")
+        xs = xs.to_numpy(dtype="float64")
+        # Relative x keeps the area arithmetic well inside float64 precision
+        parts.append(group.iloc[lttb(xs - xs[0], group[y].to_numpy(), points)])
+    return pd.concat(parts, ignore_index=True) if parts else df.iloc[:0]
+
+
+def ohlc_buckets(df, points: int = 500, x: str = "date", by: str = "ticker"):
+    """
+    Long OHLCV frame aggregated into at most `points` equal-count buckets per
+    `by` group: first open, max high, min low, last close, summed volume,
+    stamped with the bucket's last date.
+    """
+    if df.empty:
+        return df
+    df = df.sort_values([by, x])
+    size = df.groupby(by)[x].transform("size")
+    position = df.groupby(by).cumcount()
+    bucket = (position * np.minimum(points, size) // size).rename("bucket")
+    agg = {x: "last"}
+    for col, how in (("open", "first"), ("high", "max"), ("low", "min"), ("close", "last"), ("volume", "sum")):
+        if col in df.columns:
+            agg[col] = how
+    return df.groupby([df[by], bucket]).agg(agg).reset_index().drop(columns="bucket")
@@ -0,0 +1,170 @@
+# app/analytics/indicators.py
+"""
+Vectorized technical indicators over many tickers at once.
+
+Everything works on a wide frame: a DatetimeIndex of bars and one column
+per ticker (see to_wide). Each indicator is a single pandas/NumPy operation
+across all columns, never a Python loop over tickers.
+"""
+import numpy as np
+import pandas as pd
+
+TRADING_DAYS = 252
+
+
+def to_wide(df, value: str = "close", fill: bool = True):
+    """
+    Pivot a long (date, ticker, value) frame to date x ticker.
+
+    Tickers trading on different calendars leave holes on each other's
+    holidays; with fill=True those are forward-filled (a flat bar) so rolling
+    windows are not broken by them. Leading gaps before a ticker's first bar
+    stay NaN.
+    """
+    wide = df.pivot_table(index="date", columns="ticker", values=value, aggfunc="last")
+    wide.columns.name = None
+    wide = wide.sort_index()
+    return wide.ffill() if fill else wide
+
+
+def returns(wide):
+    return wide.pct_change(fill_method=None)
+
+
+def log_returns(wide):
+    return np.log(wide).diff()
+
+
+def rolling_volatility(wide, window: int = 20, periods_per_year: int = TRADING_DAYS):
+    """Annualized rolling standard deviation of log returns."""
+    return log_returns(wide).rolling(window).std() * np.sqrt(periods_per_year)
+
+
+def sma(wide, window: int = 20):
+    return wide.rolling(window).mean()
+
+
+def ema(wide, span: int = 20):
+    return wide.ewm(span=span, adjust=False, ignore_na=True).mean()
+
+
+def rsi(wide, window: int = 14):
+    """Wilder's RSI (exponential smoothing with alpha = 1/window)."""
+    delta = wide.diff()
+    avg_gain = delta.clip(lower=0).ewm(alpha=1 / window, adjust=False, ignore_na=True, min_periods=window).mean()
+    avg_loss = (-delta.clip(upper=0)).ewm(alpha=1 / window, adjust=False, ignore_na=True, min_periods=window).mean()
+    return 100 - 100 / (1 + avg_gain / avg_loss)
+
+
+def drawdown(wide):
+    """Fractional distance below the running peak (0 at a new high)."""
+    return wide / wide.cummax() - 1
+
+
+def correlation_matrix(wide, method: str = "pearson"):
+    """Ticker x ticker correlation of daily returns."""
+    return returns(wide).corr(method=method)
+
+
+def summary(wide):
+    """Mean/min/max/last per ticker, one row per ticker."""
+    out = wide.agg(["mean", "min", "max"]).T
+    out["last"] = wide.ffill().iloc[-1]
+    return out
+
+
+class IndicatorEngine:
+    """
+    Full-history indicators plus incremental updates.
+
+    fit(wide) computes every indicator and keeps just enough state (a short
+    tail of bars, the last EMA/RSI averages and running peaks) for update(new)
+    to extend them with newly arrived bars in O(new rows x tickers), with the
+    same values a full recompute would give.
+    """
+
+    def __init__(self, sma_windows=(20, 50), ema_spans=(12, 26), rsi_window: int = 14,
+                 vol_window: int = 20):
+        self.sma_windows = tuple(sma_windows)
+        self.ema_spans = tuple(ema_spans)
+        self.rsi_window = rsi_window
+        self.vol_window = vol_window
+        self._tail = None
+        self._ema = {}
+        self._gain = self._loss = self._rsi_count = None
+        self._peak = None
+
+    @property
+    def _tail_size(self):
+        return max(self.sma_windows + (self.vol_window + 1, 2))
+
+    def _rolling(self, frame):
+        out = {f"sma_{w}": sma(frame, w) for w in self.sma_windows}
+        out["returns"] = returns(frame)
+        out["volatility"] = rolling_volatility(frame, self.vol_window)
+        return out
+
+    def fit(self, wide):
+        wide = wide.sort_index()
+        out = self._rolling(wide)
+        for span in self.ema_spans:
+            out[f"ema_{span}"] = ema(wide, span)
+            self._ema[span] = out[f"ema_{span}"].iloc[-1]
+        alpha = 1 / self.rsi_window
+        delta = wide.diff()
+        self._gain = delta.clip(lower=0).ewm(alpha=alpha, adjust=False, ignore_na=True).mean().iloc[-1]
+        self._loss = (-delta.clip(upper=0)).ewm(alpha=alpha, adjust=False, ignore_na=True).mean().iloc[-1]
+        self._rsi_count = delta.notna().sum()
+        out["rsi"] = rsi(wide, self.rsi_window)
+        out["drawdown"] = drawdown(wide)
+        self._peak = wide.max()
+        self._tail = wide.iloc[-self._tail_size:]
+        return out
+
+    @staticmethod
+    def _ewm_step(prev, values, alpha):
+        """adjust=False, ignore_na=True EWM over new rows; prev/values aligned 1-D/2-D arrays."""
+        out = np.empty_like(values)
+        cur = prev.copy()
+        for i, row in enumerate(values):
+            cur = np.where(np.isnan(row), cur, np.where(np.isnan(cur), row, alpha * row + (1 - alpha) * cur))
+            out[i] = cur
+        return out
+
+    def update(self, new):
+        """Indicators for the rows of `new` only; call fit() first."""
+        if self._tail is None:
+            raise RuntimeError("IndicatorEngine.update() called before fit()")
+        new = new.sort_index()
+        columns = self._tail.columns.union(new.columns)
+        tail = self._tail.reindex(columns=columns)
+        new = new.reindex(columns=columns)
+        combined = pd.concat([tail, new])
+
+        out = {k: v.iloc[len(tail):] for k, v in self._rolling(combined).items()}
+        values = new.to_numpy(dtype=float)
+        for span in self.ema_spans:
+            prev = self._ema[span].reindex(columns).to_numpy(dtype=float)
+            result = self._ewm_step(prev, values, 2 / (span + 1))
+            out[f"ema_{span}"] = pd.DataFrame(result, index=new.index, columns=columns)
+            self._ema[span] = out[f"ema_{span}"].iloc[-1]
+
+        delta = combined.diff().iloc[len(tail):].to_numpy(dtype=float)
+        alpha = 1 / self.rsi_window
+        gain = self._ewm_step(self._gain.reindex(columns).to_numpy(dtype=float),
+                              np.where(np.isnan(delta), np.nan, np.clip(delta, 0, None)), alpha)
+        loss = self._ewm_step(self._loss.reindex(columns).to_numpy(dtype=float),
+                              np.where(np.isnan(delta), np.nan, np.clip(-delta, 0, None)), alpha)
+        count = self._rsi_count.reindex(columns).fillna(0).to_numpy() + np.cumsum(~np.isnan(delta), axis=0)
+        rsi_values = np.where(count >= self.rsi_window, 100 - 100 / (1 + gain / loss), np.nan)
+        out["rsi"] = pd.DataFrame(rsi_values, index=new.index, columns=columns)
+        self._gain = pd.Series(gain[-1], index=columns)
+        self._loss = pd.Series(loss[-1], index=columns)
+        self._rsi_count = pd.Series(count[-1], index=columns)
+
+        peak = np.fmax.accumulate(np.vstack([self._peak.reindex(columns).to_numpy(dtype=float), values]), axis=0)[1:]
+        out["drawdown"] = pd.DataFrame(values / peak - 1, index=new.index, columns=columns)
+        self._peak = pd.Series(peak[-1], index=columns)
+
+        self._tail = combined.iloc[-self._tail_size:]
+        return out
@@ -1,23 +1,218 @@
 # app/automation.py
 from apscheduler.schedulers.background import BackgroundScheduler
+from apscheduler.executors.pool import ThreadPoolExecutor as JobExecutor
+from apscheduler.jobstores.sqlalchemy import SQLAlchemyJobStore
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from collections import deque
 from datetime import datetime
 import logging
+import math
+import threading
+import os
+import time
+
+from app.instrumentation import incr, record
 
 logger = logging.getLogger("app.automation")
 
-def scheduled_fetch_job(fetch_func, tickers):
-    """
-    fetch_func should accept a ticker string, fetch and persist results
-    """
-    for t in tickers:
+# Most recent scheduler runs (newest last), shown on the Scheduler tab
+RUN_HISTORY_SIZE = 50
+_run_history = deque(maxlen=RUN_HISTORY_SIZE)
+_history_lock = threading.Lock()
+
+
+def get_run_history():
+    """Metrics dicts of recent runs, newest first."""
+    with _history_lock:
+        return list(reversed(_run_history))
+
+
+def _fetch_with_retry(fetch_func, ticker, retries, backoff, started):
+    """Run fetch_func(ticker), retrying with exponential backoff."""
+    started[ticker] = time.monotonic()
+    attempt = 0
+    while True:
+        attempt += 1
         try:
-            logger.info(f"Scheduled fetch for {t} at {datetime.utcnow()}")
-            fetch_func(t)
+            return fetch_func(ticker), attempt
         except Exception as e:
-            logger.exception(f"Error fetching {t}: {e}")
+            if attempt > retries:
+                e.attempts = attempt
+                raise
+            delay = backoff * 2 ** (attempt - 1)
+            logger.warning(f"Fetch for {ticker} failed (attempt {attempt}), retrying in {delay:.1f}s: {e}")
+            time.sleep(delay)
+
+
+def scheduled_fetch_job(fetch_func, tickers, max_workers: int = 4, timeout: float = 120,
+                        retries: int = 2, backoff: float = 2.0):
+    """
+    fetch_func should accept a ticker string, fetch and persist results.
+
+    Tickers run on a bounded thread pool, each with its own retries. A ticker
+    still running `timeout` seconds after it started is reported as timed out
+    and no longer waited for (its thread finishes in the background); tickers
+    that never got a free worker before the run deadline are reported the same
+    way, so a run always ends. Returns the run's metrics dict, which is also
+    appended to the run history.
+    """
+    run = {
+        "started_at": datetime.utcnow(),
+        "tickers": {},
+    }
+    logger.info(f"Scheduled fetch for {', '.join(tickers)} at {run['started_at']}")
+    t0 = time.monotonic()
+    started = {}
+    workers = max(1, max_workers)
+    deadline = t0 + timeout * (math.ceil(len(tickers) / workers) + 1)
+
+    pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="fetch")
+    futures = {
+        pool.submit(_fetch_with_retry, fetch_func, t, retries, backoff, started): t
+        for t in tickers
+    }
+    pending = set(futures)
+    while pending:
+        done, pending = wait(pending, timeout=1.0, return_when=FIRST_COMPLETED)
+        for fut in done:
+            t = futures[fut]
+            elapsed = time.monotonic() - started.get(t, t0)
+            try:
+                result, attempts = fut.result()
+                run["tickers"][t] = {"status": "ok", "attempts": attempts,
+                                     "seconds": elapsed, "result": result}
+            except Exception as e:
+                logger.exception(f"Error fetching {t}: {e}")
+                run["tickers"][t] = {"status": "error", "attempts": getattr(e, "attempts", None),
+                                     "seconds": elapsed, "error": str(e)}
+        now = time.monotonic()
+        for fut in list(pending):
+            t = futures[fut]
+            if t in started and now - started[t] > timeout:
+                error = f"timed out after {timeout}s"
+            elif t not in started and now > deadline:
+                error = "never started before the run deadline"
+            else:
+                continue
+            logger.error(f"Fetch for {t} {error}")
+            run["tickers"][t] = {"status": "timeout", "attempts": None,
+                                 "seconds": now - started.get(t, now), "error": error}
+            pending.discard(fut)
+    pool.shutdown(wait=False, cancel_futures=True)
+
+    statuses = [r["status"] for r in run["tickers"].values()]
+    run["duration_s"] = time.monotonic() - t0
+    run["succeeded"] = statuses.count("ok")
+    run["failed"] = len(statuses) - run["succeeded"]
+    record("scheduler.run", run["duration_s"], error=run["failed"] > 0)
+    for r in run["tickers"].values():
+        record("scheduler.ticker", r["seconds"], error=r["status"] != "ok")
+    incr("scheduler.tickers_ok", run["succeeded"])
+    incr("scheduler.tickers_failed", run["failed"])
+    logger.info(f"Scheduled fetch finished in {run['duration_s']:.1f}s: "
+                f"{run['succeeded']} ok, {run['failed']} failed")
+    with _history_lock:
+        _run_history.append(run)
+    return run
+
+
+# Threads APScheduler itself uses to run due jobs (each job fans out further)
+SCHEDULER_THREADS = int(os.getenv("SCHEDULER_THREADS", "2"))
+
+
+def fetch_job_id(tickers):
+    """Stable job id for a ticker set, so re-scheduling the same set replaces it."""
+    return "fetch:" + ",".join(sorted({t.strip().upper() for t in tickers if t.strip()}))
+
 
-def start_scheduler(fetch_func, tickers, minutes: int = 60):
-    scheduler = BackgroundScheduler()
-    scheduler.add_job(lambda: scheduled_fetch_job(fetch_func, tickers), 'interval', minutes=minutes)
-    scheduler.start()
-    return scheduler
+class SchedulerManager:
+    """
+    One BackgroundScheduler per process, with jobs persisted in the app
+    database (apscheduler_jobs table) so they survive restarts. Use
+    get_scheduler_manager() rather than constructing this directly.
+    """
+
+    def __init__(self, bind=None):
+        from app.db import engine
+
+        self.scheduler = BackgroundScheduler(
+            jobstores={"default": SQLAlchemyJobStore(engine=bind or engine)},
+            executors={"default": JobExecutor(max_workers=SCHEDULER_THREADS)},
+            job_defaults={"coalesce": True, "max_instances": 1},
+        )
+        self._lock = threading.Lock()
+
+    def start(self):
+        with self._lock:
+            if not self.scheduler.running:
+                self.scheduler.start()
+
+    def schedule_fetch(self, tickers, minutes: int = 60, fetch_func=None, **job_options):
+        """
+        Add or replace the interval fetch job for this ticker set. fetch_func
+        must be a module-level function (it is pickled into the job store);
+        defaults to app.ingestion.fetch_and_store.
+        """
+        if fetch_func is None:
+            from app.ingestion import fetch_and_store as fetch_func
+        tickers = sorted({t.strip().upper() for t in tickers if t.strip()})
+        self.start()
+        return self.scheduler.add_job(
+            scheduled_fetch_job, 'interval', minutes=minutes,
+            id=fetch_job_id(tickers), name=", ".join(tickers),
+            args=[fetch_func, tickers], kwargs=job_options,
+            replace_existing=True,
+        )
+
+    def list_jobs(self):
+        jobs = []
+        for job in self.scheduler.get_jobs():
+            interval = getattr(job.trigger, "interval", None)
+            jobs.append({
+                "id": job.id,
+                "tickers": job.name,
+                "minutes": interval.total_seconds() / 60 if interval else None,
+                "next_run_time": job.next_run_time,
+                "paused": job.next_run_time is None,
+            })
+        return jobs
+
+    def pause(self, job_id):
+        self.scheduler.pause_job(job_id)
+
+    def resume(self, job_id):
+        self.scheduler.resume_job(job_id)
+
+    def remove(self, job_id):
+        self.scheduler.remove_job(job_id)
+
+    def shutdown(self, wait: bool = False):
+        with self._lock:
+            if self.scheduler.running:
+                self.scheduler.shutdown(wait=wait)
+
+
+_manager = None
+_manager_lock = threading.Lock()
+
+
+def get_scheduler_manager():
+    """The process-wide SchedulerManager, started on first use."""
+    global _manager
+    with _manager_lock:
+        if _manager is None:
+            _manager = SchedulerManager()
+    _manager.start()
+    return _manager
+
+
+def start_scheduler(fetch_func, tickers, minutes: int = 60, **job_options):
+    """
+    Schedule fetch_func for tickers on the shared scheduler. job_options are
+    passed to scheduled_fetch_job (max_workers, timeout, retries, backoff).
+    Runs coalesce and never overlap, and calling this again for the same
+    tickers replaces the job instead of adding another scheduler.
+    """
+    manager = get_scheduler_manager()
+    manager.schedule_fetch(tickers, minutes=minutes, fetch_func=fetch_func, **job_options)
+    return manager
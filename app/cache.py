@@ -0,0 +1,167 @@
+# app/cache.py
+"""
+Caches: TTLCache for in-process query/service results, ContentCache for
+on-disk results keyed by uploaded-file content.
+"""
+from collections import OrderedDict
+import functools
+import hashlib
+import os
+import pickle
+import threading
+import time
+
+from app.instrumentation import incr
+
+_MISSING = object()
+
+
+class TTLCache:
+    """
+    Thread-safe mapping whose entries expire `ttl` seconds after being set.
+    Beyond `maxsize` entries the least recently used one is evicted.
+    """
+
+    def __init__(self, ttl: float = 60, maxsize: int = 256):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            item = self._data.get(key, _MISSING)
+            if item is _MISSING:
+                return default
+            expires, value = item
+            if expires < time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._data)
+
+
+def cached(cache):
+    """Memoize a function in `cache`, keyed by its name and (hashable) arguments."""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = (func.__qualname__, args, tuple(sorted(kwargs.items())))
+            value = cache.get(key, _MISSING)
+            if value is _MISSING:
+                incr("cache.misses")
+                value = func(*args, **kwargs)
+                cache.set(key, value)
+            else:
+                incr("cache.hits")
+            return value
+        wrapper.cache = cache
+        return wrapper
+    return decorator
+
+
+def file_sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+class ContentCache:
+    """
+    Size-bounded on-disk cache of pickled values, for results derived from
+    uploaded files (keys are usually "<sha256 of the file>:<what>").
+
+    Entries are evicted least recently used first once the directory exceeds
+    max_bytes; a hit refreshes the entry's mtime, which is the recency used.
+    """
+
+    def __init__(self, directory: str, max_bytes: int):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key):
+        name = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, name[:2], name + ".pkl")
+
+    def get(self, key, default=None):
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                value = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return default
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return value
+
+    def set(self, key, value):
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp, "wb") as f:
+            pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+        self._evict()
+
+    def get_or_compute(self, key, compute):
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = compute()
+            self.set(key, value)
+        return value
+
+    def _evict(self):
+        with self._lock:
+            entries = []
+            for root, _, files in os.walk(self.directory):
+                for name in files:
+                    if not name.endswith(".pkl"):
+                        continue
+                    path = os.path.join(root, name)
+                    try:
+                        st = os.stat(path)
+                    except OSError:
+                        continue
+                    entries.append((st.st_mtime, st.st_size, path))
+            total = sum(size for _, size, _ in entries)
+            for _, size, path in sorted(entries):
+                if total <= self.max_bytes:
+                    break
+                try:
+                    os.remove(path)
+                    total -= size
+                except OSError:
+                    pass
+
+
+_content_cache = None
+_content_cache_lock = threading.Lock()
+
+
+def get_content_cache():
+    """Process-wide ContentCache at PARSE_CACHE_DIR, bounded by PARSE_CACHE_MAX_MB."""
+    global _content_cache
+    with _content_cache_lock:
+        if _content_cache is None:
+            _content_cache = ContentCache(
+                os.getenv("PARSE_CACHE_DIR", "./data/cache"),
+                int(float(os.getenv("PARSE_CACHE_MAX_MB", "512")) * 1024 * 1024),
+            )
+    return _content_cache
@@ -1,8 +1,16 @@
 import pandas as pd
 from io import BytesIO
 import os
+import openpyxl
+from app.instrumentation import timed
 
+# Rows read to infer CSV column dtypes before chunked reading
+CSV_SAMPLE_ROWS = 1000
+
+
+@timed("excel.parse")
 def parse_excel(file_bytes, filename):
+    """Load every sheet fully; prefer open_workbook() for previews of large files."""
     ext = os.path.splitext(filename)[1].lower()
 
     if ext == ".csv":
@@ -14,3 +22,188 @@ def parse_excel(file_bytes, filename):
 
     else:
         raise ValueError("Unsupported file format. Please upload .csv, .xls, or .xlsx")
+
+
+def open_workbook(file_bytes, filename):
+    """Lazy handle (ExcelWorkbook or CsvFile) exposing sheet_names/dimensions/load_sheet."""
+    ext = os.path.splitext(filename)[1].lower()
+    if ext == ".csv":
+        return CsvFile(file_bytes)
+    elif ext in [".xls", ".xlsx"]:
+        return ExcelWorkbook(file_bytes)
+    else:
+        raise ValueError("Unsupported file format. Please upload .csv, .xls, or .xlsx")
+
+
+def _select_columns(header, usecols):
+    """0-based positions for usecols given as names or positions (None = all)."""
+    if usecols is None:
+        return list(range(len(header)))
+    positions = []
+    for col in usecols:
+        if isinstance(col, int):
+            positions.append(col)
+        else:
+            positions.append(header.index(col))
+    return positions
+
+
+def _csv_dtype(dtype):
+    if pd.api.types.is_bool_dtype(dtype) or not pd.api.types.is_numeric_dtype(dtype):
+        return "object"
+    return "Int64" if pd.api.types.is_integer_dtype(dtype) else "float64"
+
+
+class ExcelWorkbook:
+    """
+    Read-only openpyxl view of a workbook. Nothing is materialized up front:
+    sheet names and dimensions come from the workbook/sheet XML headers, and
+    load_sheet streams only the requested row window and columns. Files
+    written without a <dimension> record (Excel always writes one) report
+    unknown sizes from dimensions() rather than being scanned.
+    """
+
+    def __init__(self, file_bytes):
+        self._wb = openpyxl.load_workbook(BytesIO(file_bytes), read_only=True, data_only=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self._wb.close()
+
+    @property
+    def sheet_names(self):
+        return list(self._wb.sheetnames)
+
+    def dimensions(self):
+        """
+        {sheet: (data rows, columns)} from each sheet's declared dimension,
+        without reading cells (None where the file declares no dimension).
+        """
+        dims = {}
+        for name in self.sheet_names:
+            ws = self._wb[name]
+            rows = ws.max_row - 1 if ws.max_row else None
+            dims[name] = (rows, ws.max_column)
+        return dims
+
+    def header(self, sheet):
+        row = next(self._wb[sheet].iter_rows(min_row=1, max_row=1, values_only=True), ())
+        return [str(v) if v is not None else f"Unnamed: {i}" for i, v in enumerate(row)]
+
+    @timed("excel.load_sheet")
+    def load_sheet(self, sheet, usecols=None, start_row: int = 0, nrows=None):
+        """
+        DataFrame of data rows [start_row, start_row + nrows) (0-based, after the
+        header row) restricted to usecols (names or 0-based positions).
+        """
+        header = self.header(sheet)
+        positions = _select_columns(header, usecols)
+        if not positions:
+            return pd.DataFrame()
+        min_col, max_col = min(positions) + 1, max(positions) + 1
+        min_row = start_row + 2
+        max_row = min_row + nrows - 1 if nrows is not None else None
+        rows = self._wb[sheet].iter_rows(
+            min_row=min_row, max_row=max_row, min_col=min_col, max_col=max_col, values_only=True
+        )
+        offsets = [p - min_col + 1 for p in positions]
+        data = [[row[o] if o < len(row) else None for o in offsets] for row in rows]
+        return pd.DataFrame(data, columns=[header[p] for p in positions])
+
+    def preview(self, sheet, n: int = 5):
+        return self.load_sheet(sheet, nrows=n)
+
+
+class CsvFile:
+    """CSV counterpart of ExcelWorkbook with a single "CSV_Data" sheet and chunked reading."""
+
+    sheet_names = ["CSV_Data"]
+
+    def __init__(self, file_bytes):
+        self._bytes = file_bytes
+        self._dtypes = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        pass
+
+    def _reader(self, **kwargs):
+        return pd.read_csv(BytesIO(self._bytes), **kwargs)
+
+    def dtypes(self):
+        """
+        Column dtypes inferred once from the first CSV_SAMPLE_ROWS rows:
+        integers as nullable Int64 (blanks further down stay integers),
+        other numbers as float64, the rest as object.
+        """
+        if self._dtypes is None:
+            sample = self._reader(nrows=CSV_SAMPLE_ROWS)
+            self._dtypes = {col: _csv_dtype(dtype) for col, dtype in sample.dtypes.items()}
+        return self._dtypes
+
+    def _relax_dtypes(self):
+        """
+        Loosen the sampled dtypes after a later row did not fit them: Int64
+        columns become float64 (a fraction), and if there are none left the
+        numeric columns become object (text). False once everything is object.
+        """
+        dtypes = self.dtypes()
+        ints = [col for col, dtype in dtypes.items() if dtype == "Int64"]
+        if ints:
+            for col in ints:
+                dtypes[col] = "float64"
+            return True
+        numeric = [col for col, dtype in dtypes.items() if dtype != "object"]
+        for col in numeric:
+            dtypes[col] = "object"
+        return bool(numeric)
+
+    def header(self, sheet="CSV_Data"):
+        return list(self.dtypes())
+
+    def dimensions(self):
+        rows = self._bytes.count(b"\n") - 1 + (not self._bytes.endswith(b"\n"))
+        return {"CSV_Data": (max(rows, 0), len(self.header()))}
+
+    @timed("excel.load_sheet")
+    def load_sheet(self, sheet="CSV_Data", usecols=None, start_row: int = 0, nrows=None):
+        header = self.header()
+        names = [header[p] for p in _select_columns(header, usecols)]
+        while True:
+            try:
+                return self._reader(
+                    usecols=names, skiprows=range(1, start_row + 1), nrows=nrows,
+                    dtype={c: t for c, t in self.dtypes().items() if c in names},
+                )[names]
+            except (TypeError, ValueError):
+                if not self._relax_dtypes():
+                    raise
+
+    def iter_chunks(self, chunksize: int = 50_000, usecols=None):
+        """Yield DataFrames of `chunksize` rows with the sampled dtypes applied."""
+        names = None if usecols is None else [self.header()[p] for p in _select_columns(self.header(), usecols)]
+        done = 0
+        while True:
+            try:
+                for chunk in self._reader(chunksize=chunksize, usecols=names, dtype=self.dtypes(),
+                                          skiprows=range(1, done + 1)):
+                    done += len(chunk)
+                    yield chunk
+                return
+            except (TypeError, ValueError):
+                # Resume after the rows already yielded, with the looser dtypes from here on
+                if not self._relax_dtypes():
+                    raise
+
+    def preview(self, sheet="CSV_Data", n: int = 5):
+        return self.load_sheet(nrows=n)
@@ -1,13 +1,83 @@
+import os
 import pandas as pd
 import pdfplumber
 from io import BytesIO
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pdfminer.pdftypes import resolve1
+from app.instrumentation import timed
 
-def parse_pdf(file_bytes):
-    text = ""
-    tables = []
+# Documents with at least this many pages are split across processes
+PARALLEL_MIN_PAGES = int(os.getenv("PDF_PARALLEL_MIN_PAGES", "40"))
+# Pages per work unit handed to a worker process
+PAGES_PER_CHUNK = int(os.getenv("PDF_PAGES_PER_CHUNK", "20"))
+
+
+def _tables_to_frames(tables):
+    return [pd.DataFrame(tbl[1:], columns=tbl[0]) for tbl in tables if tbl]
+
+
+def count_pages(file_bytes):
     with pdfplumber.open(BytesIO(file_bytes)) as pdf:
+        try:
+            return int(resolve1(pdf.doc.catalog["Pages"])["Count"])
+        except Exception:
+            return len(pdf.pages)
+
+
+def iter_pdf_pages(file_bytes, start: int = 0, stop=None):
+    """
+    Yield (page_no, text, tables) for pages [start, stop), one page at a time.
+    page_no is 1-based; tables are DataFrames. Each page's layout cache is
+    released once it has been yielded, so memory stays flat on long documents.
+    """
+    stop = count_pages(file_bytes) if stop is None else stop
+    wanted = list(range(start + 1, stop + 1))
+    if not wanted:
+        return
+    with pdfplumber.open(BytesIO(file_bytes), pages=wanted) as pdf:
         for page in pdf.pages:
-            text += page.extract_text() or ""
-            tables.extend(page.extract_tables())
-    dfs = [pd.DataFrame(tbl[1:], columns=tbl[0]) for tbl in tables if tbl]
-    return {"text": text, "tables": dfs}
+            text = page.extract_text() or ""
+            tables = _tables_to_frames(page.extract_tables())
+            page.close()
+            yield page.page_number, text, tables
+
+
+def _parse_range(file_bytes, start, stop):
+    """Worker-process entry point: parse one page range."""
+    return list(iter_pdf_pages(file_bytes, start, stop))
+
+
+@timed("pdf.parse")
+def parse_pdf(file_bytes, max_pages=None, workers=None, progress=None):
+    """
+    Parse text and tables of the first `max_pages` pages (all by default).
+
+    Documents of PARALLEL_MIN_PAGES or more are split into page ranges parsed
+    by a process pool of `workers` processes (default: CPU count); pass
+    workers=1 to stay in-process. `progress(done_pages, total_pages)` is
+    called as pages complete.
+    """
+    total = count_pages(file_bytes)
+    if max_pages is not None:
+        total = min(total, max_pages)
+    workers = workers or os.cpu_count() or 1
+
+    pages = []
+    if workers > 1 and total >= PARALLEL_MIN_PAGES:
+        ranges = [(s, min(s + PAGES_PER_CHUNK, total)) for s in range(0, total, PAGES_PER_CHUNK)]
+        with ProcessPoolExecutor(max_workers=min(workers, len(ranges))) as pool:
+            futures = [pool.submit(_parse_range, file_bytes, s, e) for s, e in ranges]
+            for fut in as_completed(futures):
+                pages.extend(fut.result())
+                if progress:
+                    progress(len(pages), total)
+        pages.sort(key=lambda p: p[0])
+    else:
+        for page in iter_pdf_pages(file_bytes, 0, total):
+            pages.append(page)
+            if progress:
+                progress(len(pages), total)
+
+    text = "".join(p[1] for p in pages)
+    dfs = [df for p in pages for df in p[2]]
+    return {"text": text, "tables": dfs, "pages": total}
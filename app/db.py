@@ -2,30 +2,106 @@ from dotenv import load_dotenv
 load_dotenv()
 
 import os
-from sqlalchemy import create_engine
+from contextlib import contextmanager
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import declarative_base, sessionmaker
+from app.instrumentation import instrument_engine
 
 # Get DB URL from .env or fallback to SQLite
 DATABASE_URL = os.getenv("DATABASE_URL") or "sqlite:///./app_data.db"
 
-# Handle SQLite separately
-if DATABASE_URL.startswith("sqlite:///"):
-    db_path = DATABASE_URL.replace("sqlite:///", "")
-    os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+# SQLite profile: WAL lets Dashboard reads proceed while the scheduler writes
+SQLITE_JOURNAL_MODE = os.getenv("SQLITE_JOURNAL_MODE", "WAL")
+SQLITE_SYNCHRONOUS = os.getenv("SQLITE_SYNCHRONOUS", "NORMAL")
+SQLITE_BUSY_TIMEOUT_MS = int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "15000"))
+SQLITE_MMAP_SIZE = int(os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024)))
 
-    engine = create_engine(
-        DATABASE_URL, connect_args={"check_same_thread": False}
-    )
-else:
-    engine = create_engine(DATABASE_URL)
+# Server database (PostgreSQL) pool profile
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "1") == "1"
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+def _sqlite_pragmas(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    cursor.execute(f"PRAGMA journal_mode={SQLITE_JOURNAL_MODE}")
+    cursor.execute(f"PRAGMA synchronous={SQLITE_SYNCHRONOUS}")
+    cursor.execute(f"PRAGMA busy_timeout={SQLITE_BUSY_TIMEOUT_MS}")
+    cursor.execute(f"PRAGMA mmap_size={SQLITE_MMAP_SIZE}")
+    cursor.close()
+
+
+def create_app_engine(url=None):
+    """
+    Engine for url (default DATABASE_URL) with the SQLite or server-pool
+    profile applied and statement timings recorded by app.instrumentation.
+    """
+    url = url or DATABASE_URL
+    if url.startswith("sqlite"):
+        if url.startswith("sqlite:///") and ":memory:" not in url:
+            db_path = url.replace("sqlite:///", "")
+            os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+        new_engine = create_engine(
+            url, connect_args={"check_same_thread": False, "timeout": SQLITE_BUSY_TIMEOUT_MS / 1000}
+        )
+        if ":memory:" not in url:
+            event.listen(new_engine, "connect", _sqlite_pragmas)
+    else:
+        new_engine = create_engine(
+            url,
+            pool_size=DB_POOL_SIZE,
+            max_overflow=DB_MAX_OVERFLOW,
+            pool_timeout=DB_POOL_TIMEOUT,
+            pool_recycle=DB_POOL_RECYCLE,
+            pool_pre_ping=DB_POOL_PRE_PING,
+        )
+    return instrument_engine(new_engine)
+
+
+engine = create_app_engine()
+
+# Objects stay readable after their session closes (the UI uses them that way)
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
 Base = declarative_base()
 
 
+@contextmanager
+def session_scope():
+    """Session that commits on success, rolls back on error and always closes."""
+    session = SessionLocal()
+    try:
+        yield session
+        session.commit()
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        session.close()
+
+
 def init_db():
     """Initialize database tables (only if missing)"""
     import app.models  # Ensure models are imported
 
+    from app.search import ensure_search_index
+
     Base.metadata.create_all(bind=engine, checkfirst=True)
+    ensure_search_index(engine)
     print("✅ Database ready")
+
+
+def dialect_insert(table, bind=None):
+    """
+    INSERT construct with on_conflict_do_update/do_nothing for SQLite and
+    PostgreSQL; None for dialects without ON CONFLICT support.
+    """
+    name = (bind or engine).dialect.name
+    if name == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+    elif name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        return None
+    return insert(table)
@@ -0,0 +1,165 @@
+# app/ingestion.py
+"""
+Vectorized OHLCV ingestion.
+
+DataFrames coming from yfinance (or anywhere else) are normalized once per
+frame and written through SQLAlchemy Core in chunks, instead of building one
+FinancialData ORM object per row.
+"""
+import logging
+
+import pandas as pd
+from app.db import engine, dialect_insert
+from app.instrumentation import incr, timed
+from app.models import FinancialData
+from app import price_store, queries
+from app.ticker_stats import refresh_ticker_stats
+from app.tickers import ensure_tickers
+
+logger = logging.getLogger("app.ingestion")
+
+OHLCV_COLUMNS = ["open", "high", "low", "close", "volume"]
+FRAME_COLUMNS = ["ticker", "date"] + OHLCV_COLUMNS
+
+# Rows per executemany batch; keeps parameter lists bounded for large fetches
+CHUNK_SIZE = 5000
+
+
+def _flatten_columns(df):
+    """yfinance returns (field, ticker) MultiIndex columns even for one symbol."""
+    if not isinstance(df.columns, pd.MultiIndex):
+        return df
+    df = df.copy()
+    for level in range(df.columns.nlevels):
+        values = [str(v).lower() for v in df.columns.get_level_values(level)]
+        if "close" in values:
+            df.columns = df.columns.get_level_values(level)
+            return df
+    df.columns = df.columns.get_level_values(0)
+    return df
+
+
+def normalize_ohlcv(df, ticker=None):
+    """
+    Return a frame with FRAME_COLUMNS: lower-case names, naive datetimes and
+    float prices. OHLCV columns missing from df are all-NaN (stored as NULL,
+    and left alone when updating existing bars). Rows without a parseable
+    date are dropped; duplicate dates keep the last row.
+    """
+    if df is None or df.empty:
+        return pd.DataFrame(columns=FRAME_COLUMNS)
+
+    df = _flatten_columns(df)
+    df = df.rename(columns=lambda c: str(c).strip().lower())
+    if "date" not in df.columns:
+        df = df.reset_index().rename(columns=lambda c: str(c).strip().lower())
+        if "date" not in df.columns and "datetime" in df.columns:
+            df = df.rename(columns={"datetime": "date"})
+    if "date" not in df.columns:
+        return pd.DataFrame(columns=FRAME_COLUMNS)
+
+    dates = df["date"]
+    if not pd.api.types.is_datetime64_any_dtype(dates):
+        dates = pd.to_datetime(dates, errors="coerce")
+    if getattr(dates.dt, "tz", None) is not None:
+        dates = dates.dt.tz_localize(None)
+
+    out = pd.DataFrame({"date": dates})
+    if ticker is not None:
+        out["ticker"] = ticker
+    elif "ticker" in df.columns:
+        out["ticker"] = df["ticker"].astype(str)
+    else:
+        raise ValueError("normalize_ohlcv needs a ticker argument or a 'ticker' column")
+    for col in OHLCV_COLUMNS:
+        if col in df.columns:
+            out[col] = pd.to_numeric(df[col], errors="coerce").astype(float)
+        else:
+            out[col] = float("nan")
+
+    out = out.dropna(subset=["date"])
+    out = out.drop_duplicates(subset=["ticker", "date"], keep="last")
+    return out[FRAME_COLUMNS].reset_index(drop=True)
+
+
+def frame_to_records(frame):
+    """Convert a normalized frame to executemany parameter dicts (NaN -> NULL)."""
+    if frame.empty:
+        return []
+    columns = {}
+    for col in FRAME_COLUMNS:
+        series = frame[col]
+        if col == "date":
+            columns[col] = list(series.dt.to_pydatetime())
+        else:
+            columns[col] = series.astype(object).where(series.notna(), None).tolist()
+    names = list(columns)
+    return [dict(zip(names, row)) for row in zip(*columns.values())]
+
+
+def present_columns(frame):
+    """OHLCV columns of a normalized frame that hold any value (missing ones are all-NaN)."""
+    return [col for col in OHLCV_COLUMNS if frame[col].notna().any()]
+
+
+def upsert_statement(bind=None, columns=OHLCV_COLUMNS):
+    """
+    INSERT ... ON CONFLICT (ticker, date) DO UPDATE for SQLite/PostgreSQL.
+    Only `columns` are overwritten on existing bars.
+    """
+    table = FinancialData.__table__
+    stmt = dialect_insert(table, bind=bind)
+    if stmt is None:
+        return table.insert()
+    if not columns:
+        return stmt.on_conflict_do_nothing(index_elements=["ticker", "date"])
+    updates = {col: stmt.excluded[col] for col in columns}
+    return stmt.on_conflict_do_update(index_elements=["ticker", "date"], set_=updates)
+
+
+@timed("ingestion.write")
+def write_financial_frame(frame, bind=None, chunk_size: int = CHUNK_SIZE):
+    """
+    Upsert a normalized frame with Core executemany; returns rows written.
+    Symbols new to the tickers table get their reference row first.
+    """
+    records = frame_to_records(frame)
+    if not records:
+        return 0
+    bind = bind or engine
+    stmt = upsert_statement(bind, columns=present_columns(frame))
+    with bind.begin() as conn:
+        ensure_tickers(conn, frame["ticker"].unique().tolist())
+        for start in range(0, len(records), chunk_size):
+            conn.execute(stmt, records[start:start + chunk_size])
+        refresh_ticker_stats(conn, frame["ticker"].unique().tolist())
+    queries.invalidate()
+    try:
+        price_store.write_frame(frame)
+    except Exception as e:
+        # The rows are committed and financial_data is the source of truth; don't fail the write
+        logger.exception(f"Parquet price store write failed: {e}")
+        incr("price_store.errors")
+    incr("ingestion.rows", len(records))
+    return len(records)
+
+
+def save_financial_dataframe(ticker, df, bind=None):
+    """Normalize and bulk-write one ticker's OHLCV frame; returns rows written."""
+    with timed("ingestion.normalize"):
+        frame = normalize_ohlcv(df, ticker=ticker)
+    return write_financial_frame(frame, bind=bind)
+
+
+def fetch_and_store(ticker, period: str = "1mo", incremental: bool = True, provider=None, bind=None):
+    """
+    Refresh one ticker: fetch only the bars missing from the DB (or `period`
+    for a new ticker) and upsert them. Returns rows written.
+    """
+    from app.services.finance_api import fetch_yfinance_history
+
+    df = fetch_yfinance_history(ticker, period=period, incremental=incremental,
+                                provider=provider, bind=bind)
+    if df is None or df.empty:
+        return 0
+    return save_financial_dataframe(ticker, df, bind=bind)
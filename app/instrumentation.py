@@ -0,0 +1,190 @@
+# app/instrumentation.py
+"""
+In-process timings for the hot paths, shown on the Performance tab.
+
+timed("name") is a context manager and a decorator; each call lands in a
+rolling histogram (the last PERF_WINDOW durations per name). incr() keeps
+plain counters, and instrument_engine() records every SQL statement's
+duration plus the PERF_SLOW_QUERIES slowest statements.
+
+Everything lives in this process's memory. Job workers run in their own
+processes, so app.jobs stores each job's captured timings with its result.
+Set PERF_ENABLED=0 to turn recording off.
+"""
+import cProfile
+import io
+import os
+import pstats
+import re
+import threading
+import time
+from collections import Counter, defaultdict, deque
+from contextlib import contextmanager
+from datetime import datetime
+
+from sqlalchemy import event
+
+PERF_ENABLED = os.getenv("PERF_ENABLED", "1") == "1"
+# Durations kept per operation for the percentiles
+PERF_WINDOW = int(os.getenv("PERF_WINDOW", "1000"))
+PERF_SLOW_QUERIES = int(os.getenv("PERF_SLOW_QUERIES", "20"))
+# Characters of SQL kept per slow query
+SQL_PREVIEW_CHARS = 300
+
+_lock = threading.Lock()
+_durations = defaultdict(lambda: deque(maxlen=PERF_WINDOW))
+_totals = defaultdict(lambda: [0, 0, 0.0])  # name -> [calls, errors, seconds]
+_counters = Counter()
+_slow_queries = []  # (seconds, recorded_at, statement), slowest first
+_local = threading.local()
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def record(name, seconds, error: bool = False):
+    """Add one duration for operation `name`."""
+    if not PERF_ENABLED:
+        return
+    with _lock:
+        _durations[name].append(seconds)
+        totals = _totals[name]
+        totals[0] += 1
+        totals[1] += error
+        totals[2] += seconds
+    for spans in getattr(_local, "captures", ()):
+        spans[name] = spans.get(name, 0.0) + seconds
+
+
+@contextmanager
+def timed(name):
+    """Time the block (or, as @timed(name), every call); exceptions count as errors."""
+    start = time.perf_counter()
+    error = False
+    try:
+        yield
+    except BaseException:
+        error = True
+        raise
+    finally:
+        record(name, time.perf_counter() - start, error)
+
+
+def incr(name, n: int = 1):
+    if PERF_ENABLED:
+        with _lock:
+            _counters[name] += n
+
+
+@contextmanager
+def capture():
+    """Yield a dict that collects {operation: total seconds} timed in this thread during the block."""
+    spans = {}
+    captures = getattr(_local, "captures", None)
+    if captures is None:
+        captures = _local.captures = []
+    captures.append(spans)
+    try:
+        yield spans
+    finally:
+        captures.remove(spans)
+
+
+def _percentile(ordered, q):
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def snapshot():
+    """Per-operation stats over the rolling window, slowest p95 first."""
+    with _lock:
+        items = [(name, sorted(values), list(_totals[name])) for name, values in _durations.items()]
+    rows = []
+    for name, ordered, (calls, errors, total) in items:
+        if not ordered:
+            continue
+        rows.append({
+            "operation": name,
+            "calls": calls,
+            "errors": errors,
+            "p50_ms": _percentile(ordered, 0.50) * 1000,
+            "p95_ms": _percentile(ordered, 0.95) * 1000,
+            "max_ms": ordered[-1] * 1000,
+            "total_s": total,
+        })
+    return sorted(rows, key=lambda r: r["p95_ms"], reverse=True)
+
+
+def counters():
+    with _lock:
+        return dict(_counters)
+
+
+def slow_queries():
+    """The slowest SQL statements seen, slowest first."""
+    with _lock:
+        return [{"ms": s * 1000, "at": at, "statement": stmt} for s, at, stmt in _slow_queries]
+
+
+def reset():
+    with _lock:
+        _durations.clear()
+        _totals.clear()
+        _counters.clear()
+        _slow_queries.clear()
+
+
+# ---------------------------
+# SQLAlchemy
+# ---------------------------
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("perf_query_start", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    starts = conn.info.get("perf_query_start")
+    if not starts:
+        return
+    seconds = time.perf_counter() - starts.pop()
+    record("db.query", seconds)
+    if not PERF_ENABLED or PERF_SLOW_QUERIES <= 0:
+        return
+    with _lock:
+        if len(_slow_queries) >= PERF_SLOW_QUERIES and seconds <= _slow_queries[-1][0]:
+            return
+    preview = _WHITESPACE.sub(" ", statement).strip()[:SQL_PREVIEW_CHARS]
+    if executemany:
+        preview = f"[executemany] {preview}"
+    with _lock:
+        _slow_queries.append((seconds, datetime.now(), preview))
+        _slow_queries.sort(key=lambda item: item[0], reverse=True)
+        del _slow_queries[PERF_SLOW_QUERIES:]
+
+
+def _handle_error(context):
+    starts = context.connection.info.get("perf_query_start") if context.connection is not None else None
+    if starts:
+        record("db.query", time.perf_counter() - starts.pop(), error=True)
+
+
+def instrument_engine(engine):
+    """Record the duration of every statement engine executes (as "db.query")."""
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
+    return engine
+
+
+# ---------------------------
+# cProfile
+# ---------------------------
+def start_profile():
+    profiler = cProfile.Profile()
+    profiler.enable()
+    return profiler
+
+
+def stop_profile(profiler, limit: int = 40, sort: str = "cumulative"):
+    """Stop profiler and return its top `limit` functions as text."""
+    profiler.disable()
+    out = io.StringIO()
+    pstats.Stats(profiler, stream=out).strip_dirs().sort_stats(sort).print_stats(limit)
+    return out.getvalue()
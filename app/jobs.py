@@ -0,0 +1,316 @@
+# app/jobs.py
+"""
+Database-backed background job queue.
+
+The Streamlit app enqueues heavy work (parsing and summarizing uploaded
+reports) as rows in the `jobs` table and polls them; worker processes claim
+queued rows, run the registered handler and write the result back. Workers
+run inside the app (JOB_WORKERS, default 1) or separately:
+
+    python -m app.jobs --workers 4
+
+Set JOB_WORKERS=0 when a separate worker process serves the app. Uploaded
+files are spooled to JOB_SPOOL_DIR so job payloads stay small.
+"""
+import argparse
+import logging
+import multiprocessing
+import os
+import socket
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import select, update, and_
+from app.db import engine, init_db
+from app.instrumentation import capture, timed
+from app.models import Job
+
+logger = logging.getLogger("app.jobs")
+
+JOB_WORKERS = int(os.getenv("JOB_WORKERS", "1"))
+JOB_SPOOL_DIR = os.getenv("JOB_SPOOL_DIR", "./data/spool")
+# Seconds between polls of an idle worker
+POLL_INTERVAL = float(os.getenv("JOB_POLL_INTERVAL", "1.0"))
+# A running job whose heartbeat is older than this is assumed orphaned and requeued
+STALE_SECONDS = int(os.getenv("JOB_STALE_SECONDS", "1800"))
+# Seconds between heartbeats of a running job, well inside STALE_SECONDS
+HEARTBEAT_INTERVAL = min(60.0, STALE_SECONDS / 3)
+MAX_ATTEMPTS = 3
+# Minimum seconds between progress writes from one job
+PROGRESS_INTERVAL = 0.5
+
+ACTIVE = ("queued", "running")
+
+
+def _now():
+    return datetime.now(timezone.utc)
+
+
+# ---------------------------
+# Producer side
+# ---------------------------
+def spool_file(file_bytes, digest):
+    """Write an upload to the spool directory (once per digest); returns its path."""
+    os.makedirs(JOB_SPOOL_DIR, exist_ok=True)
+    path = os.path.join(JOB_SPOOL_DIR, digest)
+    if not os.path.exists(path):
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(file_bytes)
+        os.replace(tmp, path)
+    return path
+
+
+def enqueue(kind, payload, bind=None):
+    """Add a queued job; returns its id."""
+    if kind not in HANDLERS:
+        raise ValueError(f"Unknown job kind: {kind}")
+    with (bind or engine).begin() as conn:
+        return conn.execute(
+            Job.__table__.insert().values(kind=kind, status="queued", payload=payload,
+                                          progress=0.0, attempts=0, updated_at=_now())
+        ).inserted_primary_key[0]
+
+
+def find_active_job(kind, digest, bind=None):
+    """Id of a queued/running job of this kind for the same file digest, or None."""
+    with (bind or engine).connect() as conn:
+        return conn.execute(
+            select(Job.id)
+            .where(Job.kind == kind, Job.status.in_(ACTIVE),
+                   Job.payload["sha256"].as_string() == digest)
+            .order_by(Job.id.desc())
+            .limit(1)
+        ).scalar_one_or_none()
+
+
+def enqueue_report(filename, file_bytes, digest, bind=None):
+    """Spool a PDF and enqueue its parse/summarize/save job (reusing an active one)."""
+    existing = find_active_job("report", digest, bind=bind)
+    if existing is not None:
+        return existing
+    path = spool_file(file_bytes, digest)
+    return enqueue("report", {"filename": filename, "path": path, "sha256": digest}, bind=bind)
+
+
+def get_job(job_id, bind=None):
+    """The job as a dict, or None."""
+    with (bind or engine).connect() as conn:
+        row = conn.execute(select(Job.__table__).where(Job.id == job_id)).mappings().first()
+    return dict(row) if row else None
+
+
+def list_jobs(limit: int = 20, bind=None):
+    """Most recent jobs, newest first (payload/result included)."""
+    with (bind or engine).connect() as conn:
+        rows = conn.execute(
+            select(Job.__table__).order_by(Job.id.desc()).limit(limit)
+        ).mappings().all()
+    return [dict(r) for r in rows]
+
+
+# ---------------------------
+# Worker side
+# ---------------------------
+def requeue_stale(bind=None):
+    """Return orphaned running jobs (dead worker) to the queue; gives up after MAX_ATTEMPTS."""
+    cutoff = _now() - timedelta(seconds=STALE_SECONDS)
+    stale = and_(Job.status == "running", Job.updated_at < cutoff)
+    with (bind or engine).begin() as conn:
+        conn.execute(
+            update(Job).where(stale, Job.attempts >= MAX_ATTEMPTS)
+            .values(status="failed", error="worker lost too many times",
+                    finished_at=_now(), updated_at=_now())
+        )
+        return conn.execute(
+            update(Job).where(stale).values(status="queued", worker=None, updated_at=_now())
+        ).rowcount
+
+
+def claim(worker_id, bind=None):
+    """
+    Atomically move the oldest queued job to running for this worker and
+    return it as a dict (None when the queue is empty). The conditional
+    UPDATE makes concurrent claims safe without row locks, so it works the
+    same on SQLite and PostgreSQL.
+    """
+    bind = bind or engine
+    while True:
+        with bind.begin() as conn:
+            job_id = conn.execute(
+                select(Job.id).where(Job.status == "queued").order_by(Job.id).limit(1)
+            ).scalar_one_or_none()
+            if job_id is None:
+                return None
+            claimed = conn.execute(
+                update(Job).where(Job.id == job_id, Job.status == "queued")
+                .values(status="running", worker=worker_id, attempts=Job.attempts + 1,
+                        started_at=_now(), updated_at=_now(), message="started")
+            ).rowcount
+        if claimed:
+            return get_job(job_id, bind=bind)
+
+
+def _finish(job_id, bind=None, **values):
+    with (bind or engine).begin() as conn:
+        conn.execute(update(Job).where(Job.id == job_id)
+                     .values(finished_at=_now(), updated_at=_now(), **values))
+
+
+def make_progress(job_id, bind=None):
+    """progress(fraction, message=None) callback that writes at most every PROGRESS_INTERVAL s."""
+    last = [0.0]
+
+    def progress(fraction, message=None):
+        now = time.monotonic()
+        if fraction < 1.0 and now - last[0] < PROGRESS_INTERVAL:
+            return
+        last[0] = now
+        with (bind or engine).begin() as conn:
+            conn.execute(update(Job).where(Job.id == job_id)
+                         .values(progress=float(fraction), message=message, updated_at=_now()))
+    return progress
+
+
+def _heartbeat(job_id, stop_event, bind=None):
+    """Refresh the job's updated_at until stop_event is set, so long steps never look stale."""
+    while not stop_event.wait(HEARTBEAT_INTERVAL):
+        try:
+            with (bind or engine).begin() as conn:
+                conn.execute(update(Job).where(Job.id == job_id, Job.status == "running")
+                             .values(updated_at=_now()))
+        except Exception as e:
+            logger.warning(f"Heartbeat for job {job_id} failed: {e}")
+
+
+def _remove_spool(payload):
+    path = (payload or {}).get("path")
+    if path:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+def run_job(job, bind=None):
+    """
+    Run a claimed job's handler and record done/failed; returns the final
+    status. A dict result gains "timings": {operation: seconds} for the run.
+    A heartbeat thread keeps the job fresh while the handler runs, and the
+    payload's spooled file is removed once the job is done or failed.
+    """
+    handler = HANDLERS.get(job["kind"])
+    stop = threading.Event()
+    threading.Thread(target=_heartbeat, args=(job["id"], stop, bind),
+                     name=f"job-{job['id']}-heartbeat", daemon=True).start()
+    try:
+        if handler is None:
+            raise ValueError(f"Unknown job kind: {job['kind']}")
+        # Workers are separate processes, so the job's timings travel with its result
+        with capture() as timings, timed(f"job.{job['kind']}"):
+            result = handler(job["payload"] or {}, make_progress(job["id"], bind=bind))
+        if isinstance(result, dict):
+            result = {**result, "timings": {name: round(s, 4) for name, s in timings.items()}}
+    except Exception as e:
+        logger.exception(f"Job {job['id']} ({job['kind']}) failed: {e}")
+        stop.set()
+        _finish(job["id"], bind=bind, status="failed", error=str(e), message="failed")
+        _remove_spool(job["payload"])
+        return "failed"
+    stop.set()
+    _finish(job["id"], bind=bind, status="done", result=result, progress=1.0, message="done")
+    _remove_spool(job["payload"])
+    return "done"
+
+
+def worker_loop(worker_id=None, poll_interval: float = POLL_INTERVAL, stop_event=None, bind=None):
+    """Claim and run jobs until stop_event is set (forever by default)."""
+    worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+    logger.info(f"Job worker {worker_id} started")
+    while stop_event is None or not stop_event.is_set():
+        try:
+            requeue_stale(bind=bind)
+            job = claim(worker_id, bind=bind)
+        except Exception as e:
+            logger.exception(f"Job worker {worker_id} could not claim: {e}")
+            job = None
+        if job is None:
+            time.sleep(poll_interval)
+            continue
+        run_job(job, bind=bind)
+
+
+def _worker_main(worker_id, poll_interval):
+    # Fresh interpreter (spawn): make sure the tables exist before polling
+    Job.metadata.create_all(bind=engine, checkfirst=True)
+    logging.basicConfig(level=logging.INFO)
+    worker_loop(worker_id, poll_interval)
+
+
+def start_workers(count: int = JOB_WORKERS, poll_interval: float = POLL_INTERVAL, daemon: bool = True):
+    """Start `count` worker processes; returns the Process objects."""
+    ctx = multiprocessing.get_context("spawn")
+    processes = []
+    for i in range(count):
+        p = ctx.Process(target=_worker_main, args=(f"{socket.gethostname()}:w{i}", poll_interval),
+                        name=f"job-worker-{i}", daemon=daemon)
+        p.start()
+        processes.append(p)
+    return processes
+
+
+# ---------------------------
+# Handlers
+# ---------------------------
+def run_report_job(payload, progress):
+    """Parse a spooled PDF, summarize it and save Report + SourceFile."""
+    from app.reports import parse_pdf_cached, summarize_cached, save_report_to_db, save_sourcefile
+
+    digest, filename, path = payload["sha256"], payload["filename"], payload["path"]
+    with open(path, "rb") as f:
+        file_bytes = f.read()
+
+    # Parsing is ~80% of the bar, summarizing the rest. Daemonic workers
+    # cannot start their own process pool, so they parse in-process.
+    workers = 1 if multiprocessing.current_process().daemon else None
+    parsed = parse_pdf_cached(
+        file_bytes, digest, workers=workers,
+        progress=lambda done, total: progress(0.8 * done / total, f"Parsed {done}/{total} pages"),
+    )
+    progress(0.8, "Summarizing")
+    summary = summarize_cached(parsed["text"], digest, max_length=150)
+    progress(0.95, "Saving")
+    r = save_report_to_db(filename, parsed["text"], summary)
+    save_sourcefile(filename, "pdf", metadata={"sha256": digest, "report_id": r.id, "pages": parsed["pages"]})
+    return {"report_id": r.id, "pages": parsed["pages"]}
+
+
+HANDLERS = {
+    "report": run_report_job,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run background job workers")
+    parser.add_argument("--workers", type=int, default=max(JOB_WORKERS, 1))
+    parser.add_argument("--poll", type=float, default=POLL_INTERVAL)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    init_db()
+    if args.workers == 1:
+        worker_loop(poll_interval=args.poll)
+        return
+    processes = start_workers(args.workers, poll_interval=args.poll, daemon=False)
+    print(f"✅ {len(processes)} job workers running (Ctrl+C to stop)")
+    try:
+        for p in processes:
+            p.join()
+    except KeyboardInterrupt:
+        for p in processes:
+            p.terminate()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+# app/maps.py
+"""Folium maps for the Dashboard, built from one aggregated point per ticker."""
+import html
+
+import folium
+import pandas as pd
+from folium.plugins import FastMarkerCluster
+
+# Markers are created client-side from a compact [lat, lon, popup] array
+# instead of one serialized folium.Marker per point
+_MARKER_CALLBACK = """
+function (row) {
+    var marker = L.marker(new L.LatLng(row[0], row[1]));
+    marker.bindPopup(row[2]);
+    return marker;
+}
+"""
+
+
+def _popup(row):
+    text = f"<b>{html.escape(str(row.ticker))}</b>"
+    name = getattr(row, "name", None)
+    if isinstance(name, str) and name:
+        text += f" {html.escape(name)}"
+    text += f"<br>Close: {row.latest_close:,.2f}"
+    if pd.notna(row.change_1m):
+        text += f"<br>1M: {row.change_1m:+.1%}"
+    return text
+
+
+def ticker_map(points, zoom_start: int = 2):
+    """
+    Clustered map of `points` (queries.map_points() frame: ticker, lat, lon,
+    latest_close, change_1m and optionally name), zoomed to fit them.
+    """
+    m = folium.Map(location=[20, 0], zoom_start=zoom_start)
+    if points.empty:
+        return m
+    data = [[row.lat, row.lon, _popup(row)] for row in points.itertuples(index=False)]
+    FastMarkerCluster(data, callback=_MARKER_CALLBACK).add_to(m)
+    m.fit_bounds([[points["lat"].min(), points["lon"].min()],
+                  [points["lat"].max(), points["lon"].max()]], max_zoom=10)
+    return m
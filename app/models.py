@@ -1,5 +1,5 @@
 # app/models.py
-from sqlalchemy import Column, Integer, String, Text, DateTime, Float, JSON
+from sqlalchemy import Column, Integer, String, Text, DateTime, Float, JSON, Index, ForeignKey
 from sqlalchemy.sql import func
 from .db import Base
 
@@ -19,15 +19,91 @@ class Report(Base):
     summary = Column(Text)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
+class Ticker(Base):
+    """Per-symbol reference data; price rows point here instead of repeating it."""
+    __tablename__ = "tickers"
+    symbol = Column(String, primary_key=True)
+    name = Column(String)
+    exchange = Column(String)
+    lat = Column(Float)
+    lon = Column(Float)
+    currency = Column(String)
+
+
 class FinancialData(Base):
     __tablename__ = "financial_data"
+    __table_args__ = (
+        # One bar per ticker per timestamp; target of the ingestion upsert
+        Index("ux_financial_data_ticker_date", "ticker", "date", unique=True),
+        # Newest-first reads across tickers (Dashboard grid keyset pagination)
+        Index("ix_financial_data_date_ticker", "date", "ticker"),
+    )
     id = Column(Integer, primary_key=True, index=True)
-    ticker = Column(String, index=True)
+    ticker = Column(String, ForeignKey("tickers.symbol"), index=True)
     date = Column(DateTime)
     open = Column(Float)
     high = Column(Float)
     low = Column(Float)
     close = Column(Float)
     volume = Column(Float)
-    # 🆕 Add this field for map coordinates
-    location = Column(String, nullable=True)  # e.g. "37.77,-122.42"
+
+
+class TickerStats(Base):
+    """Per-ticker rollup of financial_data, refreshed by app.ingestion on every write."""
+    __tablename__ = "ticker_stats"
+    ticker = Column(String, primary_key=True)
+    first_date = Column(DateTime)
+    latest_date = Column(DateTime)
+    latest_close = Column(Float)
+    # Close of the first bar inside each trailing window (ending at latest_date)
+    first_close_1m = Column(Float)
+    first_close_3m = Column(Float)
+    first_close_1y = Column(Float)
+    min_close = Column(Float)
+    max_close = Column(Float)
+    volume_1m = Column(Float)
+    volume_total = Column(Float)
+    row_count = Column(Integer)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+
+class Job(Base):
+    """Background work item (see app.jobs); claimed and run by worker processes."""
+    __tablename__ = "jobs"
+    __table_args__ = (
+        Index("ix_jobs_status_id", "status", "id"),
+    )
+    id = Column(Integer, primary_key=True, index=True)
+    kind = Column(String, nullable=False)
+    # queued -> running -> done | failed
+    status = Column(String, nullable=False, default="queued")
+    payload = Column(JSON)
+    result = Column(JSON)
+    error = Column(Text)
+    progress = Column(Float, default=0.0)
+    message = Column(String)
+    attempts = Column(Integer, default=0)
+    worker = Column(String)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    started_at = Column(DateTime(timezone=True))
+    finished_at = Column(DateTime(timezone=True))
+    # Doubles as the worker heartbeat; stale running jobs are requeued
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+
+class NewsArticle(Base):
+    """News result persisted by app.services.news_api; one row per URL."""
+    __tablename__ = "news_articles"
+    id = Column(Integer, primary_key=True, index=True)
+    url = Column(String, nullable=False, unique=True)
+    query = Column(String, index=True)  # the search term, usually a ticker
+    title = Column(String)
+    description = Column(Text)
+    source = Column(String)
+    published_at = Column(DateTime)
+    fetched_at = Column(DateTime(timezone=True), server_default=func.now())
+    # Set by app.nlp.sentiment; content_hash covers title + description
+    content_hash = Column(String, index=True)
+    sentiment_score = Column(Float)  # -1 (negative) .. 1 (positive)
+    sentiment_label = Column(String)
+    sentiment_model = Column(String)
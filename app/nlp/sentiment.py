@@ -0,0 +1,194 @@
+# app/nlp/sentiment.py
+# Headline sentiment: tries a small transformer classifier first; falls back
+# to a built-in finance lexicon. Like the summarizer, the backend is loaded
+# on first use and shared process-wide.
+#
+# Scores are in [-1, 1] (positive minus negative) and cached by a hash of the
+# article's title and description, so re-fetched articles are never rescored.
+import hashlib
+import re
+import threading
+
+from app.cache import TTLCache
+
+MODEL_NAME = "mrm8488/distilroberta-finetuned-financial-news-sentiment-analysis"
+BATCH_SIZE = 32
+# Scores within +/- this band are labelled neutral
+NEUTRAL_BAND = 0.05
+
+_score_cache = TTLCache(ttl=24 * 3600, maxsize=50_000)
+
+_TOKEN = re.compile(r"[a-z']+")
+_NEGATIONS = {"not", "no", "never", "without", "isn't", "wasn't", "don't", "doesn't", "didn't", "won't"}
+
+# Small subset of the Loughran-McDonald finance word lists plus common
+# headline verbs; good enough to rank headlines when no model is available.
+POSITIVE_WORDS = {
+    "beat", "beats", "boost", "boosts", "bullish", "gain", "gains", "gained", "growth", "grow", "grows",
+    "high", "higher", "improve", "improved", "improves", "jump", "jumps", "jumped", "outperform",
+    "outperforms", "positive", "profit", "profitable", "profits", "rally", "rallies", "record", "rebound",
+    "rise", "rises", "rising", "rose", "soar", "soars", "soared", "strong", "stronger", "surge", "surges",
+    "surged", "upgrade", "upgraded", "upbeat", "win", "wins", "success", "successful", "expand",
+    "expands", "expansion", "exceed", "exceeds", "exceeded", "optimistic", "dividend", "buyback", "climb",
+    "climbs", "climbed", "top", "tops", "breakthrough", "approval", "approved",
+}
+NEGATIVE_WORDS = {
+    "bearish", "cut", "cuts", "decline", "declines", "declined", "default", "downgrade", "downgraded",
+    "drop", "drops", "dropped", "fall", "falls", "fell", "fraud", "investigation", "lawsuit", "loss",
+    "losses", "low", "lower", "miss", "misses", "missed", "negative", "plunge", "plunges", "plunged",
+    "recall", "recession", "risk", "risks", "selloff", "slump", "slumps", "slumped", "slowdown", "sink",
+    "sinks", "sank", "tumble", "tumbles", "tumbled", "weak", "weaker", "warning", "warns", "layoff",
+    "layoffs", "bankruptcy", "probe", "fine", "fined", "crash", "crashes", "concern", "concerns",
+    "downturn", "volatile", "volatility", "halt", "halted", "scandal", "delay", "delayed", "shortfall",
+}
+
+
+def label_for(score):
+    if score > NEUTRAL_BAND:
+        return "positive"
+    if score < -NEUTRAL_BAND:
+        return "negative"
+    return "neutral"
+
+
+class TransformerBackend:
+    name = "transformers"
+
+    def __init__(self, model=MODEL_NAME):
+        from transformers import pipeline
+        self.pipe = pipeline("text-classification", model=model, top_k=None)
+
+    def score_batch(self, texts, batch_size=BATCH_SIZE):
+        out = self.pipe(texts, batch_size=batch_size, truncation=True)
+        scores = []
+        for labels in out:
+            probs = {d["label"].lower(): d["score"] for d in labels}
+            scores.append(probs.get("positive", 0.0) - probs.get("negative", 0.0))
+        return scores
+
+
+class LexiconBackend:
+    name = "lexicon"
+
+    def score_batch(self, texts, batch_size=BATCH_SIZE):
+        scores = []
+        for text in texts:
+            pos = neg = 0
+            prev = None
+            for tok in _TOKEN.findall(text.lower()):
+                polarity = (tok in POSITIVE_WORDS) - (tok in NEGATIVE_WORDS)
+                if polarity and prev in _NEGATIONS:
+                    polarity = -polarity
+                pos += polarity > 0
+                neg += polarity < 0
+                prev = tok
+            scores.append((pos - neg) / (pos + neg) if pos + neg else 0.0)
+        return scores
+
+
+_backend = None
+_backend_lock = threading.Lock()
+
+
+def get_backend():
+    """The process-wide backend, loaded on first call."""
+    global _backend
+    if _backend is None:
+        with _backend_lock:
+            if _backend is None:
+                try:
+                    _backend = TransformerBackend()
+                except Exception:
+                    # fallback: built-in lexicon
+                    _backend = LexiconBackend()
+    return _backend
+
+
+def set_backend(backend):
+    """Swap the sentiment backend (e.g. the lexicon in benchmarks)."""
+    global _backend
+    _backend = backend
+
+
+def article_text(title, description=None):
+    return f"{title or ''}. {description or ''}".strip(" .")
+
+
+def article_hash(title, description=None):
+    """Stable hash of an article's normalized title + description."""
+    normalized = " ".join(article_text(title, description).lower().split())
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+def score_texts(texts, batch_size=BATCH_SIZE):
+    """Scores in [-1, 1] for texts, batch_size texts per backend call."""
+    backend = get_backend()
+    scores = []
+    for start in range(0, len(texts), batch_size):
+        scores.extend(backend.score_batch(texts[start:start + batch_size], batch_size=batch_size))
+    return scores
+
+
+def score_articles(articles, batch_size=BATCH_SIZE):
+    """
+    Add content_hash, sentiment_score, sentiment_label and sentiment_model to
+    each article dict (title/description keys), scoring only hashes not seen
+    before. Returns the same list.
+    """
+    backend = get_backend()
+    misses = {}
+    for a in articles:
+        a["content_hash"] = article_hash(a.get("title"), a.get("description"))
+        if _score_cache.get((backend.name, a["content_hash"])) is None:
+            misses.setdefault(a["content_hash"], article_text(a.get("title"), a.get("description")))
+    if misses:
+        hashes = list(misses)
+        for h, score in zip(hashes, score_texts([misses[h] for h in hashes], batch_size=batch_size)):
+            _score_cache.set((backend.name, h), float(score))
+    for a in articles:
+        score = _score_cache.get((backend.name, a["content_hash"]))
+        # A hash can only be missing if the cache evicted it mid-call
+        if score is None:
+            score = float(score_texts([article_text(a.get("title"), a.get("description"))])[0])
+        a["sentiment_score"] = score
+        a["sentiment_label"] = label_for(score)
+        a["sentiment_model"] = backend.name
+    return articles
+
+
+def score_pending(bind=None, batch_size=BATCH_SIZE, limit=None, page_size: int = 2000):
+    """
+    Score stored news_articles that have no sentiment yet (e.g. rows saved
+    before this module existed), page_size rows per read/update round trip.
+    Returns the number of rows scored.
+    """
+    from sqlalchemy import select, update, bindparam
+    from app.db import engine
+    from app.models import NewsArticle
+
+    bind = bind or engine
+    table = NewsArticle.__table__
+    stmt = (
+        update(table).where(table.c.id == bindparam("row_id"))
+        .values(content_hash=bindparam("content_hash"), sentiment_score=bindparam("sentiment_score"),
+                sentiment_label=bindparam("sentiment_label"), sentiment_model=bindparam("sentiment_model"))
+    )
+    done = 0
+    while limit is None or done < limit:
+        n = page_size if limit is None else min(page_size, limit - done)
+        with bind.connect() as conn:
+            rows = conn.execute(
+                select(table.c.id, table.c.title, table.c.description)
+                .where(table.c.sentiment_score.is_(None)).order_by(table.c.id).limit(n)
+            ).mappings().all()
+        if not rows:
+            break
+        articles = score_articles([dict(r) for r in rows], batch_size=batch_size)
+        with bind.begin() as conn:
+            conn.execute(stmt, [
+                {"row_id": a["id"], "content_hash": a["content_hash"], "sentiment_score": a["sentiment_score"],
+                 "sentiment_label": a["sentiment_label"], "sentiment_model": a["sentiment_model"]}
+                for a in articles
+            ])
+        done += len(rows)
+    return done
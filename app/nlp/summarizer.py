@@ -1,22 +1,177 @@
 # app/nlp/summarizer.py
-# Tries transformer-based summarizer first; falls back to LexRank (sumy)
-try:
-    from transformers import pipeline
-    _summ = pipeline("summarization", model="sshleifer/distilbart-cnn-12-6")
-    def summarize_text(text, max_length=150, min_length=30):
-        if not text or len(text.split()) < 30:
-            return text
-        out = _summ(text, max_length=max_length, min_length=min_length)
-        return out[0]["summary_text"]
-except Exception:
-    # fallback: LexRank via sumy
-    from sumy.parsers.plaintext import PlaintextParser
-    from sumy.nlp.tokenizers import Tokenizer
-    from sumy.summarizers.lex_rank import LexRankSummarizer
-    def summarize_text(text, sentences_count=3):
-        if not text:
-            return ""
-        parser = PlaintextParser.from_string(text, Tokenizer("english"))
+# Tries transformer-based summarizer first; falls back to LexRank (sumy).
+# The backend is loaded on first use and shared process-wide, so importing
+# this module stays cheap; warm_up() can preload it in a background thread.
+#
+# Long reports are split into token-bounded chunks so nothing is silently
+# truncated by the model. Chunks from every document in a call go through
+# the backend together in batches (map), then each document's chunk
+# summaries are summarized again until they fit in one chunk (reduce).
+import re
+import threading
+from collections import defaultdict
+from app.instrumentation import timed
+
+MODEL_NAME = "sshleifer/distilbart-cnn-12-6"
+# distilbart reads at most 1024 tokens; leave room for special tokens
+CHUNK_TOKENS = 900
+BATCH_SIZE = 8
+MAX_REDUCE_ROUNDS = 3
+# Texts shorter than this (in words) are returned unchanged
+MIN_WORDS = 30
+
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+
+
+class TransformerBackend:
+    name = "transformers"
+    chunk_tokens = CHUNK_TOKENS
+
+    def __init__(self, model=MODEL_NAME):
+        from transformers import pipeline
+        self.pipe = pipeline("summarization", model=model)
+
+    def count_tokens(self, text):
+        return len(self.pipe.tokenizer.encode(text, add_special_tokens=False))
+
+    def summarize_batch(self, chunks, max_length=150, min_length=30, sentences_count=3,
+                        batch_size=BATCH_SIZE):
+        shortest = min(self.count_tokens(c) for c in chunks)
+        min_length = max(1, min(min_length, shortest // 2))
+        max_length = max(min_length + 1, max_length)
+        out = self.pipe(chunks, max_length=max_length, min_length=min_length,
+                        batch_size=batch_size, truncation=True)
+        return [o["summary_text"] for o in out]
+
+
+class LexRankBackend:
+    name = "lexrank"
+    # LexRank is quadratic in sentences, so it benefits from chunking too
+    chunk_tokens = CHUNK_TOKENS
+
+    def count_tokens(self, text):
+        return len(text.split())
+
+    def summarize_batch(self, chunks, max_length=150, min_length=30, sentences_count=3,
+                        batch_size=BATCH_SIZE):
+        from sumy.parsers.plaintext import PlaintextParser
+        from sumy.nlp.tokenizers import Tokenizer
+        from sumy.summarizers.lex_rank import LexRankSummarizer
+
+        tokenizer = Tokenizer("english")
         summarizer = LexRankSummarizer()
-        summary = summarizer(parser.document, sentences_count)
-        return " ".join(str(sentence) for sentence in summary)
+        out = []
+        for chunk in chunks:
+            parser = PlaintextParser.from_string(chunk, tokenizer)
+            summary = summarizer(parser.document, sentences_count)
+            out.append(" ".join(str(sentence) for sentence in summary))
+        return out
+
+
+_backend = None
+_backend_lock = threading.Lock()
+
+
+def get_backend():
+    """The process-wide backend, loaded on first call."""
+    global _backend
+    if _backend is None:
+        with _backend_lock:
+            if _backend is None:
+                try:
+                    with timed("summarizer.load"):
+                        _backend = TransformerBackend()
+                except Exception:
+                    # fallback: LexRank via sumy
+                    _backend = LexRankBackend()
+    return _backend
+
+
+def warm_up(background: bool = True):
+    """Load the backend now, in a daemon thread unless background=False."""
+    if not background:
+        get_backend()
+        return None
+    thread = threading.Thread(target=get_backend, name="summarizer-warmup", daemon=True)
+    thread.start()
+    return thread
+
+
+def set_backend(backend):
+    """Swap the summarization backend (e.g. a stub in benchmarks)."""
+    global _backend
+    _backend = backend
+
+
+def chunk_text(text, max_tokens, count_tokens):
+    """
+    Greedily pack sentences into chunks of at most max_tokens. A sentence
+    longer than max_tokens is split on word boundaries.
+    """
+    chunks, current, size = [], [], 0
+    for sentence in _SENTENCE_END.split(text.strip()):
+        if not sentence:
+            continue
+        n = count_tokens(sentence)
+        if n > max_tokens:
+            words = sentence.split()
+            step = max(1, len(words) * max_tokens // n)
+            pieces = [" ".join(words[i:i + step]) for i in range(0, len(words), step)]
+        else:
+            pieces = [sentence]
+        for piece in pieces:
+            n = count_tokens(piece) if len(pieces) > 1 else n
+            if current and size + n > max_tokens:
+                chunks.append(" ".join(current))
+                current, size = [], 0
+            current.append(piece)
+            size += n
+    if current:
+        chunks.append(" ".join(current))
+    return chunks
+
+
+@timed("summarizer.summarize")
+def summarize_many(texts, max_length=150, min_length=30, sentences_count=3, batch_size=BATCH_SIZE):
+    """
+    Summarize a list of documents; returns summaries in the same order.
+    max_length/min_length apply to the transformer, sentences_count to LexRank.
+    """
+    backend = get_backend()
+    results = [None] * len(texts)
+    pending = {}
+    for i, text in enumerate(texts):
+        if not text or len(text.split()) < MIN_WORDS:
+            results[i] = text
+        else:
+            pending[i] = chunk_text(text, backend.chunk_tokens, backend.count_tokens)
+
+    for round_no in range(MAX_REDUCE_ROUNDS + 1):
+        if not pending:
+            break
+        flat = [(i, chunk) for i, chunks in pending.items() for chunk in chunks]
+        summaries = []
+        for start in range(0, len(flat), batch_size):
+            batch = [chunk for _, chunk in flat[start:start + batch_size]]
+            with timed(f"summarizer.batch.{backend.name}"):
+                summaries.extend(backend.summarize_batch(
+                    batch, max_length=max_length, min_length=min_length,
+                    sentences_count=sentences_count, batch_size=batch_size,
+                ))
+        parts = defaultdict(list)
+        for (i, _), summary in zip(flat, summaries):
+            parts[i].append(summary)
+
+        pending = {}
+        for i, doc_parts in parts.items():
+            joined = " ".join(doc_parts)
+            if len(doc_parts) == 1 or round_no == MAX_REDUCE_ROUNDS:
+                results[i] = joined
+            else:
+                pending[i] = chunk_text(joined, backend.chunk_tokens, backend.count_tokens)
+    return results
+
+
+def summarize_text(text, max_length=150, min_length=30, sentences_count=3):
+    return summarize_many([text], max_length=max_length, min_length=min_length,
+                          sentences_count=sentences_count)[0]
@@ -0,0 +1,126 @@
+# app/price_store.py
+"""
+Optional columnar copy of financial_data as Parquet, partitioned by
+ticker/year (hive layout: <root>/ticker=AAPL/year=2024/part-0.parquet).
+
+Enabled by setting PRICE_STORE_DIR and having pyarrow installed. The
+ingestion path writes every upserted frame here as well as to SQL, and
+app.queries.load_prices reads from here when it is enabled. Reads push the
+ticker/year/date predicates down to partition and row-group pruning, project
+only the requested columns, and memory-map the files.
+
+Enabling it on an existing database needs a one-off backfill:
+migrate_build_price_store.py.
+"""
+import importlib.util
+import os
+import threading
+from urllib.parse import quote
+
+import pandas as pd
+
+# pyarrow is optional and only imported when the store is actually used
+HAVE_PYARROW = importlib.util.find_spec("pyarrow") is not None
+
+PRICE_STORE_DIR = os.getenv("PRICE_STORE_DIR")
+VALUE_COLUMNS = ["date", "open", "high", "low", "close", "volume"]
+
+_write_lock = threading.Lock()
+
+
+def end_bound(end):
+    """
+    (timestamp, inclusive) upper bound for a date-range filter: a bare date
+    includes that whole day (< next midnight), anything else is <= end.
+    Shared with app.queries so both stores return the same rows.
+    """
+    end = pd.Timestamp(end)
+    if end == end.normalize():
+        return end + pd.Timedelta(days=1), False
+    return end, True
+
+
+def enabled(root=None):
+    return HAVE_PYARROW and bool(root or PRICE_STORE_DIR)
+
+
+def _partition_dir(root, ticker, year):
+    return os.path.join(root, f"ticker={quote(str(ticker), safe='')}", f"year={int(year)}")
+
+
+def _write_partition(path, part):
+    """
+    Merge `part` into one partition file (new bars win), written atomically.
+    Value columns missing from `part` keep their stored values.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    os.makedirs(path, exist_ok=True)
+    target = os.path.join(path, "part-0.parquet")
+    if os.path.exists(target):
+        existing = pq.read_table(target).to_pandas()
+        missing = [c for c in VALUE_COLUMNS if c not in part.columns]
+        if missing:
+            part = part.merge(existing[["date"] + missing], on="date", how="left")
+        part = pd.concat([existing, part], ignore_index=True)
+        part = part.drop_duplicates(subset="date", keep="last")
+    part = part.reindex(columns=VALUE_COLUMNS).sort_values("date").reset_index(drop=True)
+    tmp = target + ".tmp"
+    pq.write_table(pa.Table.from_pandas(part, preserve_index=False), tmp)
+    os.replace(tmp, target)
+
+
+def write_frame(frame, root=None):
+    """Upsert a normalize_ohlcv() frame into the store; returns partitions written."""
+    root = root or PRICE_STORE_DIR
+    if not enabled(root) or frame is None or frame.empty:
+        return 0
+    # All-NaN columns were missing from the source frame; keep the stored values
+    values = ["date"] + [c for c in VALUE_COLUMNS[1:] if frame[c].notna().any()]
+    frame = frame.assign(year=frame["date"].dt.year)
+    written = 0
+    with _write_lock:
+        for (ticker, year), part in frame.groupby(["ticker", "year"], sort=False):
+            part = part[values].astype({c: "float64" for c in values[1:]})
+            part["date"] = part["date"].astype("datetime64[us]")
+            _write_partition(_partition_dir(root, ticker, year), part)
+            written += 1
+    return written
+
+
+def load(tickers=None, start=None, end=None, columns=None, root=None):
+    """
+    Long frame (ticker, date, <columns>) for the given tickers and date range,
+    or None when the store is disabled or empty.
+    """
+    root = root or PRICE_STORE_DIR
+    if not enabled(root) or not os.path.isdir(root):
+        return None
+    import pyarrow.dataset as ds
+    from pyarrow import fs as pafs
+
+    dataset = ds.dataset(
+        root, format="parquet", partitioning="hive",
+        filesystem=pafs.LocalFileSystem(use_mmap=True),
+    )
+    if not dataset.files:
+        return None
+
+    expr = None
+    def _and(e):
+        return e if expr is None else expr & e
+    if tickers:
+        expr = _and(ds.field("ticker").isin(list(tickers)))
+    if start is not None:
+        start = pd.Timestamp(start)
+        expr = _and((ds.field("year") >= start.year) & (ds.field("date") >= start.to_datetime64()))
+    if end is not None:
+        bound, inclusive = end_bound(end)
+        last = ds.field("date") <= bound.to_datetime64() if inclusive else ds.field("date") < bound.to_datetime64()
+        expr = _and((ds.field("year") <= bound.year) & last)
+
+    wanted = ["ticker", "date"] + [c for c in (columns or VALUE_COLUMNS) if c not in ("ticker", "date")]
+    table = dataset.to_table(columns=wanted, filter=expr)
+    df = table.to_pandas(split_blocks=True, self_destruct=True)
+    return df.sort_values(["ticker", "date"], ignore_index=True)
@@ -0,0 +1,201 @@
+# app/queries.py
+"""
+Read-side data access for the Streamlit tabs.
+
+Queries select only the columns a view needs straight into DataFrames and
+are cached for QUERY_CACHE_TTL seconds. Writers call invalidate() after
+committing, so a widget interaction reuses the cached frames and a write
+made in this process is visible on the next rerun. Writes from other
+processes show up once the TTL expires.
+
+Cached frames are shared between callers: treat them as read-only.
+"""
+import os
+import pandas as pd
+from sqlalchemy import select, func, case, tuple_
+from app import price_store
+from app.cache import TTLCache, cached
+from app.db import engine
+from app.models import FinancialData, NewsArticle, Report, Ticker, TickerStats
+
+QUERY_CACHE_TTL = float(os.getenv("QUERY_CACHE_TTL", "300"))
+_cache = TTLCache(ttl=QUERY_CACHE_TTL, maxsize=128)
+
+PRICE_COLUMNS = ("date", "ticker", "open", "high", "low", "close", "volume")
+
+
+def invalidate():
+    """Drop every cached query result; call after committing a write."""
+    _cache.clear()
+
+
+@cached(_cache)
+def dashboard_counts():
+    with engine.connect() as conn:
+        reports = conn.execute(select(func.count()).select_from(Report)).scalar()
+        tickers = conn.execute(select(func.count()).select_from(TickerStats)).scalar()
+    return {"reports": reports, "tickers": tickers}
+
+
+@cached(_cache)
+def ticker_stats():
+    """One row per ticker from the ticker_stats rollup."""
+    return pd.read_sql(select(TickerStats.__table__), engine)
+
+
+@cached(_cache)
+def latest_prices(limit: int = 300, columns=PRICE_COLUMNS):
+    """Most recent `limit` bars across all tickers, newest first."""
+    table = FinancialData.__table__
+    stmt = (
+        select(*[table.c[c] for c in columns])
+        .order_by(table.c.date.desc())
+        .limit(limit)
+    )
+    return pd.read_sql(stmt, engine)
+
+
+@cached(_cache)
+def recent_reports(limit: int = 5):
+    stmt = (
+        select(Report.id, Report.title, Report.created_at, Report.summary)
+        .order_by(Report.created_at.desc())
+        .limit(limit)
+    )
+    return pd.read_sql(stmt, engine)
+
+
+def _date_range(stmt, column, start, end):
+    """Filter column to [start, end]; a bare date as end includes that whole day."""
+    if start is not None:
+        stmt = stmt.where(column >= pd.Timestamp(start).to_pydatetime())
+    if end is not None:
+        bound, inclusive = price_store.end_bound(end)
+        bound = bound.to_pydatetime()
+        stmt = stmt.where(column <= bound if inclusive else column < bound)
+    return stmt
+
+
+def load_prices(tickers=None, start=None, end=None, columns=("open", "high", "low", "close", "volume"), bind=None):
+    """
+    Long (ticker, date, <columns>) history for analytics. Reads the Parquet
+    price store when it is enabled, otherwise financial_data. Not cached:
+    results can be large and callers usually reshape them right away.
+    """
+    df = price_store.load(tickers=tickers, start=start, end=end, columns=columns)
+    if df is not None:
+        return df
+    table = FinancialData.__table__
+    stmt = select(table.c.ticker, table.c.date, *[table.c[c] for c in columns])
+    if tickers:
+        stmt = stmt.where(table.c.ticker.in_(list(tickers)))
+    stmt = _date_range(stmt, table.c.date, start, end)
+    return pd.read_sql(stmt.order_by(table.c.ticker, table.c.date), bind or engine)
+
+
+@cached(_cache)
+def price_page(tickers=None, start=None, end=None, cursor=None, limit: int = 100,
+               columns=PRICE_COLUMNS, bind=None):
+    """
+    One page of bars, newest first, for the given tickers (tuple) and date
+    range. Keyset pagination on (date, ticker): pass the returned cursor to
+    get the next page, which costs the same however deep it is. Returns
+    (frame, next_cursor); next_cursor is None on the last page.
+    """
+    table = FinancialData.__table__
+    wanted = list(dict.fromkeys(("date", "ticker") + tuple(columns)))
+    stmt = select(*[table.c[c] for c in wanted])
+    if tickers:
+        stmt = stmt.where(table.c.ticker.in_(list(tickers)))
+    stmt = _date_range(stmt, table.c.date, start, end)
+    if cursor is not None:
+        stmt = stmt.where(tuple_(table.c.date, table.c.ticker) < tuple_(cursor[0], cursor[1]))
+    stmt = stmt.order_by(table.c.date.desc(), table.c.ticker.desc()).limit(limit + 1)
+    df = pd.read_sql(stmt, bind or engine)
+    if len(df) <= limit:
+        return df[list(columns)], None
+    df = df.iloc[:limit]
+    last = df.iloc[-1]
+    return df[list(columns)], (pd.Timestamp(last["date"]).to_pydatetime(), last["ticker"])
+
+
+@cached(_cache)
+def chart_prices(tickers=None, start=None, end=None, points: int = 500, bind=None):
+    """
+    (ticker, date, close) per ticker in the range, downsampled with LTTB to
+    at most `points` rows per ticker, so a chart's size is bounded by
+    tickers x points rather than by history length.
+    """
+    from app.analytics.downsample import downsample
+
+    df = load_prices(tickers=tickers, start=start, end=end, columns=("close",), bind=bind)
+    return downsample(df, points=points)
+
+
+@cached(_cache)
+def volume_by_ticker(tickers=None, start=None, end=None, bind=None):
+    """Total traded volume per ticker in the date range, aggregated in SQL."""
+    table = FinancialData.__table__
+    stmt = select(table.c.ticker, func.sum(table.c.volume).label("volume")).group_by(table.c.ticker)
+    if tickers:
+        stmt = stmt.where(table.c.ticker.in_(list(tickers)))
+    stmt = _date_range(stmt, table.c.date, start, end)
+    return pd.read_sql(stmt.order_by(table.c.ticker), bind or engine)
+
+
+def daily_sentiment(tickers=None, start=None, end=None):
+    """
+    Per-ticker daily news sentiment: (ticker, date, sentiment, articles,
+    positive, negative), with date at midnight so it joins directly with
+    load_prices()/financial_data daily bars on (ticker, date). Articles
+    without a publish time count on the day they were fetched.
+    """
+    table = NewsArticle.__table__
+    day = func.date(func.coalesce(table.c.published_at, table.c.fetched_at))
+    stmt = (
+        select(
+            table.c.query.label("ticker"),
+            day.label("date"),
+            func.avg(table.c.sentiment_score).label("sentiment"),
+            func.count().label("articles"),
+            func.sum(case((table.c.sentiment_label == "positive", 1), else_=0)).label("positive"),
+            func.sum(case((table.c.sentiment_label == "negative", 1), else_=0)).label("negative"),
+        )
+        .where(table.c.sentiment_score.is_not(None))
+        .group_by(table.c.query, day)
+        .order_by(table.c.query, day)
+    )
+    if tickers:
+        stmt = stmt.where(table.c.query.in_(list(tickers)))
+    df = pd.read_sql(stmt, engine)
+    df["date"] = pd.to_datetime(df["date"])
+    if start is not None:
+        df = df[df["date"] >= pd.Timestamp(start)]
+    if end is not None:
+        df = df[df["date"] <= pd.Timestamp(end)]
+    return df.reset_index(drop=True)
+
+
+@cached(_cache)
+def map_points():
+    """
+    One row per ticker with coordinates, for the Dashboard map: ticker,
+    name, lat, lon, latest_close, change_1m (fraction) and latest_date.
+    """
+    stmt = (
+        select(
+            TickerStats.ticker, Ticker.name, Ticker.lat, Ticker.lon,
+            TickerStats.latest_close, TickerStats.first_close_1m, TickerStats.latest_date,
+        )
+        .join(Ticker, Ticker.symbol == TickerStats.ticker)
+        .where(Ticker.lat.is_not(None), Ticker.lon.is_not(None))
+    )
+    df = pd.read_sql(stmt, engine)
+    df["change_1m"] = df["latest_close"] / df["first_close_1m"] - 1
+    return df.drop(columns="first_close_1m")
+
+
+@cached(_cache)
+def ticker_info():
+    """The tickers reference table (symbol, name, exchange, lat, lon, currency)."""
+    return pd.read_sql(select(Ticker.__table__).order_by(Ticker.symbol), engine)
@@ -0,0 +1,66 @@
+# app/reports.py
+"""
+Report and source-file persistence, plus content-addressed caching of the
+expensive steps (parsing and summarizing) keyed by the file's SHA-256.
+"""
+from sqlalchemy import select
+from app.cache import file_sha256, get_content_cache
+from app.db import session_scope
+from app.models import SourceFile, Report
+from app import queries
+
+
+def save_report_to_db(title, content, summary):
+    with session_scope() as db:
+        r = Report(title=title, content=content, summary=summary)
+        db.add(r)
+        db.flush()
+        db.refresh(r)
+    queries.invalidate()
+    return r
+
+
+def save_sourcefile(filename, filetype, metadata=None):
+    with session_scope() as db:
+        s = SourceFile(filename=filename, file_type=filetype, file_metadata=metadata)
+        db.add(s)
+        db.flush()
+        db.refresh(s)
+    queries.invalidate()
+    return s
+
+
+def find_sourcefile_by_hash(digest):
+    """Most recent SourceFile whose metadata records this sha256, or None."""
+    with session_scope() as db:
+        return db.execute(
+            select(SourceFile)
+            .where(SourceFile.file_metadata["sha256"].as_string() == digest)
+            .order_by(SourceFile.id.desc())
+            .limit(1)
+        ).scalar_one_or_none()
+
+
+def get_report(report_id):
+    with session_scope() as db:
+        return db.get(Report, report_id)
+
+
+def parse_pdf_cached(file_bytes, digest=None, max_pages=None, progress=None, workers=None):
+    """parse_pdf through the content cache; a hit skips parsing entirely."""
+    from app.data_parsing.pdf_parser import parse_pdf
+
+    digest = digest or file_sha256(file_bytes)
+    key = f"{digest}:pdf:{max_pages or 'all'}"
+    return get_content_cache().get_or_compute(
+        key, lambda: parse_pdf(file_bytes, max_pages=max_pages, progress=progress, workers=workers)
+    )
+
+
+def summarize_cached(text, digest, max_length=150):
+    """summarize_text through the content cache, keyed by the source file's hash."""
+    from app.nlp.summarizer import summarize_text
+
+    return get_content_cache().get_or_compute(
+        f"{digest}:summary:{max_length}", lambda: summarize_text(text, max_length=max_length)
+    )
@@ -0,0 +1,161 @@
+# app/search.py
+"""
+Full-text search over reports (title, summary and content).
+
+SQLite uses an FTS5 external-content table (reports_fts) kept in sync by
+triggers on `reports`, so every insert/update/delete, including
+save_report_to_db, is indexed in the same transaction. PostgreSQL uses a
+GIN index on a tsvector expression, which the planner uses for the same
+expression in search_reports. Other databases fall back to a LIKE scan.
+"""
+import html
+import re
+
+from sqlalchemy import text
+from app.db import engine
+
+# Snippet markers: control characters that can't occur in extracted text,
+# swapped for <mark> after the snippet has been HTML-escaped
+_START, _STOP = "\x02", "\x03"
+SNIPPET_WORDS = 16
+
+_WORD = re.compile(r"\w+", re.UNICODE)
+
+_SQLITE_DDL = [
+    """CREATE VIRTUAL TABLE IF NOT EXISTS reports_fts USING fts5(
+        title, summary, content, content='reports', content_rowid='id',
+        tokenize='porter unicode61'
+    )""",
+    """CREATE TRIGGER IF NOT EXISTS reports_fts_ai AFTER INSERT ON reports BEGIN
+        INSERT INTO reports_fts(rowid, title, summary, content)
+        VALUES (new.id, new.title, new.summary, new.content);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS reports_fts_ad AFTER DELETE ON reports BEGIN
+        INSERT INTO reports_fts(reports_fts, rowid, title, summary, content)
+        VALUES ('delete', old.id, old.title, old.summary, old.content);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS reports_fts_au AFTER UPDATE ON reports BEGIN
+        INSERT INTO reports_fts(reports_fts, rowid, title, summary, content)
+        VALUES ('delete', old.id, old.title, old.summary, old.content);
+        INSERT INTO reports_fts(rowid, title, summary, content)
+        VALUES (new.id, new.title, new.summary, new.content);
+    END""",
+]
+
+# Title matches count most, then the summary, then the body
+_PG_DOCUMENT = (
+    "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(summary, '')), 'B') || "
+    "setweight(to_tsvector('english', coalesce(content, '')), 'C')"
+)
+
+
+def ensure_search_index(bind=None):
+    """Create the search index for the current dialect if missing (backfilling it once)."""
+    bind = bind or engine
+    name = bind.dialect.name
+    with bind.begin() as conn:
+        if name == "sqlite":
+            exists = conn.execute(text(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'reports_fts'"
+            )).first()
+            for ddl in _SQLITE_DDL:
+                conn.execute(text(ddl))
+            if not exists:
+                conn.execute(text("INSERT INTO reports_fts(reports_fts) VALUES ('rebuild')"))
+        elif name == "postgresql":
+            conn.execute(text(f"CREATE INDEX IF NOT EXISTS ix_reports_fts ON reports USING GIN (({_PG_DOCUMENT}))"))
+
+
+def fts5_query(query):
+    """
+    Turn free text into a safe FTS5 query: every word must match (quoted, so
+    operators and punctuation are literal) and the last one is a prefix.
+    """
+    words = _WORD.findall(query or "")
+    if not words:
+        return None
+    terms = [f'"{w}"' for w in words]
+    terms[-1] += "*"
+    return " ".join(terms)
+
+
+def render_snippet(snippet):
+    """HTML-escaped snippet with the matched terms wrapped in <mark>."""
+    return (html.escape(snippet or "")
+            .replace(_START, "<mark>").replace(_STOP, "</mark>"))
+
+
+def _search_sqlite(conn, query, limit, offset):
+    match = fts5_query(query)
+    if match is None:
+        return 0, []
+    total = conn.execute(
+        text("SELECT count(*) FROM reports_fts WHERE reports_fts MATCH :q"), {"q": match}
+    ).scalar()
+    rows = conn.execute(text(f"""
+        SELECT r.id, r.title, r.created_at,
+               snippet(reports_fts, -1, :start, :stop, '…', {SNIPPET_WORDS}) AS snippet,
+               bm25(reports_fts, 10.0, 4.0, 1.0) AS rank
+        FROM reports_fts JOIN reports r ON r.id = reports_fts.rowid
+        WHERE reports_fts MATCH :q
+        ORDER BY rank
+        LIMIT :limit OFFSET :offset
+    """), {"q": match, "start": _START, "stop": _STOP, "limit": limit, "offset": offset}).mappings().all()
+    return total, rows
+
+
+def _search_postgres(conn, query, limit, offset):
+    params = {"q": query, "limit": limit, "offset": offset,
+              "opts": f"StartSel={_START}, StopSel={_STOP}, MaxWords={SNIPPET_WORDS}, MinWords=6"}
+    total = conn.execute(text(f"""
+        SELECT count(*) FROM reports
+        WHERE ({_PG_DOCUMENT}) @@ websearch_to_tsquery('english', :q)
+    """), params).scalar()
+    # Headlines are computed only for the page of results, not every match
+    rows = conn.execute(text(f"""
+        SELECT page.id, page.title, page.created_at, page.rank,
+               ts_headline('english', coalesce(page.summary, '') || ' ' || coalesce(page.content, ''),
+                           websearch_to_tsquery('english', :q), :opts) AS snippet
+        FROM (
+            SELECT id, title, created_at, summary, content,
+                   ts_rank_cd({_PG_DOCUMENT}, websearch_to_tsquery('english', :q)) AS rank
+            FROM reports
+            WHERE ({_PG_DOCUMENT}) @@ websearch_to_tsquery('english', :q)
+            ORDER BY rank DESC
+            LIMIT :limit OFFSET :offset
+        ) page
+        ORDER BY page.rank DESC
+    """), params).mappings().all()
+    return total, rows
+
+
+def _search_like(conn, query, limit, offset):
+    words = _WORD.findall(query or "")
+    if not words:
+        return 0, []
+    clauses = " AND ".join(
+        f"(title LIKE :w{i} OR summary LIKE :w{i} OR content LIKE :w{i})" for i in range(len(words))
+    )
+    params = {f"w{i}": f"%{w}%" for i, w in enumerate(words)}
+    total = conn.execute(text(f"SELECT count(*) FROM reports WHERE {clauses}"), params).scalar()
+    rows = conn.execute(text(f"""
+        SELECT id, title, created_at, summary AS snippet, 0 AS rank FROM reports
+        WHERE {clauses} ORDER BY created_at DESC LIMIT :limit OFFSET :offset
+    """), {**params, "limit": limit, "offset": offset}).mappings().all()
+    return total, rows
+
+
+def search_reports(query, limit: int = 20, offset: int = 0, bind=None):
+    """
+    Reports matching query, best first. Returns {"total": number of
+    matches, "results": [{"id", "title", "created_at", "snippet", "rank"}]}
+    for the page [offset, offset + limit); snippets are HTML with matches
+    in <mark>.
+    """
+    bind = bind or engine
+    search = {"sqlite": _search_sqlite, "postgresql": _search_postgres}.get(bind.dialect.name, _search_like)
+    with bind.connect() as conn:
+        total, rows = search(conn, query, limit, offset)
+    results = [{**row, "snippet": render_snippet(row["snippet"])} for row in rows]
+    return {"total": total, "results": results}
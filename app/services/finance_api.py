@@ -1,38 +1,69 @@
-company_locations = {
-    "AAPL": {"lat": 37.3349, "lon": -122.0090},   # Apple Park, Cupertino
-    "MSFT": {"lat": 47.6426, "lon": -122.1396},   # Microsoft HQ, Redmond
-    "GOOGL": {"lat": 37.4220, "lon": -122.0841},  # Googleplex, Mountain View
-    "AMZN": {"lat": 47.6225, "lon": -122.3365},   # Amazon, Seattle
-    "TSLA": {"lat": 37.3947, "lon": -122.1503},   # Tesla, Palo Alto
-    "META": {"lat": 37.4845, "lon": -122.1477},   # Meta, Menlo Park
-}
-
+from app import queries
 from app.models import FinancialData
+from app.tickers import ensure_tickers
+from app.ticker_stats import refresh_ticker_stats
 from datetime import datetime
 
 def save_financial_data(session, ticker, price, volume, pe_ratio):
-    location = company_locations.get(
-        ticker, {"lat": 37.7749, "lon": -122.4194}  # Default: San Francisco
-    )
-    loc_str = f"{location['lat']},{location['lon']}"
+    # Coordinates and company details live in the tickers table (app/tickers.py)
+    ensure_tickers(session.connection(), [ticker])
     data = FinancialData(
         ticker=ticker,
         close=price,
         volume=volume,
         # If you have a pe_ratio field, add it here
         date=datetime.utcnow(),
-        location=loc_str
     )
     session.add(data)
+    session.flush()
+    # The Dashboard reads the ticker_stats rollup, not the raw rows
+    refresh_ticker_stats(session.connection(), [ticker])
     session.commit()
+    queries.invalidate()
     return data
 import yfinance as yf
+from yfinance import shared as yf_shared
 import pandas as pd
+from sqlalchemy import select, func
+from app.db import engine
+from app.ingestion import normalize_ohlcv
+from app.instrumentation import timed
+
+
+def latest_stored_date(ticker: str, bind=None):
+    """Most recent FinancialData.date stored for ticker, or None."""
+    with (bind or engine).connect() as conn:
+        return conn.execute(
+            select(func.max(FinancialData.date)).where(FinancialData.ticker == ticker)
+        ).scalar()
+
+
+def fetch_yfinance_history(ticker: str, period: str = "1y", start=None, end=None,
+                           incremental: bool = False, provider=None, bind=None):
+    """
+    Download daily bars for ticker, by `period` or by explicit start/end.
+
+    With incremental=True only the gap since the latest stored bar is
+    requested; the last stored day is included again so a bar fetched
+    mid-session gets its final values on the next upsert. Tickers with no
+    stored history fall back to `period`.
 
-def fetch_yfinance_history(ticker: str, period: str = "1y"):
+    provider is any callable with yf.download's signature (default yf.download),
+    so refreshes can run against a local stub.
+    """
+    provider = provider or yf.download
+    if incremental and start is None:
+        last = latest_stored_date(ticker, bind=bind)
+        if last is not None:
+            start = pd.Timestamp(last).date()
     try:
-        df = yf.download(ticker, period=period, interval="1d")
-        if df.empty:
+        # Timed inside the try so a failed download counts as an error of this operation
+        with timed("yfinance.history"):
+            if start is not None:
+                df = provider(ticker, start=start, end=end, interval="1d")
+            else:
+                df = provider(ticker, period=period, interval="1d")
+        if df is None or df.empty:
             return None
         df.reset_index(inplace=True)
         df.rename(
@@ -42,3 +73,57 @@ def fetch_yfinance_history(ticker: str, period: str = "1y"):
         return df
     except Exception as e:
         return None
+
+
+def _split_batch(df, tickers):
+    """Split a yf.download(group_by="ticker") frame into {ticker: frame}."""
+    if df is None or df.empty:
+        return {}
+    if not isinstance(df.columns, pd.MultiIndex):
+        return {tickers[0]: df} if len(tickers) == 1 else {}
+    available = set(df.columns.get_level_values(0))
+    frames = {}
+    for t in tickers:
+        if t in available:
+            sub = df[t].dropna(how="all")
+            if not sub.empty:
+                frames[t] = sub
+    return frames
+
+
+def fetch_many(tickers, period: str = "1y", start=None, end=None,
+               chunk_size: int = 20, max_workers: int = 8, provider=None):
+    """
+    Download many tickers in batched yf.download calls.
+
+    Tickers are requested chunk_size at a time; within a batch yfinance fans
+    out over max_workers threads. Batches run one after another because
+    yf.download keeps per-call results in module-level state that concurrent
+    calls would clobber.
+
+    Returns (frames, failures): frames maps ticker -> normalize_ohlcv() frame,
+    failures maps ticker -> reason. One bad symbol or batch never fails the rest.
+    """
+    provider = provider or yf.download
+    tickers = list(dict.fromkeys(t for t in tickers if t))
+    window = {"start": start, "end": end} if start is not None else {"period": period}
+    frames, failures = {}, {}
+
+    for i in range(0, len(tickers), chunk_size):
+        chunk = tickers[i:i + chunk_size]
+        try:
+            with timed("yfinance.download"):
+                df = provider(chunk, interval="1d", group_by="ticker", threads=max_workers,
+                              progress=False, **window)
+        except Exception as e:
+            failures.update({t: str(e) for t in chunk})
+            continue
+        errors = dict(getattr(yf_shared, "_ERRORS", {})) if provider is yf.download else {}
+        for t, raw in _split_batch(df, chunk).items():
+            frame = normalize_ohlcv(raw, ticker=t)
+            if not frame.empty:
+                frames[t] = frame
+        for t in chunk:
+            if t not in frames:
+                failures[t] = errors.get(t, "No data returned")
+    return frames, failures
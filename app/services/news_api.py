@@ -1,21 +1,155 @@
 # app/services/news_api.py
-from GoogleNews import GoogleNews
+"""
+Google News search with a per-(query, page_size) TTL cache, concurrent
+multi-query fetching, batch sentiment scoring (app.nlp.sentiment) and
+URL-deduplicated persistence to news_articles.
+"""
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 
-def fetch_news(query: str, page_size: int = 5):
-    googlenews = GoogleNews(lang='en')
+from sqlalchemy import select
+from app.cache import TTLCache
+from app.instrumentation import incr, timed
+from app.db import engine, dialect_insert
+from app.models import NewsArticle
+
+logger = logging.getLogger("app.services.news_api")
+
+NEWS_CACHE_TTL = float(os.getenv("NEWS_CACHE_TTL", "900"))
+NEWS_CACHE_SIZE = int(os.getenv("NEWS_CACHE_SIZE", "256"))
+_cache = TTLCache(ttl=NEWS_CACHE_TTL, maxsize=NEWS_CACHE_SIZE)
+
+
+def google_news_client():
+    from GoogleNews import GoogleNews
+    return GoogleNews(lang='en')
+
+
+def invalidate():
+    _cache.clear()
+
+
+SENTIMENT_FIELDS = ("content_hash", "sentiment_score", "sentiment_label", "sentiment_model")
+
+
+def _to_article(item):
+    published = item.get("datetime")
+    return {
+        "title": item.get("title"),
+        "description": item.get("desc"),
+        "url": item.get("link"),
+        "source": item.get("media"),
+        "publishedAt": item.get("date") or "",
+        "published_at": published if isinstance(published, datetime) else None,
+    }
+
+
+def save_articles(query, articles, bind=None):
+    """Insert articles not stored yet (deduplicated by URL); returns rows inserted."""
+    rows = [
+        {"url": a["url"], "query": query, "title": a["title"], "description": a["description"],
+         "source": a["source"], "published_at": a["published_at"],
+         **{col: a.get(col) for col in SENTIMENT_FIELDS}}
+        for a in articles if a.get("url")
+    ]
+    rows = list({r["url"]: r for r in rows}.values())
+    if not rows:
+        return 0
+    bind = bind or engine
+    table = NewsArticle.__table__
+    stmt = dialect_insert(table, bind=bind)
+    with bind.begin() as conn:
+        if stmt is not None:
+            return conn.execute(stmt.on_conflict_do_nothing(index_elements=["url"]), rows).rowcount
+        known = set(conn.execute(
+            select(table.c.url).where(table.c.url.in_([r["url"] for r in rows]))
+        ).scalars())
+        fresh = [r for r in rows if r["url"] not in known]
+        if fresh:
+            conn.execute(table.insert(), fresh)
+        return len(fresh)
+
+
+@timed("news.search")
+def _search(query, page_size, client_factory=None):
+    googlenews = (client_factory or google_news_client)()
     googlenews.search(query)
-    results = googlenews.result()
-    
-    articles = []
-    for item in results[:page_size]:
-        articles.append({
-            "title": item.get("title"),
-            "description": item.get("desc"),
-            "url": item.get("link"),
-            "source": item.get("media")
-        })
-    
-    if not articles:
-        return {"error": "No news found for this query."}
-    
-    return {"articles": articles}
+    return [_to_article(item) for item in googlenews.result()[:page_size]]
+
+
+def _score(articles):
+    """Attach sentiment in one batch; news still renders if scoring fails."""
+    from app.nlp.sentiment import score_articles
+
+    try:
+        with timed("news.sentiment"):
+            score_articles(articles)
+    except Exception as e:
+        logger.warning(f"Sentiment scoring failed: {e}")
+
+
+def fetch_news(query: str, page_size: int = 5, client_factory=None, persist: bool = True, bind=None):
+    """
+    Latest articles for query, each with a sentiment score/label, served
+    from the cache for NEWS_CACHE_TTL seconds. client_factory returns a
+    GoogleNews-like object (search/result) and defaults to
+    google_news_client, so callers can pass a local stub.
+    """
+    news = fetch_news_many([query], page_size=page_size, client_factory=client_factory,
+                           persist=persist, bind=bind)
+    return news.get(query, {"error": "No news found for this query."})
+
+
+@timed("news.fetch")
+def fetch_news_many(queries, page_size: int = 5, max_workers: int = 4, client_factory=None,
+                    persist: bool = True, bind=None):
+    """
+    fetch_news for several queries; returns {query: result}. Cache misses
+    are searched on a thread pool, then all new articles are scored for
+    sentiment in one batch and stored. A failed query yields an
+    {"error": ...} entry instead of failing the rest.
+    """
+    queries = list(dict.fromkeys(q for q in queries if q))
+    results = {}
+    misses = []
+    for q in queries:
+        cached = _cache.get((q, page_size))
+        if cached is not None:
+            results[q] = cached
+        else:
+            misses.append(q)
+    incr("news.cache_hits", len(results))
+
+    def one(query):
+        try:
+            return _search(query, page_size, client_factory)
+        except Exception as e:
+            logger.warning(f"News fetch for {query} failed: {e}")
+            return e
+
+    if len(misses) > 1:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(misses)), thread_name_prefix="news") as pool:
+            fetched = dict(zip(misses, pool.map(one, misses)))
+    else:
+        fetched = {q: one(q) for q in misses}
+
+    _score([a for articles in fetched.values() if isinstance(articles, list) for a in articles])
+    for q, articles in fetched.items():
+        if isinstance(articles, Exception):
+            # Not cached, so the next rerun retries
+            results[q] = {"error": f"Failed to fetch news for {q}: {articles}"}
+            continue
+        if not articles:
+            news = {"error": "No news found for this query."}
+        else:
+            news = {"articles": articles}
+            if persist:
+                try:
+                    save_articles(q, articles, bind=bind)
+                except Exception as e:
+                    logger.warning(f"Could not store news for {q}: {e}")
+        _cache.set((q, page_size), news)
+        results[q] = news
+    return {q: results[q] for q in queries}
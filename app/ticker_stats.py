@@ -0,0 +1,86 @@
+# app/ticker_stats.py
+"""
+Maintenance of the ticker_stats rollup table.
+
+Stats are recomputed only for the tickers touched by a write, with a few
+aggregate queries that each hit the (ticker, date) index, so the cost of a
+refresh depends on that ticker's history, never on the whole table.
+"""
+from datetime import datetime, timedelta
+from sqlalchemy import select, func, delete
+from app.db import engine, dialect_insert
+from app.models import FinancialData, TickerStats
+
+# Trailing windows for TickerStats.first_close_*, in calendar days
+WINDOWS = {"1m": 30, "3m": 91, "1y": 365}
+
+
+def _first_close_since(conn, ticker, since):
+    fd = FinancialData.__table__
+    return conn.execute(
+        select(fd.c.close)
+        .where(fd.c.ticker == ticker, fd.c.date >= since)
+        .order_by(fd.c.date)
+        .limit(1)
+    ).scalar()
+
+
+def compute_ticker_stats(conn, ticker):
+    """Stats row (dict) for one ticker, or None if it has no bars."""
+    fd = FinancialData.__table__
+    agg = conn.execute(
+        select(
+            func.count(), func.min(fd.c.date), func.max(fd.c.date),
+            func.min(fd.c.close), func.max(fd.c.close), func.sum(fd.c.volume),
+        ).where(fd.c.ticker == ticker)
+    ).one()
+    row_count, first_date, latest_date, min_close, max_close, volume_total = agg
+    if not row_count:
+        return None
+
+    stats = {
+        "ticker": ticker,
+        "first_date": first_date,
+        "latest_date": latest_date,
+        "latest_close": conn.execute(
+            select(fd.c.close).where(fd.c.ticker == ticker, fd.c.date == latest_date)
+        ).scalar(),
+        "min_close": min_close,
+        "max_close": max_close,
+        "volume_total": volume_total,
+        "row_count": row_count,
+        "volume_1m": conn.execute(
+            select(func.sum(fd.c.volume)).where(
+                fd.c.ticker == ticker, fd.c.date >= latest_date - timedelta(days=WINDOWS["1m"])
+            )
+        ).scalar(),
+        "updated_at": datetime.utcnow(),
+    }
+    for name, days in WINDOWS.items():
+        stats[f"first_close_{name}"] = _first_close_since(conn, ticker, latest_date - timedelta(days=days))
+    return stats
+
+
+def refresh_ticker_stats(conn, tickers):
+    """Recompute and upsert ticker_stats rows for `tickers` on an open connection."""
+    table = TickerStats.__table__
+    for ticker in tickers:
+        stats = compute_ticker_stats(conn, ticker)
+        if stats is None:
+            conn.execute(delete(table).where(table.c.ticker == ticker))
+            continue
+        stmt = dialect_insert(table, bind=conn)
+        if stmt is None:
+            conn.execute(delete(table).where(table.c.ticker == ticker))
+            conn.execute(table.insert(), stats)
+            continue
+        updates = {k: stmt.excluded[k] for k in stats if k != "ticker"}
+        conn.execute(stmt.on_conflict_do_update(index_elements=["ticker"], set_=updates), stats)
+
+
+def rebuild_ticker_stats(bind=None):
+    """Recompute ticker_stats for every ticker in financial_data; returns the ticker count."""
+    with (bind or engine).begin() as conn:
+        tickers = conn.execute(select(FinancialData.ticker).distinct()).scalars().all()
+        refresh_ticker_stats(conn, tickers)
+    return len(tickers)
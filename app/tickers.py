@@ -0,0 +1,77 @@
+# app/tickers.py
+"""
+Ticker reference data: the one place company names, exchanges, currencies
+and HQ coordinates are defined, and the helpers that keep the `tickers`
+table in step with the symbols that have prices.
+"""
+from sqlalchemy import select
+from app.db import engine, dialect_insert
+from app.models import Ticker
+
+# Known companies; any other symbol gets a bare tickers row on first write
+COMPANIES = {
+    "AAPL": {"name": "Apple Inc.", "exchange": "NASDAQ", "currency": "USD",
+             "lat": 37.3349, "lon": -122.0090},   # Apple Park, Cupertino
+    "MSFT": {"name": "Microsoft Corporation", "exchange": "NASDAQ", "currency": "USD",
+             "lat": 47.6426, "lon": -122.1366},   # Microsoft HQ, Redmond
+    "GOOGL": {"name": "Alphabet Inc.", "exchange": "NASDAQ", "currency": "USD",
+              "lat": 37.4220, "lon": -122.0841},  # Googleplex, Mountain View
+    "AMZN": {"name": "Amazon.com, Inc.", "exchange": "NASDAQ", "currency": "USD",
+             "lat": 47.6220, "lon": -122.3360},   # Amazon, Seattle
+    "TSLA": {"name": "Tesla, Inc.", "exchange": "NASDAQ", "currency": "USD",
+             "lat": 37.3947, "lon": -122.1500},   # Tesla, Palo Alto
+    "META": {"name": "Meta Platforms, Inc.", "exchange": "NASDAQ", "currency": "USD",
+             "lat": 37.4845, "lon": -122.1477},   # Meta, Menlo Park
+    "TCS.NS": {"name": "Tata Consultancy Services", "exchange": "NSE", "currency": "INR",
+               "lat": 19.0760, "lon": 72.8777},   # Tata Consultancy, Mumbai
+}
+
+FIELDS = ("name", "exchange", "lat", "lon", "currency")
+
+
+def reference_row(symbol):
+    """tickers row for symbol from COMPANIES (only the symbol if unknown)."""
+    info = COMPANIES.get(symbol, {})
+    return {"symbol": symbol, **{f: info.get(f) for f in FIELDS}}
+
+
+def parse_location(value):
+    """(lat, lon) floats from a legacy "lat,lon" string, or (None, None)."""
+    try:
+        lat, lon = (float(v) for v in str(value).split(","))
+        return lat, lon
+    except (TypeError, ValueError):
+        return None, None
+
+
+def ensure_tickers(conn, symbols):
+    """
+    Insert tickers rows for symbols that have none yet, on an open
+    connection (so price rows written in the same transaction satisfy the
+    foreign key). Existing rows are left alone.
+    """
+    symbols = list(dict.fromkeys(symbols))
+    if not symbols:
+        return
+    table = Ticker.__table__
+    stmt = dialect_insert(table, bind=conn)
+    if stmt is not None:
+        conn.execute(stmt.on_conflict_do_nothing(index_elements=["symbol"]),
+                     [reference_row(s) for s in symbols])
+        return
+    known = set(conn.execute(select(table.c.symbol).where(table.c.symbol.in_(symbols))).scalars())
+    missing = [reference_row(s) for s in symbols if s not in known]
+    if missing:
+        conn.execute(table.insert(), missing)
+
+
+def upsert_ticker(symbol, bind=None, **fields):
+    """Create or update one ticker's reference data (name, exchange, lat, lon, currency)."""
+    unknown = set(fields) - set(FIELDS)
+    if unknown:
+        raise ValueError(f"Unknown ticker fields: {', '.join(sorted(unknown))}")
+    table = Ticker.__table__
+    with (bind or engine).begin() as conn:
+        ensure_tickers(conn, [symbol])
+        if fields:
+            conn.execute(table.update().where(table.c.symbol == symbol).values(**fields))
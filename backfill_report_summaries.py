@@ -0,0 +1,31 @@
+import argparse
+from app.db import session_scope
+from app.models import Report
+from app.nlp.summarizer import summarize_many, BATCH_SIZE
+from app import queries
+
+# Summarizes reports in batches; only reports without a summary unless --all
+parser = argparse.ArgumentParser()
+parser.add_argument("--all", action="store_true", help="re-summarize every report")
+parser.add_argument("--docs-per-batch", type=int, default=32)
+parser.add_argument("--batch-size", type=int, default=BATCH_SIZE, help="model batch size")
+args = parser.parse_args()
+
+with session_scope() as session:
+    query = session.query(Report.id).order_by(Report.id)
+    if not args.all:
+        query = query.filter((Report.summary.is_(None)) | (Report.summary == ""))
+    ids = [r.id for r in query.all()]
+
+    done = 0
+    for start in range(0, len(ids), args.docs_per_batch):
+        reports = session.query(Report).filter(Report.id.in_(ids[start:start + args.docs_per_batch])).all()
+        summaries = summarize_many([r.content for r in reports], batch_size=args.batch_size)
+        for r, summary in zip(reports, summaries):
+            r.summary = summary
+        session.commit()
+        done += len(reports)
+        print(f"… {done}/{len(ids)} reports summarized")
+
+queries.invalidate()
+print(f"✅ Backfilled summaries for {done} reports.")
@@ -0,0 +1,119 @@
+# benchmarks/bench_concurrency.py
+"""
+Dashboard-style reads while a writer process ingests prices, with SQLAlchemy's
+default SQLite engine (rollback journal, no busy timeout PRAGMA) vs the
+app.db profile (WAL, synchronous=NORMAL, busy_timeout, mmap). Reports read
+latency percentiles, reads completed and "database is locked" errors.
+
+    python -m benchmarks.bench_concurrency --tickers 40 --years 5 --readers 4
+"""
+import argparse
+import multiprocessing
+import threading
+import time
+
+import numpy as np
+from sqlalchemy import create_engine, select, func
+from sqlalchemy.exc import OperationalError
+
+from app.db import Base, create_app_engine
+from app.ingestion import normalize_ohlcv, write_financial_frame
+from app.models import FinancialData, TickerStats
+from benchmarks.common import report, temp_sqlite_url
+from benchmarks.synthetic import make_ohlcv, make_tickers
+
+
+def default_engine(url):
+    # What app.db created before the profiles; pysqlite's default 5s lock wait
+    return create_engine(url, connect_args={"check_same_thread": False})
+
+
+def read_once(engine):
+    fd = FinancialData.__table__
+    with engine.connect() as conn:
+        conn.execute(select(fd.c.ticker, fd.c.date, fd.c.close).order_by(fd.c.date.desc()).limit(300)).all()
+        conn.execute(select(TickerStats.__table__)).all()
+        conn.execute(select(func.count()).select_from(fd)).scalar()
+
+
+def make(profile, url):
+    return default_engine(url) if profile == "default" else create_app_engine(url)
+
+
+def writer(profile, url, tickers, years, result):
+    """Writer process (like a job worker or scheduler in another process)."""
+    engine = make(profile, url)
+    rows = errors = 0
+    start = time.perf_counter()
+    for t in tickers:
+        frame = normalize_ohlcv(make_ohlcv(t, days=252 * years), ticker=t)
+        try:
+            rows += write_financial_frame(frame, bind=engine)
+        except OperationalError:
+            errors += 1
+    result.update(rows=rows, errors=errors, seconds=time.perf_counter() - start)
+
+
+def run(profile, tickers, years, readers):
+    url = temp_sqlite_url(profile)
+    engine = make(profile, url)
+    Base.metadata.create_all(bind=engine)
+    # Seed some history so reads have work to do
+    seed = len(tickers) // 4
+    for t in tickers[:seed]:
+        write_financial_frame(normalize_ohlcv(make_ohlcv(t, days=252 * years), ticker=t), bind=engine)
+
+    latencies, errors = [], [0]
+    stop = threading.Event()
+    lock = threading.Lock()
+
+    def reader():
+        while not stop.is_set():
+            start = time.perf_counter()
+            try:
+                read_once(engine)
+            except OperationalError:
+                with lock:
+                    errors[0] += 1
+                continue
+            with lock:
+                latencies.append(time.perf_counter() - start)
+
+    ctx = multiprocessing.get_context("spawn")
+    with ctx.Manager() as manager:
+        result = manager.dict()
+        proc = ctx.Process(target=writer, args=(profile, url, tickers[seed:], years, result))
+        proc.start()
+        threads = [threading.Thread(target=reader) for _ in range(readers)]
+        for th in threads:
+            th.start()
+        proc.join()
+        stop.set()
+        for th in threads:
+            th.join()
+        result = dict(result)
+
+    report(f"{profile}: writer process", result["seconds"], result["rows"])
+    if latencies:
+        ms = np.array(latencies) * 1000
+        print(f"{'':<40} reads={len(ms):,} p50={np.percentile(ms, 50):.1f} ms "
+              f"p95={np.percentile(ms, 95):.1f} ms max={ms.max():.1f} ms")
+    print(f"{'':<40} read errors={errors[0]} write errors={result['errors']}")
+    engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tickers", type=int, default=40)
+    parser.add_argument("--years", type=int, default=5)
+    parser.add_argument("--readers", type=int, default=4)
+    args = parser.parse_args()
+
+    tickers = make_tickers(args.tickers)
+    print(f"{args.tickers} tickers x {args.years}y, writer process + {args.readers} reader threads")
+    run("default", tickers, args.years, args.readers)
+    run("profile", tickers, args.years, args.readers)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+# benchmarks/bench_dashboard.py
+"""
+Dashboard grid and chart cost on a 50-ticker x 5-year table: Plotly figure
+JSON size and build time for the full history vs queries.chart_prices
+(LTTB downsampled), and grid page latency for OFFSET vs keyset pagination
+at increasing depth.
+
+    python -m benchmarks.bench_dashboard --tickers 50 --years 5
+"""
+import argparse
+import time
+
+import pandas as pd
+import plotly.express as px
+from sqlalchemy import text
+
+from app import queries
+from app.ingestion import save_financial_dataframe
+from benchmarks.common import make_engine, report, temp_sqlite_url, timer
+from benchmarks.synthetic import make_ohlcv, make_tickers
+
+PAGE = 100
+
+
+def figure_cost(name, load):
+    with timer() as t:
+        df = load()
+        payload = px.line(df, x="date", y="close", color="ticker").to_json()
+    report(name, t["seconds"], len(df), unit="points")
+    print(f"{'':<40} {len(payload) / 1024:>10.1f} KB figure JSON")
+
+
+def best_of(fn, repeat=5):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tickers", type=int, default=50)
+    parser.add_argument("--years", type=int, default=5)
+    parser.add_argument("--budget", type=int, default=10_000, help="total chart points")
+    args = parser.parse_args()
+
+    engine, _ = make_engine(temp_sqlite_url("dashboard"))
+    tickers = make_tickers(args.tickers)
+    for t in tickers:
+        save_financial_dataframe(t, make_ohlcv(t, days=252 * args.years), bind=engine)
+    total = args.tickers * 252 * args.years
+    print(f"{args.tickers} tickers x {args.years}y = {total:,} bars")
+
+    figure_cost("chart: full history", lambda: queries.load_prices(columns=("close",), bind=engine))
+    points = args.budget // args.tickers
+    figure_cost(f"chart: chart_prices ({points}/ticker)",
+                lambda: queries.chart_prices.__wrapped__(points=points, bind=engine))
+
+    price_page = queries.price_page.__wrapped__
+    offset_sql = text("SELECT date, ticker, open, high, low, close, volume FROM financial_data "
+                      "ORDER BY date DESC, ticker DESC LIMIT :limit OFFSET :offset")
+    ordered = pd.read_sql(text("SELECT date, ticker FROM financial_data ORDER BY date DESC, ticker DESC"), engine)
+    for depth in (0, total // 10, total // 2, total - PAGE):
+        seconds = best_of(lambda: pd.read_sql(offset_sql, engine, params={"limit": PAGE, "offset": depth}))
+        report(f"grid page @ row {depth:,}: OFFSET", seconds)
+        cursor = None
+        if depth:
+            row = ordered.iloc[depth - 1]
+            cursor = (pd.Timestamp(row["date"]).to_pydatetime(), row["ticker"])
+        seconds = best_of(lambda: price_page(cursor=cursor, limit=PAGE, bind=engine))
+        report(f"grid page @ row {depth:,}: keyset", seconds)
+
+
+if __name__ == "__main__":
+    main()
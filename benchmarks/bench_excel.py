@@ -0,0 +1,58 @@
+# benchmarks/bench_excel.py
+"""
+Time-to-first-preview and peak memory: parse_excel (every sheet fully
+loaded) vs open_workbook (names/dimensions, then one sheet preview), for a
+large multi-sheet workbook and a large CSV.
+
+    python -m benchmarks.bench_excel --sheets 20 --rows 20000
+"""
+import argparse
+import tracemalloc
+
+from app.data_parsing.excel_parser import parse_excel, open_workbook
+from benchmarks.common import report, timer
+from benchmarks.synthetic import make_csv, make_workbook
+
+
+def measure(name, func):
+    tracemalloc.start()
+    with timer() as t:
+        func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    report(f"{name} (peak {peak / 2 ** 20:.0f} MB)", t["seconds"])
+
+
+def lazy_preview(data, filename):
+    with open_workbook(data, filename) as wb:
+        wb.dimensions()
+        wb.preview(wb.sheet_names[0], n=20)
+
+
+def chunked_csv(data):
+    with open_workbook(data, "data.csv") as f:
+        for _ in f.iter_chunks(50_000):
+            pass
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sheets", type=int, default=20)
+    parser.add_argument("--rows", type=int, default=20_000)
+    parser.add_argument("--csv-rows", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    xlsx = make_workbook(args.sheets, args.rows)
+    print(f"workbook: {args.sheets} sheets x {args.rows:,} rows, {len(xlsx) / 2 ** 20:.1f} MB")
+    measure("xlsx parse_excel (all sheets)", lambda: parse_excel(xlsx, "model.xlsx"))
+    measure("xlsx open_workbook + preview", lambda: lazy_preview(xlsx, "model.xlsx"))
+
+    csv = make_csv(args.csv_rows)
+    print(f"csv: {args.csv_rows:,} rows, {len(csv) / 2 ** 20:.1f} MB")
+    measure("csv parse_excel", lambda: parse_excel(csv, "data.csv"))
+    measure("csv open_workbook + preview", lambda: lazy_preview(csv, "data.csv"))
+    measure("csv iter_chunks (full pass)", lambda: chunked_csv(csv))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+# benchmarks/bench_import.py
+"""
+Cold-start latency: wall time of a fresh interpreter importing each module
+(interpreter start-up subtracted), plus one bare-mode run of streamlit_app.py
+(the Dashboard tab).
+
+    python -m benchmarks.bench_import --repeat 3
+"""
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+MODULES = [
+    "streamlit",
+    "app.ingestion",
+    "app.queries",
+    "app.reports",
+    "app.nlp.summarizer",
+    "app.data_parsing.pdf_parser",
+    "app.data_parsing.excel_parser",
+    "app.services.finance_api",
+    "app.services.news_api",
+    "app.automation",
+]
+
+
+def cold_run(code, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, env=os.environ)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    base = cold_run("pass", args.repeat)
+    print(f"{'interpreter start-up':<40} {base * 1000:>10.1f} ms (subtracted below)")
+    for module in MODULES:
+        try:
+            seconds = cold_run(f"import {module}", args.repeat) - base
+        except subprocess.CalledProcessError:
+            print(f"{module:<40} {'failed':>10}")
+            continue
+        print(f"import {module:<33} {seconds * 1000:>10.1f} ms")
+
+    script = "import runpy; runpy.run_path('streamlit_app.py', run_name='__main__')"
+    try:
+        seconds = cold_run(script, args.repeat) - base
+        print(f"{'streamlit_app.py (bare mode)':<40} {seconds * 1000:>10.1f} ms")
+    except subprocess.CalledProcessError as e:
+        print(f"streamlit_app.py (bare mode) failed: {e.stderr.decode()[-300:]}")
+
+
+if __name__ == "__main__":
+    main()
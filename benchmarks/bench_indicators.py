@@ -0,0 +1,71 @@
+# benchmarks/bench_indicators.py
+"""
+Wide-frame indicator engine vs a per-ticker Python loop, plus incremental
+update cost for one new bar.
+
+    python -m benchmarks.bench_indicators --tickers 500 --years 5
+"""
+import argparse
+
+import pandas as pd
+
+from app.analytics import indicators
+from app.analytics.indicators import IndicatorEngine
+from benchmarks.common import peak_rss_mb, report, timer
+from benchmarks.synthetic import make_ohlcv, make_tickers
+
+
+def per_ticker_loop(long_df):
+    """Baseline: boolean-mask each ticker out of the long frame, as the UI used to."""
+    out = {}
+    for tk in long_df["ticker"].unique():
+        close = long_df.loc[long_df["ticker"] == tk].set_index("date")["close"]
+        out[tk] = pd.DataFrame({
+            "sma_20": close.rolling(20).mean(),
+            "sma_50": close.rolling(50).mean(),
+            "ema_12": close.ewm(span=12, adjust=False).mean(),
+            "ema_26": close.ewm(span=26, adjust=False).mean(),
+            "rsi": indicators.rsi(close.to_frame())[close.name],
+            "volatility": indicators.rolling_volatility(close.to_frame())[close.name],
+            "drawdown": close / close.cummax() - 1,
+        })
+    return out
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tickers", type=int, default=500)
+    parser.add_argument("--years", type=int, default=5)
+    args = parser.parse_args()
+
+    days = 252 * args.years
+    frames = [make_ohlcv(t, days=days).assign(ticker=t) for t in make_tickers(args.tickers)]
+    long_df = pd.concat(frames).reset_index().rename(columns={"Date": "date", "Close": "close"})
+    cells = args.tickers * days
+    print(f"{args.tickers} tickers x {days} bars = {cells:,} cells")
+
+    with timer() as t:
+        wide = indicators.to_wide(long_df)
+    report("to_wide", t["seconds"], cells, unit="cells")
+
+    with timer() as t:
+        per_ticker_loop(long_df)
+    report("per-ticker loop", t["seconds"], cells, unit="cells")
+
+    with timer() as t:
+        engine = IndicatorEngine()
+        engine.fit(wide.iloc[:-1])
+    report("IndicatorEngine.fit", t["seconds"], cells, unit="cells")
+
+    with timer() as t:
+        engine.update(wide.iloc[-1:])
+    report("IndicatorEngine.update (1 bar)", t["seconds"], args.tickers, unit="tickers")
+
+    with timer() as t:
+        indicators.correlation_matrix(wide)
+    report("correlation_matrix", t["seconds"], cells, unit="cells")
+    print(f"peak RSS {peak_rss_mb():.0f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+# benchmarks/bench_ingestion.py
+"""
+Rows/sec of the old per-row ORM save path vs app.ingestion on SQLite
+(and PostgreSQL when BENCH_POSTGRES_URL is set).
+
+    python -m benchmarks.bench_ingestion --tickers 50 --years 5
+"""
+import argparse
+
+import pandas as pd
+
+from app.ingestion import save_financial_dataframe
+from app.models import FinancialData
+from app.tickers import ensure_tickers
+from benchmarks.common import bench_urls, make_engine, report, timer
+from benchmarks.synthetic import make_ohlcv, make_tickers
+
+
+def legacy_save_financial_dataframe(SessionLocal, ticker, df):
+    """The original streamlit_app.py implementation, kept here as the baseline."""
+    db = SessionLocal()
+    inserted = 0
+    for _, row in df.reset_index().iterrows():
+        if "date" in row:
+            date_val = pd.to_datetime(row["date"])
+        elif "Date" in row:
+            date_val = pd.to_datetime(row["Date"])
+        else:
+            continue
+        if isinstance(date_val, pd.Series):
+            date_val = date_val.iloc[0]
+        if hasattr(date_val, "to_pydatetime"):
+            date_val = date_val.to_pydatetime()
+        fd = FinancialData(
+            ticker=ticker,
+            date=date_val,
+            open=float(row.get("Open", row.get("open", 0))),
+            high=float(row.get("High", row.get("high", 0))),
+            low=float(row.get("Low", row.get("low", 0))),
+            close=float(row.get("Close", row.get("close", 0))),
+            volume=float(row.get("Volume", row.get("volume", 0))),
+        )
+        db.add(fd)
+        inserted += 1
+    db.commit()
+    db.close()
+    return inserted
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tickers", type=int, default=50)
+    parser.add_argument("--years", type=int, default=5)
+    args = parser.parse_args()
+
+    frames = {t: make_ohlcv(t, days=252 * args.years) for t in make_tickers(args.tickers)}
+    total = sum(len(f) for f in frames.values())
+    print(f"{args.tickers} tickers x {args.years}y = {total:,} rows")
+
+    for dialect, url in bench_urls():
+        engine, SessionLocal = make_engine(url)
+        with engine.begin() as conn:
+            # The price rows' foreign key needs the tickers rows to exist
+            ensure_tickers(conn, list(frames))
+        with timer() as t:
+            for tk, df in frames.items():
+                legacy_save_financial_dataframe(SessionLocal, tk, df)
+        report(f"{dialect}: per-row ORM", t["seconds"], total)
+
+        engine, SessionLocal = make_engine(url)
+        with timer() as t:
+            for tk, df in frames.items():
+                save_financial_dataframe(tk, df, bind=engine)
+        report(f"{dialect}: app.ingestion", t["seconds"], total)
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+# benchmarks/bench_map.py
+"""
+Dashboard map: build + render time and HTML payload of the old one-marker-
+per-price-row loop vs app.maps.ticker_map over queries.map_points().
+
+    python -m benchmarks.bench_map --tickers 50 --rows 300
+"""
+import argparse
+import random
+
+import folium
+import pandas as pd
+
+from app.ingestion import normalize_ohlcv
+from app.maps import ticker_map
+from benchmarks.common import report, timer
+from benchmarks.synthetic import make_ohlcv, make_tickers
+
+
+def legacy_map(df):
+    """The original Dashboard loop, kept here as the baseline."""
+    m = folium.Map(location=[20.5937, 78.9629], zoom_start=4)
+    for _, row in df.iterrows():
+        if pd.notna(row.get("location")):
+            try:
+                lat, lon = map(float, str(row["location"]).split(","))
+                folium.Marker([lat, lon], popup=f"{row['ticker']} - {row['close']}").add_to(m)
+            except:
+                pass
+    return m
+
+
+def make_rows(tickers, rows):
+    """Latest `rows` bars across tickers with "lat,lon" strings, like queries.latest_prices()."""
+    rng = random.Random(0)
+    frames = []
+    for t in tickers:
+        frame = normalize_ohlcv(make_ohlcv(t, days=max(1, rows // len(tickers)) + 1), ticker=t)
+        frame["location"] = f"{rng.uniform(-50, 60):.4f},{rng.uniform(-120, 140):.4f}"
+        frames.append(frame)
+    return pd.concat(frames, ignore_index=True).sort_values("date", ascending=False).head(rows)
+
+
+def to_points(df):
+    """What queries.map_points() returns for the same data."""
+    g = df.sort_values("date").groupby("ticker")
+    points = g.agg(latest_close=("close", "last"), first_close=("close", "first"),
+                   location=("location", "last"), latest_date=("date", "last")).reset_index()
+    coords = points["location"].str.split(",", n=1, expand=True)
+    points["lat"] = pd.to_numeric(coords[0])
+    points["lon"] = pd.to_numeric(coords[1])
+    points["change_1m"] = points["latest_close"] / points["first_close"] - 1
+    return points
+
+
+def measure(name, build):
+    with timer() as t:
+        html = build().get_root().render()
+    report(name, t["seconds"])
+    print(f"{'':<40} {len(html.encode()) / 1024:>10.1f} KB HTML")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tickers", type=int, default=50)
+    parser.add_argument("--rows", type=int, default=300)
+    args = parser.parse_args()
+
+    df = make_rows(make_tickers(args.tickers), args.rows)
+    print(f"{len(df)} price rows, {df['ticker'].nunique()} tickers")
+    measure("legacy: marker per row", lambda: legacy_map(df))
+    measure("ticker_map: clustered, per ticker", lambda: ticker_map(to_points(df)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+# benchmarks/bench_news.py
+"""
+Latency of news fetching for a ticker list against a local GoogleNews stub
+with simulated network delay: serial (the old per-ticker loop), concurrent
+fetch_news_many, and a warm-cache rerun. Also checks URL deduplication in
+news_articles.
+
+    python -m benchmarks.bench_news --tickers 10 --latency 0.5
+"""
+import argparse
+
+from sqlalchemy import func, select
+
+from app.services import news_api
+from benchmarks.common import make_engine, report, temp_sqlite_url, timer
+from benchmarks.stubs import StubGoogleNews
+from benchmarks.synthetic import make_tickers
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tickers", type=int, default=10)
+    parser.add_argument("--latency", type=float, default=0.5)
+    parser.add_argument("--workers", type=int, default=8)
+    args = parser.parse_args()
+
+    StubGoogleNews.latency = args.latency
+    tickers = make_tickers(args.tickers)
+    engine, _ = make_engine(temp_sqlite_url("news"))
+
+    news_api.invalidate()
+    with timer() as t:
+        for tk in tickers:
+            news_api.fetch_news(tk, page_size=3, client_factory=StubGoogleNews, bind=engine)
+    report("serial fetch_news", t["seconds"], args.tickers, unit="queries")
+
+    news_api.invalidate()
+    with timer() as t:
+        news_api.fetch_news_many(tickers, page_size=3, max_workers=args.workers,
+                                 client_factory=StubGoogleNews, bind=engine)
+    report(f"fetch_news_many ({args.workers} workers)", t["seconds"], args.tickers, unit="queries")
+
+    with timer() as t:
+        news_api.fetch_news_many(tickers, page_size=3, max_workers=args.workers,
+                                 client_factory=StubGoogleNews, bind=engine)
+    report("fetch_news_many (warm cache)", t["seconds"], args.tickers, unit="queries")
+
+    with engine.connect() as conn:
+        stored = conn.execute(select(func.count()).select_from(news_api.NewsArticle)).scalar()
+    print(f"news_articles rows: {stored} (expected {args.tickers * 3}, duplicates skipped)")
+
+
+if __name__ == "__main__":
+    main()
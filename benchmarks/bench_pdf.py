@@ -0,0 +1,59 @@
+# benchmarks/bench_pdf.py
+"""
+Old single-pass parse_pdf vs the streaming parser (serial and process pool),
+on a synthetic text PDF. Memory is the tracemalloc peak of this process, so
+worker-process memory is not included in the pool figure.
+
+    python -m benchmarks.bench_pdf --pages 300
+"""
+import argparse
+import tracemalloc
+from io import BytesIO
+
+import pandas as pd
+import pdfplumber
+
+from app.data_parsing.pdf_parser import parse_pdf, iter_pdf_pages
+from benchmarks.common import report, timer
+from benchmarks.synthetic import make_pdf
+
+
+def legacy_parse_pdf(file_bytes):
+    """The original implementation, kept as the baseline."""
+    text = ""
+    tables = []
+    with pdfplumber.open(BytesIO(file_bytes)) as pdf:
+        for page in pdf.pages:
+            text += page.extract_text() or ""
+            tables.extend(page.extract_tables())
+    dfs = [pd.DataFrame(tbl[1:], columns=tbl[0]) for tbl in tables if tbl]
+    return {"text": text, "tables": dfs}
+
+
+def measure(name, func, pages):
+    tracemalloc.start()
+    with timer() as t:
+        func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    report(f"{name} (peak {peak / 2 ** 20:.0f} MB)", t["seconds"], pages, unit="pages")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pages", type=int, default=300)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    data = make_pdf(args.pages)
+    print(f"{args.pages} pages, {len(data) / 2 ** 20:.1f} MB")
+    measure("legacy parse_pdf", lambda: legacy_parse_pdf(data), args.pages)
+    measure("parse_pdf workers=1", lambda: parse_pdf(data, workers=1), args.pages)
+    measure("parse_pdf process pool", lambda: parse_pdf(data, workers=args.workers), args.pages)
+    with timer() as t:
+        next(iter_pdf_pages(data))
+    report("time to first page", t["seconds"])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+# benchmarks/bench_price_store.py
+"""
+Load time and peak RSS of app.queries.load_prices from financial_data vs the
+Parquet price store. Each load runs in a fresh subprocess so peak RSS is
+measured per store.
+
+    python -m benchmarks.bench_price_store --tickers 200 --years 5
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+from benchmarks.common import peak_rss_mb, report, temp_sqlite_url, timer
+
+
+def populate(url, store_dir, tickers, years):
+    env = dict(os.environ, DATABASE_URL=url, PRICE_STORE_DIR=store_dir)
+    code = (
+        "from app.db import init_db; init_db()\n"
+        "from app.ingestion import save_financial_dataframe\n"
+        "from benchmarks.synthetic import make_ohlcv, make_tickers\n"
+        f"for t in make_tickers({tickers}):\n"
+        f"    save_financial_dataframe(t, make_ohlcv(t, days={252 * years}))\n"
+    )
+    subprocess.run([sys.executable, "-c", code], env=env, check=True, capture_output=True)
+
+
+def load_once(store, tickers, start, columns):
+    """Runs in the child process; prints one JSON line."""
+    from app import queries
+
+    with timer() as t:
+        df = queries.load_prices(tickers=tickers, start=start, columns=columns)
+    print(json.dumps({"store": store, "seconds": t["seconds"], "rows": len(df), "rss_mb": peak_rss_mb()}))
+
+
+def run_child(url, store_dir, args):
+    env = dict(os.environ, DATABASE_URL=url)
+    env.pop("PRICE_STORE_DIR", None)
+    if store_dir:
+        env["PRICE_STORE_DIR"] = store_dir
+    cmd = [sys.executable, "-m", "benchmarks.bench_price_store", "--child",
+           "parquet" if store_dir else "sql", "--columns", args.columns]
+    if args.subset:
+        cmd += ["--subset", str(args.subset)]
+    if args.start:
+        cmd += ["--start", args.start]
+    out = subprocess.run(cmd, env=env, check=True, capture_output=True, text=True).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tickers", type=int, default=200)
+    parser.add_argument("--years", type=int, default=5)
+    parser.add_argument("--columns", default="close", help="comma separated value columns to load")
+    parser.add_argument("--subset", type=int, default=0, help="load only the first N tickers")
+    parser.add_argument("--start", default=None, help="load bars on/after this date")
+    parser.add_argument("--child", default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        from benchmarks.synthetic import make_tickers
+        tickers = make_tickers(args.subset) if args.subset else None
+        load_once(args.child, tickers, args.start, tuple(args.columns.split(",")))
+        return
+
+    url = temp_sqlite_url("price_store")
+    store_dir = tempfile.mkdtemp(prefix="aifin-parquet-")
+    populate(url, store_dir, args.tickers, args.years)
+    print(f"{args.tickers} tickers x {args.years}y, columns={args.columns}, "
+          f"subset={args.subset or 'all'}, start={args.start or '-'}")
+    for result in (run_child(url, None, args), run_child(url, store_dir, args)):
+        report(f"{result['store']} load ({result['rss_mb']:.0f} MB peak RSS)", result["seconds"], result["rows"])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+# benchmarks/bench_search.py
+"""
+Report search latency on synthetic reports: app.search.search_reports
+(FTS5 on SQLite, tsvector/GIN on PostgreSQL when BENCH_POSTGRES_URL is set)
+vs a LIKE '%term%' scan, for a rare term, a common term and a prefix.
+
+    python -m benchmarks.bench_search --reports 10000 --words 1000
+"""
+import argparse
+import time
+
+import numpy as np
+from sqlalchemy import text
+
+from app.models import Report
+from app.search import ensure_search_index, search_reports
+from benchmarks.common import bench_urls, make_engine, report, timer
+from benchmarks.synthetic import make_reports
+
+# (label, query); each issuerN is in ~1 in 500 reports (the last query word is
+# a prefix, so "issuer7" also matches issuer70..79), "revenue" in nearly all
+QUERIES = [("rare term", "issuer7"), ("common term", "revenue"), ("two terms", "liquidity guidance"),
+           ("prefix", "issu")]
+
+
+def latency(fn, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return np.percentile(times, 50) * 1000, np.percentile(times, 95) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--reports", type=int, default=10_000)
+    parser.add_argument("--words", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    print(f"{args.reports:,} reports x {args.words} words")
+
+    for dialect, url in bench_urls():
+        engine, _ = make_engine(url)
+        ensure_search_index(engine)
+        rows = list(make_reports(args.reports, args.words))
+        with timer() as t:
+            with engine.begin() as conn:
+                for start in range(0, len(rows), 1000):
+                    conn.execute(Report.__table__.insert(), rows[start:start + 1000])
+        report(f"{dialect}: insert + index", t["seconds"], len(rows))
+
+        for label, q in QUERIES:
+            hits = search_reports(q, limit=20, bind=engine)["total"]
+            p50, p95 = latency(lambda: search_reports(q, limit=20, bind=engine), args.repeat)
+            print(f"{dialect}: search {label:<12} {q!r:<22} {hits:>6} hits  p50={p50:8.1f} ms  p95={p95:8.1f} ms")
+
+            word = q.split()[0]
+            like = text("SELECT id, title FROM reports WHERE content LIKE :w OR title LIKE :w "
+                        "ORDER BY created_at DESC LIMIT 20")
+            with engine.connect() as conn:
+                p50, p95 = latency(lambda: conn.execute(like, {"w": f"%{word}%"}).all(), max(3, args.repeat // 4))
+            print(f"{dialect}: LIKE   {label:<12} {word!r:<22} {'':>11} p50={p50:8.1f} ms  p95={p95:8.1f} ms")
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
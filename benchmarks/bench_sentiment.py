@@ -0,0 +1,66 @@
+# benchmarks/bench_sentiment.py
+"""
+Headline sentiment throughput (headlines/s) of score_texts across batch
+sizes, the cached path of score_articles, and score_pending on a scratch
+news_articles table.
+
+Uses the real backend (transformer on CPU, or the lexicon fallback) unless
+--lexicon is given.
+
+    python -m benchmarks.bench_sentiment --headlines 5000 --batch-sizes 8,32,128
+"""
+import argparse
+import random
+
+from app.nlp import sentiment
+from app.models import NewsArticle
+from benchmarks.common import make_engine, report, temp_sqlite_url, timer
+
+SUBJECTS = ["Apple", "Microsoft", "Tesla", "Amazon", "Alphabet", "Infosys", "Tata Motors"]
+EVENTS = ["shares surge after record profit", "stock falls on weak guidance", "announces buyback",
+          "faces antitrust probe", "beats estimates", "misses revenue forecast", "holds annual meeting",
+          "cuts jobs amid slowdown", "upgraded by analysts", "recalls vehicles"]
+
+
+def make_headlines(n, seed=0):
+    rng = random.Random(seed)
+    return [f"{rng.choice(SUBJECTS)} {rng.choice(EVENTS)} ({i})" for i in range(n)]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--headlines", type=int, default=5000)
+    parser.add_argument("--batch-sizes", default="8,32,128")
+    parser.add_argument("--lexicon", action="store_true")
+    args = parser.parse_args()
+
+    if args.lexicon:
+        sentiment.set_backend(sentiment.LexiconBackend())
+    backend = sentiment.get_backend()
+    headlines = make_headlines(args.headlines)
+    print(f"backend={backend.name}, {args.headlines} headlines")
+
+    for batch_size in [int(b) for b in args.batch_sizes.split(",")]:
+        with timer() as t:
+            sentiment.score_texts(headlines, batch_size=batch_size)
+        report(f"score_texts (batch_size={batch_size})", t["seconds"], args.headlines, unit="headlines")
+
+    articles = [{"title": h, "description": ""} for h in headlines]
+    sentiment.score_articles(articles)
+    with timer() as t:
+        sentiment.score_articles([{"title": h, "description": ""} for h in headlines])
+    report("score_articles (all cached)", t["seconds"], args.headlines, unit="headlines")
+
+    engine, _ = make_engine(temp_sqlite_url("sentiment"))
+    with engine.begin() as conn:
+        conn.execute(NewsArticle.__table__.insert(), [
+            {"url": f"https://news.example/{i}", "query": "BENCH", "title": h, "description": ""}
+            for i, h in enumerate(make_headlines(args.headlines, seed=1))
+        ])
+    with timer() as t:
+        scored = sentiment.score_pending(engine)
+    report("score_pending (stored rows)", t["seconds"], scored, unit="headlines")
+
+
+if __name__ == "__main__":
+    main()
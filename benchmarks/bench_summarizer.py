@@ -0,0 +1,39 @@
+# benchmarks/bench_summarizer.py
+"""
+Summarization throughput (docs/min) of summarize_many on synthetic reports.
+
+Uses the real backend (distilbart on CPU, or LexRank) unless --stub is given,
+in which case a model-free stub measures the chunking/batching overhead.
+
+    python -m benchmarks.bench_summarizer --docs 20 --words 5000
+"""
+import argparse
+
+from app.nlp import summarizer
+from benchmarks.common import report, timer
+from benchmarks.stubs import StubBackend
+from benchmarks.synthetic import make_text
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--docs", type=int, default=20)
+    parser.add_argument("--words", type=int, default=5000)
+    parser.add_argument("--batch-size", type=int, default=summarizer.BATCH_SIZE)
+    parser.add_argument("--stub", action="store_true")
+    args = parser.parse_args()
+
+    if args.stub:
+        summarizer.set_backend(StubBackend())
+    backend = summarizer.get_backend()
+    docs = [make_text(args.words, seed=i) for i in range(args.docs)]
+    print(f"backend={backend.name}, {args.docs} docs x {args.words} words, batch_size={args.batch_size}")
+
+    with timer() as t:
+        summarizer.summarize_many(docs, batch_size=args.batch_size)
+    report("summarize_many", t["seconds"])
+    print(f"throughput: {args.docs / t['seconds'] * 60:,.1f} docs/min")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+# benchmarks/common.py
+"""Shared helpers for the benchmark scripts (run them with `python -m benchmarks.<name>`)."""
+import os
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+
+from sqlalchemy.orm import sessionmaker
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+def peak_rss_mb():
+    """Peak resident set size of this process in MB (None where unsupported)."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KB, macOS reports bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+@contextmanager
+def timer():
+    """Yield a dict whose "seconds" key is filled in when the block exits."""
+    result = {}
+    start = time.perf_counter()
+    try:
+        yield result
+    finally:
+        result["seconds"] = time.perf_counter() - start
+
+
+def temp_sqlite_url(name="bench"):
+    path = os.path.join(tempfile.mkdtemp(prefix="aifin-bench-"), f"{name}.db")
+    return f"sqlite:///{path}"
+
+
+def make_engine(url):
+    """Engine (app.db profile) + sessionmaker with all app tables created on a scratch database."""
+    from app.db import Base, create_app_engine
+    import app.models  # noqa: F401  register tables
+
+    engine = create_app_engine(url)
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    return engine, sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+def bench_urls():
+    """SQLite always; PostgreSQL when BENCH_POSTGRES_URL points at a scratch database."""
+    urls = [("sqlite", temp_sqlite_url())]
+    if os.getenv("BENCH_POSTGRES_URL"):
+        urls.append(("postgresql", os.environ["BENCH_POSTGRES_URL"]))
+    return urls
+
+
+def report(name, seconds, rows=None, unit="rows"):
+    line = f"{name:<40} {seconds * 1000:>10.1f} ms"
+    if rows:
+        line += f"  {rows / seconds:>12,.1f} {unit}/s"
+    print(line)
@@ -0,0 +1,239 @@
+# benchmarks/run_all.py
+"""
+Whole-pipeline benchmark run on synthetic data, written out as JSON so runs
+on different commits can be compared offline.
+
+Stages: OHLCV ingestion (save_financial_dataframe), the Dashboard queries,
+parse_pdf, parse_excel, report saving + summarize_text (stub model) and
+scheduler runs against a stub price provider. Each stage runs in a fresh
+subprocess against one scratch SQLite database, so peak RSS is per stage
+(it includes generating that stage's synthetic input).
+
+    python -m benchmarks.run_all --tickers 50 --years 5 --output before.json
+    python -m benchmarks.run_all --output after.json --compare before.json
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+from datetime import datetime, timezone
+
+from benchmarks.common import peak_rss_mb, report, temp_sqlite_url, timer
+
+STAGES = ["ingestion", "queries", "pdf", "excel", "reports", "scheduler"]
+
+# Flags forwarded from the parent to every stage subprocess
+PARAMS = {
+    "tickers": (int, 50, "tickers to ingest"),
+    "years": (int, 5, "years of daily bars per ticker"),
+    "reports": (int, 200, "synthetic reports to save and summarize"),
+    "words": (int, 2000, "words per report"),
+    "pages": (int, 100, "PDF pages"),
+    "sheets": (int, 10, "workbook sheets"),
+    "rows": (int, 10_000, "rows per workbook sheet"),
+    "scheduler_tickers": (int, 20, "tickers per scheduler run"),
+    "latency": (float, 0.05, "stub provider latency per call (s)"),
+    "repeat": (int, 5, "best-of repeats for the (read-only) query timings"),
+}
+
+
+def measure(results, name, fn, rows=None, unit="rows", repeat=1):
+    """Best-of-`repeat` time of fn(); rows is a count or a callable on fn's return value."""
+    best = None
+    for _ in range(repeat):
+        with timer() as t:
+            value = fn()
+        best = t["seconds"] if best is None else min(best, t["seconds"])
+    count = rows(value) if callable(rows) else rows
+    results.append({"name": name, "seconds": best, "rows": count, "unit": unit})
+    return value
+
+
+def stage_ingestion(args, results):
+    from app.db import init_db
+    from app.ingestion import save_financial_dataframe
+    from benchmarks.synthetic import make_ohlcv, make_tickers
+
+    init_db()
+    frames = {t: make_ohlcv(t, days=252 * args.years) for t in make_tickers(args.tickers)}
+    measure(results, "ingestion.save_financial_dataframe",
+            lambda: sum(save_financial_dataframe(t, df) for t, df in frames.items()), rows=lambda n: n)
+
+
+def stage_queries(args, results):
+    from sqlalchemy import func, select
+    from app import queries
+    from app.db import engine, init_db
+    from app.ingestion import save_financial_dataframe
+    from app.models import FinancialData
+    from benchmarks.synthetic import make_ohlcv, make_tickers
+
+    init_db()
+    with engine.connect() as conn:
+        stored = conn.execute(select(func.count()).select_from(FinancialData)).scalar()
+    if not stored:  # run on its own (--stages queries): seed untimed
+        for t in make_tickers(args.tickers):
+            save_financial_dataframe(t, make_ohlcv(t, days=252 * args.years))
+
+    # __wrapped__ bypasses the TTL cache (load_prices is uncached), so every call reaches the database
+    points = max(50, 10_000 // args.tickers)
+    for name, fn in [
+        ("dashboard_counts", lambda: queries.dashboard_counts.__wrapped__()),
+        ("ticker_stats", lambda: queries.ticker_stats.__wrapped__()),
+        ("latest_prices", lambda: queries.latest_prices.__wrapped__()),
+        ("price_page", lambda: queries.price_page.__wrapped__()[0]),
+        ("chart_prices", lambda: queries.chart_prices.__wrapped__(points=points)),
+        ("volume_by_ticker", lambda: queries.volume_by_ticker.__wrapped__()),
+        ("map_points", lambda: queries.map_points.__wrapped__()),
+        ("load_prices (all closes)", lambda: queries.load_prices(columns=("close",))),
+    ]:
+        measure(results, f"queries.{name}", fn, rows=len, repeat=args.repeat)
+
+
+def stage_pdf(args, results):
+    from app.data_parsing.pdf_parser import parse_pdf
+    from benchmarks.synthetic import make_pdf
+
+    data = make_pdf(args.pages)
+    measure(results, "parse_pdf", lambda: parse_pdf(data), rows=args.pages, unit="pages")
+
+
+def stage_excel(args, results):
+    from app.data_parsing.excel_parser import parse_excel
+    from benchmarks.synthetic import make_workbook
+
+    data = make_workbook(args.sheets, args.rows)
+    measure(results, "parse_excel", lambda: parse_excel(data, "model.xlsx"), rows=args.sheets * args.rows)
+
+
+def stage_reports(args, results):
+    from app.db import init_db
+    from app.nlp import summarizer
+    from app.reports import save_report_to_db
+    from benchmarks.stubs import StubBackend
+    from benchmarks.synthetic import make_reports
+
+    init_db()
+    docs = list(make_reports(args.reports, args.words))
+    measure(results, "reports.save_report_to_db",
+            lambda: [save_report_to_db(d["title"], d["content"], d["summary"]) for d in docs],
+            rows=len(docs), unit="reports")
+    summarizer.set_backend(StubBackend())
+    measure(results, "summarize_text (stub model)",
+            lambda: [summarizer.summarize_text(d["content"]) for d in docs],
+            rows=len(docs), unit="reports")
+
+
+def stage_scheduler(args, results):
+    from functools import partial
+    from app.automation import scheduled_fetch_job
+    from app.db import init_db
+    from app.ingestion import fetch_and_store
+    from benchmarks.stubs import StubProvider
+
+    init_db()
+    # Own symbols, so the first run is a full-period fetch even after the ingestion stage
+    tickers = [f"S{i:04d}" for i in range(args.scheduler_tickers)]
+    fetch = partial(fetch_and_store, period="1y", provider=StubProvider(latency=args.latency))
+    for name in ("scheduler run (new tickers)", "scheduler run (incremental)"):
+        run = measure(results, name, lambda: scheduled_fetch_job(fetch, tickers, max_workers=4),
+                      rows=lambda run: sum(r.get("result") or 0 for r in run["tickers"].values()))
+        results[-1]["failed"] = run["failed"]
+
+
+def run_child(stage, args):
+    results = []
+    globals()[f"stage_{stage}"](args, results)
+    rss = peak_rss_mb()
+    for r in results:
+        r["stage"] = stage
+        r["rows_per_sec"] = r["rows"] / r["seconds"] if r["rows"] and r["seconds"] else None
+        r["peak_rss_mb"] = rss
+    print(json.dumps(results))
+
+
+def run_stage(stage, url, args):
+    env = dict(os.environ, DATABASE_URL=url, PARSE_CACHE_DIR=tempfile.mkdtemp(prefix="aifin-cache-"))
+    env.pop("PRICE_STORE_DIR", None)
+    cmd = [sys.executable, "-m", "benchmarks.run_all", "--child", stage]
+    for dest in PARAMS:
+        cmd += [f"--{dest.replace('_', '-')}", str(getattr(args, dest))]
+    proc = subprocess.run(cmd, env=env, capture_output=True, text=True)
+    if proc.returncode != 0:
+        error = (proc.stderr.strip().splitlines() or ["exited with %d" % proc.returncode])[-1]
+        return [{"stage": stage, "name": stage, "error": error}]
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results, baseline_path):
+    """Print wall-time and peak-RSS change of each benchmark against a previous run."""
+    with open(baseline_path) as f:
+        baseline = {r["name"]: r for r in json.load(f)["results"] if "error" not in r}
+    print(f"\nvs {baseline_path}:")
+    for r in results:
+        old = baseline.get(r["name"])
+        if old is None or "error" in r:
+            continue
+        line = f"{r['name']:<40} time {100 * (r['seconds'] / old['seconds'] - 1):+7.1f}%"
+        if r.get("peak_rss_mb") and old.get("peak_rss_mb"):
+            line += f"  peak RSS {100 * (r['peak_rss_mb'] / old['peak_rss_mb'] - 1):+7.1f}%"
+        print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    for dest, (kind, default, help_text) in PARAMS.items():
+        parser.add_argument(f"--{dest.replace('_', '-')}", type=kind, default=default, help=help_text)
+    parser.add_argument("--stages", default=",".join(STAGES), help="comma separated subset of " + ", ".join(STAGES))
+    parser.add_argument("--output", default="bench_results.json")
+    parser.add_argument("--compare", default=None, help="previous --output file to diff against")
+    parser.add_argument("--child", default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(args.child, args)
+        return
+
+    stages = [s for s in args.stages.split(",") if s]
+    unknown = set(stages) - set(STAGES)
+    if unknown:
+        parser.error(f"unknown stages: {', '.join(sorted(unknown))}")
+
+    url = temp_sqlite_url("run_all")
+    results = []
+    for stage in stages:
+        for r in run_stage(stage, url, args):
+            results.append(r)
+            if "error" in r:
+                print(f"{r['name']:<40} FAILED: {r['error']}")
+            else:
+                report(r["name"], r["seconds"], r["rows"], unit=r["unit"])
+
+    document = {
+        "commit": git_commit(),
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "params": {dest: getattr(args, dest) for dest in PARAMS},
+        "results": results,
+    }
+    with open(args.output, "w") as f:
+        json.dump(document, f, indent=2)
+    print(f"\nwrote {args.output}")
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+# benchmarks/stubs.py
+"""
+Local stand-ins for the network and model dependencies, so pipeline timings
+measure this repo's code rather than Yahoo, Google News or a transformer.
+"""
+import time
+
+import pandas as pd
+
+from app.nlp import summarizer
+from benchmarks.synthetic import make_ohlcv
+
+# Business days per yfinance period string
+_PERIOD_DAYS = {"1d": 1, "5d": 5, "1mo": 21, "3mo": 63, "6mo": 126, "1y": 252, "2y": 504,
+                "5y": 1260, "10y": 2520, "max": 5040}
+
+
+class StubProvider:
+    """
+    Callable with yf.download's signature (as used by finance_api) returning
+    synthetic bars, after sleeping `latency` seconds per call. Single tickers
+    get yfinance's flat frame, lists with group_by="ticker" get (ticker,
+    field) MultiIndex columns.
+    """
+
+    def __init__(self, latency: float = 0.0, end="2025-12-31"):
+        self.latency = latency
+        self.end = pd.Timestamp(end)
+        self.calls = 0
+
+    def _frame(self, ticker, start, period):
+        if start is not None:
+            days = max(1, len(pd.bdate_range(start, self.end)))
+        else:
+            days = _PERIOD_DAYS.get(period, 252)
+        return make_ohlcv(ticker, days=days, end=self.end)
+
+    def __call__(self, tickers, start=None, end=None, period="1mo", group_by="column", **kwargs):
+        self.calls += 1
+        if self.latency:
+            time.sleep(self.latency)
+        if isinstance(tickers, str):
+            return self._frame(tickers, start, period)
+        frames = {t: self._frame(t, start, period) for t in tickers}
+        if group_by == "ticker":
+            return pd.concat(frames, axis=1)
+        return pd.concat(frames, axis=1).swaplevel(axis=1)
+
+
+class StubBackend:
+    """Summarizer backend that keeps the first sentence of each chunk; no model involved."""
+    name = "stub"
+    chunk_tokens = summarizer.CHUNK_TOKENS
+
+    def count_tokens(self, text):
+        return len(text.split())
+
+    def summarize_batch(self, chunks, **kwargs):
+        return [chunk.split(". ")[0] + "." for chunk in chunks]
+
+
+class StubGoogleNews:
+    """search()/result() like GoogleNews, sleeping `latency` s per search."""
+    latency = 0.5
+
+    def search(self, query):
+        time.sleep(self.latency)
+        self._results = [
+            {"title": f"{query} headline {i}", "desc": f"Something happened to {query}.",
+             "link": f"https://news.example/{query}/{i}", "media": "Example Wire",
+             "date": "1 hour ago", "datetime": None}
+            for i in range(10)
+        ]
+
+    def result(self):
+        return self._results
@@ -0,0 +1,137 @@
+# benchmarks/synthetic.py
+"""Synthetic data generators for the benchmarks."""
+import numpy as np
+import pandas as pd
+
+
+def make_ohlcv(ticker="SYN", days=252 * 5, seed=0, end=None):
+    """A yfinance-shaped daily frame (DatetimeIndex named Date, capitalized columns)."""
+    # Seeded from the ticker's bytes, not hash(): str hashing is salted per process
+    rng = np.random.default_rng([seed, *ticker.encode()])
+    end = pd.Timestamp(end or "2025-12-31")
+    dates = pd.bdate_range(end=end, periods=days, name="Date")
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, days)))
+    spread = np.abs(rng.normal(0, 0.01, days)) * close
+    return pd.DataFrame({
+        "Open": close + rng.normal(0, 0.5, days),
+        "High": close + spread,
+        "Low": close - spread,
+        "Close": close,
+        "Volume": rng.integers(1_000_000, 50_000_000, days).astype(float),
+    }, index=dates)
+
+
+def make_tickers(n):
+    return [f"T{i:04d}" for i in range(n)]
+
+
+_WORDS = ("revenue income margin growth quarter fiscal operating cash flow segment "
+          "guidance capital expenditure dividend liquidity risk outlook earnings share "
+          "market demand supply cost inflation interest rate debt equity asset").split()
+
+
+def make_text(words=500, seed=0):
+    """Report-like filler text made of sentences over a small finance vocabulary."""
+    rng = np.random.default_rng(seed)
+    tokens = rng.choice(_WORDS, size=words)
+    sentences = [" ".join(chunk).capitalize() + "." for chunk in np.array_split(tokens, max(1, words // 15))]
+    return " ".join(sentences)
+
+
+def make_reports(n=1000, words=1000, issuers=500, seed=0):
+    """
+    Yield `n` report rows (title, summary, content) of about `words` words.
+    Each names one of `issuers` synthetic companies, so a given issuer term
+    matches roughly n / issuers reports.
+    """
+    rng = np.random.default_rng(seed)
+    for i in range(n):
+        issuer = f"issuer{rng.integers(0, issuers)}"
+        yield {"title": f"{issuer} annual report {i}", "summary": f"Summary for {issuer}.",
+               "content": make_text(words, seed=seed + i) + f" Prepared by {issuer}."}
+
+
+def make_pdf(pages=10, lines_per_page=45, seed=0):
+    """A minimal multi-page text PDF (Helvetica), built by hand so no PDF library is needed."""
+    rng = np.random.default_rng(seed)
+    objects = []  # index i holds object number i + 1
+
+    def add(body):
+        objects.append(body)
+        return len(objects)
+
+    font = add(b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+    pages_obj = add(b"")  # placeholder, filled once the kids are known
+    kids = []
+    for p in range(pages):
+        lines = [f"Page {p + 1}"] + [
+            " ".join(rng.choice(_WORDS, size=10)) for _ in range(lines_per_page)
+        ]
+        ops = ["BT", "/F1 10 Tf", "14 TL", "40 800 Td"]
+        ops += [f"({line}) Tj T*" for line in lines]
+        ops.append("ET")
+        stream = "\n".join(ops).encode("latin-1")
+        content = add(b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream")
+        kids.append(add(
+            b"<< /Type /Page /Parent %d 0 R /MediaBox [0 0 612 842] "
+            b"/Resources << /Font << /F1 %d 0 R >> >> /Contents %d 0 R >>" % (pages_obj, font, content)
+        ))
+    objects[pages_obj - 1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (
+        b" ".join(b"%d 0 R" % k for k in kids), len(kids))
+    catalog = add(b"<< /Type /Catalog /Pages %d 0 R >>" % pages_obj)
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for i, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n" % i + body + b"\nendobj\n"
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b"".join(b"%010d 00000 n \n" % off for off in offsets)
+    out += b"trailer\n<< /Size %d /Root %d 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, catalog, xref)
+    return bytes(out)
+
+
+def make_workbook(sheets=10, rows=10_000, cols=12, seed=0):
+    """An .xlsx of `sheets` numeric sheets (with a header row), as bytes."""
+    import io
+    import openpyxl
+
+    rng = np.random.default_rng(seed)
+    wb = openpyxl.Workbook(write_only=True)
+    for s in range(sheets):
+        ws = wb.create_sheet(f"Sheet{s + 1}")
+        ws.append(["Period"] + [f"Line{c}" for c in range(1, cols)])
+        values = rng.normal(1000, 250, size=(rows, cols - 1)).round(2)
+        for r in range(rows):
+            ws.append([f"P{r + 1}"] + values[r].tolist())
+    buf = io.BytesIO()
+    wb.save(buf)
+    return _add_dimensions(buf.getvalue(), rows + 1, cols)
+
+
+def _add_dimensions(xlsx, rows, cols):
+    """
+    openpyxl's write-only mode omits <dimension>, which Excel always writes;
+    add it so readers see a workbook shaped like a real one.
+    """
+    import io
+    import zipfile
+    from openpyxl.utils import get_column_letter
+
+    tag = f'</sheetPr><dimension ref="A1:{get_column_letter(cols)}{rows}"/>'.encode()
+    out = io.BytesIO()
+    with zipfile.ZipFile(io.BytesIO(xlsx)) as src, zipfile.ZipFile(out, "w", zipfile.ZIP_DEFLATED) as dst:
+        for item in src.infolist():
+            data = src.read(item.filename)
+            if item.filename.startswith("xl/worksheets/sheet"):
+                data = data.replace(b"</sheetPr>", tag, 1)
+            dst.writestr(item, data)
+    return out.getvalue()
+
+
+def make_csv(rows=100_000, cols=12, seed=0):
+    df = pd.DataFrame(np.random.default_rng(seed).normal(size=(rows, cols)),
+                      columns=[f"c{i}" for i in range(cols)])
+    df.insert(0, "label", [f"row{i}" for i in range(rows)])
+    return df.to_csv(index=False).encode("utf-8")
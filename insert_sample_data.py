@@ -1,36 +1,35 @@
 import pandas as pd
 from datetime import datetime, timedelta
-from app.db import SessionLocal
-from app.models import FinancialData
+from app.ingestion import write_financial_frame
+from app.tickers import COMPANIES
 
-company_locations = {
-    "AAPL": "37.3349,-122.0090",
-    "MSFT": "47.6426,-122.1366",
-    "GOOGL": "37.4220,-122.0841",
-    "AMZN": "47.6220,-122.3360",
-    "TSLA": "37.3947,-122.1500",
-    "TCS.NS": "19.0760,72.8777"
-}
 
-# Generate fake 5 days of closing data for each company
-session = SessionLocal()
-base_date = datetime.now()
+def sample_frame(days: int = 5, base_date=None):
+    """Fake daily bars for each company in app/tickers.py, newest first."""
+    base_date = (base_date or datetime.now()).replace(hour=0, minute=0, second=0, microsecond=0)
+    rows = []
+    for ticker in COMPANIES:
+        for i in range(days):
+            rows.append({
+                "ticker": ticker,
+                "date": base_date - timedelta(days=i),
+                "open": 100.0 + i,
+                "high": 105.0 + i,
+                "low": 95.0 + i,
+                "close": 102.0 + i,
+                "volume": 1000000.0 + i * 5000,
+            })
+    return pd.DataFrame(rows)
 
-for ticker, location in company_locations.items():
-    for i in range(5):
-        day = base_date - timedelta(days=i)
-        fd = FinancialData(
-            ticker=ticker,
-            date=day,
-            open=100 + i,
-            high=105 + i,
-            low=95 + i,
-            close=102 + i,
-            volume=1000000 + i*5000,
-            location=location
-        )
-        session.add(fd)
 
-session.commit()
-session.close()
-print("✅ Sample data with geolocation inserted.")
+def insert_sample_data(bind=None):
+    """
+    Upsert the sample bars through app.ingestion, so the tickers reference
+    rows and the ticker_stats rollup the Dashboard reads are filled in too.
+    """
+    return write_financial_frame(sample_frame(), bind=bind)
+
+
+if __name__ == "__main__":
+    insert_sample_data()
+    print("✅ Sample data with geolocation inserted.")
@@ -0,0 +1,9 @@
+from sqlalchemy import text
+from app.db import engine
+
+# Index for newest-first reads across tickers (Dashboard grid pages, latest prices)
+with engine.begin() as conn:
+    conn.execute(text(
+        "CREATE INDEX IF NOT EXISTS ix_financial_data_date_ticker ON financial_data (date, ticker);"
+    ))
+print("✅ (date, ticker) index in place.")
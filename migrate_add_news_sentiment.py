@@ -0,0 +1,24 @@
+from sqlalchemy import inspect, text
+from app.db import init_db, engine
+from app.nlp.sentiment import score_pending
+
+# Creates news_articles if missing, adds the sentiment columns to an existing
+# one, then scores every stored article that has no sentiment yet
+init_db()
+existing = {c["name"] for c in inspect(engine).get_columns("news_articles")}
+columns = {
+    "content_hash": "VARCHAR",
+    "sentiment_score": "FLOAT",
+    "sentiment_label": "VARCHAR",
+    "sentiment_model": "VARCHAR",
+}
+with engine.begin() as conn:
+    for name, sql_type in columns.items():
+        if name not in existing:
+            conn.execute(text(f"ALTER TABLE news_articles ADD COLUMN {name} {sql_type}"))
+    if "content_hash" not in existing:
+        conn.execute(text(
+            "CREATE INDEX IF NOT EXISTS ix_news_articles_content_hash ON news_articles (content_hash)"
+        ))
+count = score_pending(engine)
+print(f"✅ Sentiment columns ready; scored {count} articles.")
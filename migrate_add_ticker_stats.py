@@ -0,0 +1,7 @@
+from app.db import init_db, engine
+from app.ticker_stats import rebuild_ticker_stats
+
+# Creates ticker_stats (and any other missing tables), then backfills it
+init_db()
+count = rebuild_ticker_stats(engine)
+print(f"✅ ticker_stats built for {count} tickers.")
@@ -0,0 +1,60 @@
+from sqlalchemy import inspect, select, text
+from app.db import init_db, engine
+from app.models import FinancialData, Ticker
+from app.tickers import COMPANIES, reference_row, parse_location
+
+# Creates the tickers table, backfills it from the symbols in financial_data
+# (coordinates from app/tickers.py, else from the old "lat,lon" location
+# strings), then rebuilds financial_data without the location column and
+# with a foreign key to tickers.
+init_db()
+columns = {c["name"] for c in inspect(engine).get_columns("financial_data")}
+has_location = "location" in columns
+
+with engine.begin() as conn:
+    if has_location:
+        # Most common location string per ticker
+        located = conn.execute(text("""
+            SELECT ticker, location, COUNT(*) AS n FROM financial_data
+            WHERE location IS NOT NULL GROUP BY ticker, location ORDER BY ticker, n
+        """)).all()
+        locations = {ticker: location for ticker, location, _ in located}
+    else:
+        locations = {}
+    symbols = conn.execute(select(FinancialData.ticker).distinct()).scalars().all()
+    known = set(conn.execute(select(Ticker.symbol)).scalars())
+    rows = []
+    for symbol in symbols:
+        if symbol is None or symbol in known:
+            continue
+        row = reference_row(symbol)
+        if symbol not in COMPANIES and symbol in locations:
+            row["lat"], row["lon"] = parse_location(locations[symbol])
+        rows.append(row)
+    if rows:
+        conn.execute(Ticker.__table__.insert(), rows)
+print(f"✅ Added {len(rows)} tickers rows.")
+
+if not has_location:
+    print("✅ financial_data already normalized.")
+elif engine.dialect.name == "sqlite":
+    # SQLite can't add a foreign key in place: copy into a fresh table
+    keep = ", ".join(c.name for c in FinancialData.__table__.columns)
+    with engine.begin() as conn:
+        for index in inspect(engine).get_indexes("financial_data"):
+            conn.execute(text(f'DROP INDEX IF EXISTS "{index["name"]}"'))
+        conn.execute(text("ALTER TABLE financial_data RENAME TO financial_data_old"))
+        FinancialData.__table__.create(conn)
+        conn.execute(text(f"INSERT INTO financial_data ({keep}) SELECT {keep} FROM financial_data_old"))
+        conn.execute(text("DROP TABLE financial_data_old"))
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        conn.execute(text("VACUUM"))
+    print("✅ financial_data rebuilt without location, with a foreign key to tickers.")
+else:
+    with engine.begin() as conn:
+        conn.execute(text("ALTER TABLE financial_data DROP COLUMN location"))
+        conn.execute(text(
+            "ALTER TABLE financial_data ADD CONSTRAINT financial_data_ticker_fkey "
+            "FOREIGN KEY (ticker) REFERENCES tickers (symbol)"
+        ))
+    print("✅ Dropped financial_data.location and added a foreign key to tickers.")
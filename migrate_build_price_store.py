@@ -0,0 +1,20 @@
+import pandas as pd
+from sqlalchemy import select
+from app.db import engine
+from app.models import FinancialData
+from app import price_store
+from app.ingestion import normalize_ohlcv
+
+# Copies financial_data into the Parquet store at PRICE_STORE_DIR, one ticker at a time
+if not price_store.enabled():
+    raise SystemExit("Set PRICE_STORE_DIR and install pyarrow to build the price store.")
+
+with engine.connect() as conn:
+    tickers = conn.execute(select(FinancialData.ticker).distinct()).scalars().all()
+
+table = FinancialData.__table__
+partitions = 0
+for ticker in tickers:
+    df = pd.read_sql(select(table).where(table.c.ticker == ticker), engine)
+    partitions += price_store.write_frame(normalize_ohlcv(df, ticker=ticker))
+print(f"✅ Wrote {partitions} partitions for {len(tickers)} tickers to {price_store.PRICE_STORE_DIR}")
@@ -0,0 +1,19 @@
+from sqlalchemy import text
+from app.db import engine
+
+# Keep the most recently inserted bar per (ticker, date), then enforce uniqueness
+with engine.connect() as conn:
+    before = conn.execute(text("SELECT COUNT(*) FROM financial_data;")).scalar()
+    conn.execute(text("""
+        DELETE FROM financial_data
+        WHERE id NOT IN (
+            SELECT MAX(id) FROM financial_data GROUP BY ticker, date
+        );
+    """))
+    conn.execute(text(
+        "CREATE UNIQUE INDEX IF NOT EXISTS ux_financial_data_ticker_date "
+        "ON financial_data (ticker, date);"
+    ))
+    conn.commit()
+    after = conn.execute(text("SELECT COUNT(*) FROM financial_data;")).scalar()
+    print(f"✅ Removed {before - after} duplicate rows; unique (ticker, date) index in place.")
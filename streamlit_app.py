@@ -1,11 +1,3 @@
-company_locations = {
-    "AAPL": "37.3349,-122.0090",   # Apple HQ (Cupertino, CA)
-    "MSFT": "47.6426,-122.1366",   # Microsoft HQ (Redmond, WA)
-    "GOOGL": "37.4220,-122.0841",  # Google HQ (Mountain View, CA)
-    "AMZN": "47.6220,-122.3360",   # Amazon HQ (Seattle, WA)
-    "TSLA": "37.3947,-122.1500",   # Tesla HQ (Palo Alto, CA)
-    "TCS.NS": "19.0760,72.8777"    # Tata Consultancy (Mumbai, India)
-}
 # streamlit_app.py
 from dotenv import load_dotenv
 load_dotenv()
@@ -14,28 +6,17 @@ import os
 import streamlit as st
 import pandas as pd
 from datetime import datetime
-from app.db import init_db, SessionLocal
+from app.db import init_db
 from app.models import SourceFile, Report, FinancialData
-from app.data_parsing.pdf_parser import parse_pdf
-from app.data_parsing.excel_parser import parse_excel
-from app.nlp.summarizer import summarize_text
-from app.services.finance_api import fetch_yfinance_history
-from app.services.news_api import fetch_news
-from app.automation import start_scheduler
-import plotly.express as px
+from app import queries
+from app.cache import file_sha256
+from app.reports import (
+    save_sourcefile, find_sourcefile_by_hash, get_report, parse_pdf_cached,
+)
+from app.ingestion import save_financial_dataframe
 from streamlit_option_menu import option_menu
-
-import streamlit as st
-import pandas as pd
-import plotly.express as px
-import folium
-from streamlit_folium import st_folium
-import streamlit as st
-import pandas as pd
-import plotly.express as px
-import folium
-from streamlit_folium import st_folium
-from st_aggrid import AgGrid, GridOptionsBuilder
+# Heavier modules (plotly, folium, aggrid, pdfplumber, openpyxl, yfinance,
+# GoogleNews, transformers) are imported inside the tab that uses them
 # ---------------------------
 # CUSTOM CSS THEME
 # ---------------------------
@@ -75,104 +56,100 @@ h1, h2, h3 {
 </style>
 """, unsafe_allow_html=True)
 
+@st.cache_resource
+def _init_db_once():
+    init_db()
+    if os.getenv("SUMMARIZER_WARMUP", "0") == "1":
+        # Load the summarization model in the background so the first save is fast
+        from app.nlp.summarizer import warm_up
+        warm_up()
+    from app.jobs import JOB_WORKERS, start_workers
+    if JOB_WORKERS > 0:
+        # Upload jobs run here unless JOB_WORKERS=0 and `python -m app.jobs` serves them
+        start_workers(JOB_WORKERS)
+    # Start the scheduler now so jobs persisted in apscheduler_jobs resume after a restart
+    from app.automation import get_scheduler_manager
+    get_scheduler_manager()
+    return True
+
+_init_db_once()
+
+# Armed on the Performance tab: cProfile this whole rerun, report shown there
+if "active_profiler" in st.session_state:
+    # The profiled run ended early (st.rerun/st.stop); report what it got through
+    from app.instrumentation import stop_profile
+    st.session_state["profile_report"] = stop_profile(st.session_state.pop("active_profiler"))
+if st.session_state.pop("profile_next_run", False):
+    from app.instrumentation import start_profile
+    st.session_state["active_profiler"] = start_profile()
+
 # ---------------------------
 # NAVBAR
 # ---------------------------
 selected = option_menu(
     menu_title=None,
-    options=["Dashboard", "Upload & Parse", "Market & News", "Scheduler", "Database"],
-    icons=["speedometer", "upload", "graph-up", "clock", "database"],
+    options=["Dashboard", "Upload & Parse", "Market & News", "Scheduler", "Database", "Performance"],
+    icons=["speedometer", "upload", "graph-up", "clock", "database", "activity"],
     orientation="horizontal",
 )
 
 # ---------------------------
 # HELPER FUNCTIONS
 # ---------------------------
-def save_report_to_db(title, content, summary):
-    db = SessionLocal()
-    r = Report(title=title, content=content, summary=summary)
-    db.add(r)
-    db.commit()
-    db.refresh(r)
-    db.close()
-    return r
-
-def save_sourcefile(filename, filetype, metadata=None):
-    db = SessionLocal()
-    s = SourceFile(filename=filename, file_type=filetype, file_metadata=metadata)
-    db.add(s)
-    db.commit()
-    db.refresh(s)
-    db.close()
-    return s
-
-def save_financial_dataframe(ticker, df, location=None):
-    if df is None or df.empty:
-        return 0
-    db = SessionLocal()
-    inserted = 0
-    for _, row in df.reset_index().iterrows():
-        # Ensure correct datetime
-        if "date" in row:
-            date_val = pd.to_datetime(row["date"])
-        elif "Date" in row:
-            date_val = pd.to_datetime(row["Date"])
+PDF_PREVIEW_PAGES = 5
+EXCEL_PREVIEW_ROWS = 20
+GRID_PAGE_ROWS = 100
+# Total points across all series of a Dashboard line chart
+CHART_POINT_BUDGET = 10_000
+
+
+@st.fragment(run_every=1.0)
+def show_job_status(job_id, digest):
+    """Poll a background job until it finishes; only this fragment reruns."""
+    from app.jobs import get_job
+
+    job = get_job(job_id)
+    if job is None or job["status"] in ("done", "failed"):
+        # Stop polling; the full rerun shows the saved report or the error
+        st.session_state.pop(f"report_job:{digest}", None)
+        if job is None:
+            st.session_state[f"report_error:{digest}"] = "Job not found"
+        elif job["status"] == "failed":
+            st.session_state[f"report_error:{digest}"] = f"❌ Processing failed: {job['error']}"
         else:
-            continue
-
-        # Convert to Python datetime safely
-        if isinstance(date_val, pd.Series):
-            date_val = date_val.iloc[0]
-        if hasattr(date_val, "to_pydatetime"):
-            date_val = date_val.to_pydatetime()
-
-        try:
-            fd = FinancialData(
-                ticker=ticker,
-                date=date_val,
-                open=float(row.get("Open", row.get("open", 0))),
-                high=float(row.get("High", row.get("high", 0))),
-                low=float(row.get("Low", row.get("low", 0))),
-                close=float(row.get("Close", row.get("close", 0))),
-                volume=float(row.get("Volume", row.get("volume", 0))),
-                location=location
-            )
-            db.add(fd)
-            inserted += 1
-        except Exception as e:
-            print(f"⚠️ Skipped row due to error: {e}")
-    db.commit()
-    db.close()
-    return inserted
+            st.toast("✅ Report saved")
+        st.rerun()
+    else:
+        label = "Waiting for a worker..." if job["status"] == "queued" else (job["message"] or "Working...")
+        st.progress(job["progress"] or 0.0, text=label)
 
 # ---------------------------
 # DASHBOARD
 # ---------------------------
 if selected == "Dashboard":
+    import plotly.express as px
+    from streamlit_folium import st_folium
+    from app.maps import ticker_map
+    from st_aggrid import AgGrid, GridOptionsBuilder
+
     st.title("📊 Dashboard Overview")
 
     # Summary cards & KPIs
-    db = SessionLocal()
-    reports_count = db.query(Report).count()
-    tickers = db.query(FinancialData.ticker).distinct().count()
+    counts = queries.dashboard_counts()
+    reports_count = counts["reports"]
+    tickers = counts["tickers"]
     latest_news = 5
-    rows = db.query(FinancialData).order_by(FinancialData.date.desc()).limit(300).all()
-    db.close()
-
-    # Prepare DataFrame for KPIs
-    if rows:
-        df_kpi = pd.DataFrame([{
-            "date": r.date,
-            "ticker": r.ticker,
-            "close": r.close,
-            "volume": r.volume
-        } for r in rows])
-        avg_close = df_kpi["close"].mean()
-        # Highest Gainer: ticker with max close - min close
-        gainers = df_kpi.groupby("ticker")["close"].agg(["first", "last"])
-        gainers["gain"] = gainers["last"] - gainers["first"]
-        highest_gainer = gainers["gain"].idxmax() if not gainers.empty else "-"
-        most_active = df_kpi.groupby("ticker")["volume"].sum().idxmax() if not df_kpi.empty else "-"
+    stats = queries.ticker_stats()
+
+    # KPIs come from the per-ticker rollup, not from a slice of raw rows
+    if not stats.empty:
+        avg_close = stats["latest_close"].mean()
+        # Highest Gainer: largest % change over the trailing month
+        gain = (stats["latest_close"] - stats["first_close_1m"]) / stats["first_close_1m"]
+        highest_gainer = stats.loc[gain.idxmax(), "ticker"] if gain.notna().any() else "-"
+        # Most Active: largest traded volume over the trailing month
+        volume = stats["volume_1m"]
+        most_active = stats.loc[volume.idxmax(), "ticker"] if volume.notna().any() else "-"
     else:
         avg_close = 0
         highest_gainer = "-"
@@ -188,54 +165,66 @@ if selected == "Dashboard":
 
     st.markdown("---")
     st.subheader("� Financial Data Summary Table")
-    db = SessionLocal()
-    rows = db.query(FinancialData).order_by(FinancialData.date.desc()).limit(300).all()
-    db.close()
-    if rows:
-        df = pd.DataFrame([{
-            "date": r.date,
-            "ticker": r.ticker,
-            "open": r.open,
-            "high": r.high,
-            "low": r.low,
-            "close": r.close,
-            "volume": r.volume,
-            "location": getattr(r, "location", None)
-        } for r in rows])
-
-        # Sortable, filterable table
+    if not stats.empty:
+        # Filters run in SQL; the grid pages with a keyset cursor and the
+        # charts are downsampled server-side, so nothing scales with history
+        f1, f2 = st.columns([2, 1])
+        selected_tickers = tuple(f1.multiselect("Tickers (all if empty)", sorted(stats["ticker"])))
+        first_day = pd.Timestamp(stats["first_date"].min()).date()
+        last_day = pd.Timestamp(stats["latest_date"].max()).date()
+        default_start = max(first_day, last_day - pd.Timedelta(days=365))
+        date_range = f2.date_input("Date range", (default_start, last_day),
+                                   min_value=first_day, max_value=last_day)
+        # The widget returns a partial tuple while a range is being picked
+        start_day = date_range[0] if len(date_range) > 0 else default_start
+        end_day = date_range[1] if len(date_range) > 1 else last_day
+
+        filter_key = (selected_tickers, start_day, end_day)
+        if st.session_state.get("grid_filter") != filter_key:
+            st.session_state["grid_filter"] = filter_key
+            st.session_state["grid_cursors"] = [None]
+        cursors = st.session_state["grid_cursors"]
+        df, next_cursor = queries.price_page(selected_tickers, start_day, end_day,
+                                             cursor=cursors[-1], limit=GRID_PAGE_ROWS)
+
         gb = GridOptionsBuilder.from_dataframe(df)
-        gb.configure_pagination()
         gb.configure_default_column(editable=False, groupable=True)
         gb.configure_side_bar()
         gridOptions = gb.build()
         AgGrid(df, gridOptions=gridOptions, enable_enterprise_modules=True)
+        p1, p2, p3 = st.columns([1, 1, 4])
+        if p1.button("◀ Newer", disabled=len(cursors) == 1):
+            cursors.pop()
+            st.rerun()
+        if p2.button("Older ▶", disabled=next_cursor is None):
+            cursors.append(next_cursor)
+            st.rerun()
+        p3.caption(f"Page {len(cursors)} · {GRID_PAGE_ROWS} rows per page")
 
         st.markdown("---")
         st.subheader("📊 Charts & Graphs")
         chart_type = st.selectbox("Select Chart Type", ["Line", "Bar", "Pie", "Time-Series"])
-        if chart_type == "Line":
-            fig = px.line(df, x="date", y="close", color="ticker", title="Line Chart - Close Price Over Time")
+        if chart_type in ("Line", "Time-Series"):
+            n_series = len(selected_tickers) or len(stats)
+            series = queries.chart_prices(selected_tickers, start_day, end_day,
+                                          points=max(50, CHART_POINT_BUDGET // max(n_series, 1)))
+            title = "Line Chart - Close Price Over Time" if chart_type == "Line" else "Time-Series - Close Price"
+            fig = px.line(series, x="date", y="close", color="ticker", title=title)
         elif chart_type == "Bar":
-            fig = px.bar(df, x="ticker", y="volume", title="Bar Chart - Volume by Ticker")
+            volumes = queries.volume_by_ticker(selected_tickers, start_day, end_day)
+            fig = px.bar(volumes, x="ticker", y="volume", title="Bar Chart - Volume by Ticker")
         elif chart_type == "Pie":
-            fig = px.pie(df, names="ticker", values="close", title="Pie Chart - Close Price Distribution")
-        elif chart_type == "Time-Series":
-            fig = px.line(df, x="date", y="close", color="ticker", title="Time-Series - Close Price")
+            latest = stats if not selected_tickers else stats[stats["ticker"].isin(selected_tickers)]
+            fig = px.pie(latest, names="ticker", values="latest_close", title="Pie Chart - Latest Close by Ticker")
         st.plotly_chart(fig, use_container_width=True)
 
         st.markdown("---")
         st.subheader("🗺 Interactive Map")
-        if "location" in df.columns and df["location"].notna().any():
-            m = folium.Map(location=[20.5937, 78.9629], zoom_start=4)
-            for _, row in df.iterrows():
-                if pd.notna(row.get("location")):
-                    try:
-                        lat, lon = map(float, str(row["location"]).split(","))
-                        folium.Marker([lat, lon], popup=f"{row['ticker']} - {row['close']}").add_to(m)
-                    except:
-                        pass
-            st_folium(m, width=700, height=500)
+        points = queries.map_points()
+        if not points.empty:
+            # One clustered marker per ticker; returned_objects=[] keeps
+            # panning/zooming from rerunning the script
+            st_folium(ticker_map(points), width=700, height=500, returned_objects=[])
         else:
             st.info("No geolocation data found for mapping.")
     else:
@@ -245,37 +234,77 @@ if selected == "Dashboard":
 # UPLOAD
 # ---------------------------
 elif selected == "Upload & Parse":
+    from app.data_parsing.pdf_parser import count_pages
+    from app.data_parsing.excel_parser import open_workbook
+    from app.jobs import enqueue_report
+
     st.header("📂 Upload & Parse Financial Reports")
     uploaded_file = st.file_uploader("Upload PDF/Excel/CSV", type=['pdf','xlsx','xls','csv'])
     if uploaded_file:
         fname = uploaded_file.name
-        file_bytes = uploaded_file.read()
+        file_bytes = uploaded_file.getvalue()
+        digest = file_sha256(file_bytes)
+        existing = find_sourcefile_by_hash(digest)
 
         if fname.lower().endswith(".pdf"):
-            parsed = parse_pdf(file_bytes)
-            st.text_area("Extracted Text", value=parsed["text"][:3000], height=250)
-            if parsed["tables"]:
-                for i, df in enumerate(parsed["tables"]):
-                    st.write(f"Table {i+1}", df.head())
-            if st.button("Save Report to DB"):
-                summary = summarize_text(parsed["text"], max_length=150)
-                save_sourcefile(fname, "pdf")
-                save_report_to_db(fname, parsed["text"], summary)
-                st.success("✅ Report saved")
+            report = None
+            if existing and (existing.file_metadata or {}).get("report_id"):
+                report = get_report(existing.file_metadata["report_id"])
+            if report:
+                # Identical file seen before: reuse the stored report
+                st.info(f"This file was already processed on {existing.uploaded_at} as “{report.title}”.")
+                st.text_area("Summary", value=report.summary or "", height=150)
+                st.text_area("Extracted Text", value=(report.content or "")[:3000], height=250)
+            else:
+                # Preview only the first pages; the full parse runs on save
+                total_pages = count_pages(file_bytes)
+                preview = parse_pdf_cached(file_bytes, digest, max_pages=PDF_PREVIEW_PAGES, workers=1)
+                st.caption(f"Previewing {preview['pages']} of {total_pages} pages")
+                st.text_area("Extracted Text", value=preview["text"][:3000], height=250)
+                if preview["tables"]:
+                    for i, df in enumerate(preview["tables"]):
+                        st.write(f"Table {i+1}", df.head())
+                job_key, error_key = f"report_job:{digest}", f"report_error:{digest}"
+                if st.button("Save Report to DB"):
+                    # Parsing, summarizing and saving run on a job worker
+                    st.session_state.pop(error_key, None)
+                    st.session_state[job_key] = enqueue_report(fname, file_bytes, digest)
+                if job_key in st.session_state:
+                    show_job_status(st.session_state[job_key], digest)
+                elif error_key in st.session_state:
+                    st.error(st.session_state[error_key])
 
         else:
-            sheets = parse_excel(file_bytes, fname)
-            for name, df in sheets.items():
-                st.write("Sheet:", name)
-                st.dataframe(df.head())
-            if st.button("Save Excel metadata"):
-                save_sourcefile(fname, "excel", metadata={"sheets": list(sheets.keys())})
+            # Only sheet names/dimensions are read up front; cells load on demand
+            with open_workbook(file_bytes, fname) as wb:
+                dims = wb.dimensions()
+                st.dataframe(pd.DataFrame(
+                    [{"sheet": name, "rows": r, "columns": c} for name, (r, c) in dims.items()]
+                ))
+                sheet = st.selectbox("Sheet", wb.sheet_names)
+                columns = st.multiselect("Columns (all if empty)", wb.header(sheet))
+                start_row = st.number_input("First row", min_value=0, value=0, step=EXCEL_PREVIEW_ROWS)
+                st.dataframe(wb.load_sheet(sheet, usecols=columns or None,
+                                           start_row=int(start_row), nrows=EXCEL_PREVIEW_ROWS))
+            if existing:
+                st.info(f"This file's metadata was already saved on {existing.uploaded_at}.")
+            elif st.button("Save Excel metadata"):
+                save_sourcefile(fname, "excel", metadata={
+                    "sheets": list(dims.keys()),
+                    "dimensions": {name: list(d) for name, d in dims.items()},
+                    "sha256": digest
+                })
                 st.success("✅ Excel metadata saved")
 
 # ---------------------------
 # MARKET & NEWS
 # ---------------------------
 elif selected == "Market & News":
+    import plotly.express as px
+    from app.analytics import indicators
+    from app.services.finance_api import fetch_many
+    from app.services.news_api import fetch_news_many
+
     st.header("📈 Market Data & 📰 News")
 
     tickers_input = st.text_input(
@@ -288,29 +317,17 @@ elif selected == "Market & News":
         tickers = [t.strip().upper() for t in tickers_input.split(",") if t.strip()]
         df_list = []
 
+        frames, failures = fetch_many(tickers, period=period)
+
         for tk in tickers:
-            df_t = fetch_yfinance_history(tk, period=period)
-            if df_t is not None and not df_t.empty:
-                df_t = df_t.reset_index()
-                df_t["ticker"] = tk
-                df_t.rename(
-                    columns={
-                        "Date": "date",
-                        "Close": "close",
-                        "Open": "open",
-                        "High": "high",
-                        "Low": "low",
-                        "Volume": "volume"
-                    },
-                    inplace=True
-                )
+            df_t = frames.get(tk)
+            if df_t is not None:
                 df_list.append(df_t)
 
-                # Save with geolocation
-                loc = company_locations.get(tk, "37.77,-122.42")
-                save_financial_dataframe(tk, df_t, location=loc)
+                # Company details/coordinates come from the tickers table
+                save_financial_dataframe(tk, df_t)
             else:
-                st.warning(f"⚠️ No market data for {tk}")
+                st.warning(f"⚠️ No market data for {tk}: {failures.get(tk, 'unknown error')}")
 
         if df_list:
             combined = pd.concat(df_list, ignore_index=True)
@@ -318,20 +335,16 @@ elif selected == "Market & News":
             st.subheader("📊 Market Data Sample")
             st.dataframe(combined.head())
 
-            # Clean summary stats per ticker
-            summary_data = []
-            for tk in combined["ticker"].unique():
-                df_tk = combined[combined["ticker"] == tk]
-                avg_close = df_tk["close"].mean()
-                min_close = df_tk["close"].min()
-                max_close = df_tk["close"].max()
-                summary_data.append({
-                    "Ticker": tk,
-                    "Average Close": avg_close,
-                    "Min Close": min_close,
-                    "Max Close": max_close
-                })
-            summary_df = pd.DataFrame(summary_data)
+            # Summary stats per ticker over real bars only; the rolling indicators
+            # use the holiday-filled frame so mixed calendars don't break windows
+            wide = indicators.to_wide(combined)
+            summary_df = indicators.summary(indicators.to_wide(combined, fill=False)).rename(columns={
+                "mean": "Average Close", "min": "Min Close", "max": "Max Close", "last": "Last Close"
+            })
+            summary_df["Volatility (20d, ann.)"] = indicators.rolling_volatility(wide).iloc[-1]
+            summary_df["RSI (14)"] = indicators.rsi(wide).iloc[-1]
+            summary_df["Max Drawdown"] = indicators.drawdown(wide).min()
+            summary_df = summary_df.rename_axis("Ticker").reset_index()
             st.subheader("📈 Summary Statistics")
             st.dataframe(summary_df)
 
@@ -351,59 +364,174 @@ elif selected == "Market & News":
     st.markdown("---")
 
     st.subheader("📰 Latest News by Ticker")
-    for tk in [t.strip().upper() for t in tickers_input.split(",") if t.strip()]:
+    # Fetched concurrently and cached per ticker, so reruns don't re-scrape
+    all_news = fetch_news_many([t.strip().upper() for t in tickers_input.split(",") if t.strip()], page_size=3)
+    sentiment_icons = {"positive": "🟢", "neutral": "⚪", "negative": "🔴"}
+    for tk, news in all_news.items():
         st.write(f"### {tk} News")
-        news = fetch_news(tk, page_size=3)
         if not news or "error" in news:
             st.error(news.get("error", f"Failed to fetch news for {tk}."))
         else:
             for art in news.get("articles", []):
                 st.markdown(f"**{art['title']}** ({art['source']})")
-                st.caption(art.get("publishedAt", ""))
+                label = art.get("sentiment_label")
+                if label:
+                    st.caption(f"{art.get('publishedAt', '')} · {sentiment_icons[label]} {label} "
+                               f"({art['sentiment_score']:+.2f})")
+                else:
+                    st.caption(art.get("publishedAt", ""))
                 st.write(art["description"])
                 st.markdown(f"[Read more]({art['url']})")
                 st.markdown("---")
 
+    daily = queries.daily_sentiment(tickers=list(all_news))
+    if not daily.empty:
+        st.subheader("🧭 Daily News Sentiment")
+        st.plotly_chart(px.line(daily, x="date", y="sentiment", color="ticker", markers=True),
+                        use_container_width=True)
+
 # ---------------------------
 # SCHEDULER
 # ---------------------------
 elif selected == "Scheduler":
+    from app.automation import start_scheduler, get_run_history, get_scheduler_manager
+    from app.ingestion import fetch_and_store
+
     st.header("⏰ Scheduler")
     tickers_text = st.text_input("Tickers (comma separated)", "AAPL,MSFT")
     minutes = st.number_input("Interval (minutes)", min_value=10, value=60)
     if st.button("Start Scheduler"):
         tickers = [t.strip() for t in tickers_text.split(",") if t.strip()]
-        def grab_and_save(tk):
-            df = fetch_yfinance_history(tk, period="1mo")
-            if df is not None and not df.empty:
-                save_financial_dataframe(tk, df)
-        start_scheduler(grab_and_save, tickers, minutes=minutes)
+        start_scheduler(fetch_and_store, tickers, minutes=minutes)
         st.success(f"Scheduler started for {', '.join(tickers)}")
 
+    st.subheader("Scheduled Jobs")
+    manager = get_scheduler_manager()
+    jobs = manager.list_jobs()
+    if jobs:
+        for job in jobs:
+            c1, c2, c3 = st.columns([4, 1, 1])
+            state = "paused" if job["paused"] else f"next run {job['next_run_time']:%Y-%m-%d %H:%M}"
+            c1.write(f"**{job['tickers']}** every {job['minutes']:.0f} min ({state})")
+            if job["paused"]:
+                if c2.button("Resume", key=f"resume-{job['id']}"):
+                    manager.resume(job["id"])
+                    st.rerun()
+            elif c2.button("Pause", key=f"pause-{job['id']}"):
+                manager.pause(job["id"])
+                st.rerun()
+            if c3.button("Remove", key=f"remove-{job['id']}"):
+                manager.remove(job["id"])
+                st.rerun()
+    else:
+        st.info("No scheduled jobs.")
+
+    st.subheader("Recent Runs")
+    runs = get_run_history()
+    if runs:
+        st.dataframe(pd.DataFrame([{
+            "started_at": r["started_at"],
+            "duration_s": round(r["duration_s"], 2),
+            "succeeded": r["succeeded"],
+            "failed": r["failed"]
+        } for r in runs]))
+        st.caption("Latest run, per ticker")
+        st.dataframe(pd.DataFrame([{
+            "ticker": tk,
+            "status": res["status"],
+            "attempts": res["attempts"],
+            "seconds": round(res["seconds"], 2),
+            "error": res.get("error", "")
+        } for tk, res in runs[0]["tickers"].items()]))
+    else:
+        st.info("No scheduler runs yet.")
+
 # ---------------------------
 # DATABASE
 # ---------------------------
 elif selected == "Database":
+    from app.search import search_reports
+
     st.header("🗄️ Database Preview")
-    db = SessionLocal()
+
+    st.subheader("Search Reports")
+    search_query = st.text_input("Search report titles, summaries and text", "")
+    if search_query.strip():
+        page_size = 10
+        page = st.number_input("Page", min_value=1, value=1, step=1)
+        found = search_reports(search_query, limit=page_size, offset=(int(page) - 1) * page_size)
+        pages = max(1, -(-found["total"] // page_size))
+        st.caption(f"{found['total']} matching reports · page {int(page)} of {pages}")
+        for hit in found["results"]:
+            st.markdown(f"**{hit['title']}** – {hit['created_at']}")
+            st.markdown(hit["snippet"], unsafe_allow_html=True)
 
     st.subheader("Recent Reports")
-    reports = db.query(Report).order_by(Report.created_at.desc()).limit(5).all()
-    for r in reports:
+    reports = queries.recent_reports(limit=5)
+    for r in reports.itertuples():
         st.write(f"**{r.title}** – {r.created_at}")
         st.caption(r.summary)
 
     st.subheader("Recent Financial Data")
-    rows = db.query(FinancialData).order_by(FinancialData.date.desc()).limit(10).all()
-    if rows:
-        df = pd.DataFrame([{
-            "date": r.date,
-            "ticker": r.ticker,
-            "open": r.open,
-            "close": r.close,
-            "volume": r.volume
-        } for r in rows])
+    df = queries.latest_prices(limit=10, columns=("date", "ticker", "open", "close", "volume"))
+    if not df.empty:
         st.dataframe(df)
     else:
         st.info("No financial data yet.")
-    db.close()
+
+# ---------------------------
+# PERFORMANCE
+# ---------------------------
+elif selected == "Performance":
+    from app import instrumentation
+    from app.jobs import list_jobs
+
+    st.header("⏱️ Performance")
+    st.caption("Timings recorded by this app process since it started (last "
+               f"{instrumentation.PERF_WINDOW} calls per operation).")
+
+    ops = instrumentation.snapshot()
+    if ops:
+        st.dataframe(pd.DataFrame(ops).round({"p50_ms": 1, "p95_ms": 1, "max_ms": 1, "total_s": 2}),
+                     hide_index=True)
+    else:
+        st.info("Nothing recorded yet.")
+    counts = instrumentation.counters()
+    if counts:
+        st.dataframe(pd.DataFrame(sorted(counts.items()), columns=["counter", "value"]), hide_index=True)
+
+    st.subheader("Slowest Queries")
+    slow = instrumentation.slow_queries()
+    if slow:
+        st.dataframe(pd.DataFrame(slow).round({"ms": 1}), hide_index=True)
+    else:
+        st.info("No queries recorded yet.")
+
+    st.subheader("Background Jobs")
+    st.caption("Workers run in their own processes; each finished job carries its own timings.")
+    jobs = [j for j in list_jobs(limit=20) if j["started_at"] and j["finished_at"]]
+    if jobs:
+        st.dataframe(pd.DataFrame([{
+            "id": j["id"],
+            "kind": j["kind"],
+            "status": j["status"],
+            "seconds": round((j["finished_at"] - j["started_at"]).total_seconds(), 2),
+            **{name: round(s, 2) for name, s in ((j["result"] or {}).get("timings") or {}).items()},
+        } for j in jobs]), hide_index=True)
+    else:
+        st.info("No finished jobs yet.")
+
+    st.subheader("Profile a Rerun")
+    c1, c2 = st.columns(2)
+    if c1.button("Profile next rerun"):
+        st.session_state["profile_next_run"] = True
+        st.info("Armed: the next rerun (e.g. switching to another tab) is profiled.")
+    if c2.button("Reset timings"):
+        instrumentation.reset()
+        st.rerun()
+    if "profile_report" in st.session_state:
+        st.code(st.session_state["profile_report"], language="text")
+
+if "active_profiler" in st.session_state:
+    from app.instrumentation import stop_profile
+    st.session_state["profile_report"] = stop_profile(st.session_state.pop("active_profiler"))
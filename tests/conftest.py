@@ -0,0 +1,25 @@
+# tests/conftest.py
+import os
+import tempfile
+
+# app.db builds its engine at import time, so point it at a scratch database first
+_scratch = tempfile.mkdtemp(prefix="aifin-test-")
+os.environ["DATABASE_URL"] = "sqlite:///" + os.path.join(_scratch, "test.db")
+os.environ["PARSE_CACHE_DIR"] = os.path.join(_scratch, "cache")
+os.environ["JOB_SPOOL_DIR"] = os.path.join(_scratch, "spool")
+os.environ.pop("PRICE_STORE_DIR", None)
+
+import pytest
+
+
+@pytest.fixture
+def db():
+    """Fresh app tables on the scratch database; yields the engine."""
+    from app import queries
+    from app.db import Base, engine, init_db
+
+    Base.metadata.drop_all(bind=engine)
+    init_db()
+    queries.invalidate()
+    yield engine
+    queries.invalidate()
@@ -0,0 +1,38 @@
+# tests/test_excel_parser.py
+import pandas as pd
+
+from app.data_parsing.excel_parser import open_workbook
+
+
+def test_csv_preview_keeps_integer_columns():
+    data = b"label,qty,price\na,3,1.5\nb,4,2.5\n"
+    with open_workbook(data, "data.csv") as f:
+        preview = f.preview(n=2)
+    assert preview["qty"].tolist() == [3, 4]
+    assert preview["qty"].dtype == "Int64"
+    assert preview["price"].dtype == "float64"
+
+
+def test_csv_integer_column_with_later_fraction_falls_back_to_float(monkeypatch):
+    from app.data_parsing import excel_parser
+
+    monkeypatch.setattr(excel_parser, "CSV_SAMPLE_ROWS", 2)
+    data = b"qty\n1\n2\n3\n4.5\n"
+    with open_workbook(data, "data.csv") as f:
+        chunks = list(f.iter_chunks(chunksize=2))
+        full = f.load_sheet()
+    assert pd.concat(chunks)["qty"].tolist() == [1, 2, 3, 4.5]
+    assert full["qty"].tolist() == [1, 2, 3, 4.5]
+
+
+def test_csv_numeric_column_with_later_text_falls_back_to_object(monkeypatch):
+    from app.data_parsing import excel_parser
+
+    monkeypatch.setattr(excel_parser, "CSV_SAMPLE_ROWS", 3)
+    data = b"code,amt\n1,1.5\n2,2.5\n3,3.5\nX9,n/a-ish\n"
+    with open_workbook(data, "data.csv") as f:
+        page = f.load_sheet(start_row=2)
+        chunks = list(f.iter_chunks(chunksize=3))
+    assert page["code"].tolist() == ["3", "X9"]
+    assert page["amt"].tolist() == ["3.5", "n/a-ish"]
+    assert pd.concat(chunks)["code"].astype(str).tolist() == ["1", "2", "3", "X9"]
@@ -0,0 +1,17 @@
+# tests/test_indicators.py
+import pandas as pd
+
+from app.analytics import indicators
+
+
+def test_summary_ignores_holiday_fill():
+    # XYZ doesn't trade on the 2nd; filling would repeat its 10.0 close there
+    long = pd.DataFrame({
+        "date": pd.to_datetime(["2024-01-01", "2024-01-02", "2024-01-03", "2024-01-01", "2024-01-03"]),
+        "ticker": ["ABC", "ABC", "ABC", "XYZ", "XYZ"],
+        "close": [1.0, 2.0, 3.0, 10.0, 40.0],
+    })
+    stats = indicators.summary(indicators.to_wide(long, fill=False))
+    assert stats.loc["XYZ", "mean"] == 25.0
+    assert stats.loc["XYZ", "last"] == 40.0
+    assert indicators.summary(indicators.to_wide(long)).loc["XYZ", "mean"] == 20.0
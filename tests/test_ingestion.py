@@ -0,0 +1,34 @@
+# tests/test_ingestion.py
+import pandas as pd
+
+from app import price_store, queries
+from app.ingestion import save_financial_dataframe
+
+
+def _bars(**columns):
+    dates = pd.date_range("2024-01-01", periods=2)
+    return pd.DataFrame({"date": dates, **columns})
+
+
+def test_parquet_failure_keeps_sql_write_and_clears_cache(db, monkeypatch):
+    assert queries.dashboard_counts()["tickers"] == 0  # cached before the write
+
+    def broken(frame):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(price_store, "write_frame", broken)
+    assert save_financial_dataframe("AAA", _bars(close=[1.0, 2.0])) == 2
+    assert queries.dashboard_counts()["tickers"] == 1
+
+
+def test_missing_columns_keep_stored_values(db):
+    save_financial_dataframe("AAA", _bars(open=[1.0, 2.0], close=[1.5, 2.5], volume=[100.0, 200.0]))
+    save_financial_dataframe("AAA", _bars(close=[1.6, 2.6]))
+    save_financial_dataframe("BBB", _bars(volume=[10.0, 20.0]))
+
+    prices = queries.load_prices().set_index("ticker")
+    assert prices.loc["AAA", "close"].tolist() == [1.6, 2.6]
+    assert prices.loc["AAA", "open"].tolist() == [1.0, 2.0]
+    assert prices.loc["AAA", "volume"].tolist() == [100.0, 200.0]
+    # Never written: NULL rather than 0
+    assert prices.loc["BBB", "close"].isna().all()
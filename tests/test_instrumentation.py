@@ -0,0 +1,45 @@
+# tests/test_instrumentation.py
+import pytest
+
+from app import instrumentation
+from app.services.finance_api import fetch_yfinance_history
+from benchmarks.stubs import StubProvider
+
+
+@pytest.fixture(autouse=True)
+def clean():
+    instrumentation.reset()
+    yield
+    instrumentation.reset()
+
+
+def _stats(name):
+    return next(r for r in instrumentation.snapshot() if r["operation"] == name)
+
+
+def test_yfinance_history_failures_count_as_errors():
+    def failing(*args, **kwargs):
+        raise ConnectionError("rate limited")
+
+    assert fetch_yfinance_history("AAPL", provider=failing) is None
+    assert fetch_yfinance_history("AAPL", provider=StubProvider()) is not None
+
+    stats = _stats("yfinance.history")
+    assert stats["calls"] == 2
+    assert stats["errors"] == 1
+
+
+def test_timed_decorator_and_capture():
+    @instrumentation.timed("op")
+    def op(fail=False):
+        if fail:
+            raise ValueError("boom")
+
+    with instrumentation.capture() as spans:
+        op()
+        with pytest.raises(ValueError):
+            op(fail=True)
+
+    assert _stats("op")["calls"] == 2
+    assert _stats("op")["errors"] == 1
+    assert set(spans) == {"op"}
@@ -0,0 +1,48 @@
+# tests/test_jobs.py
+import os
+import time
+
+import pytest
+
+from app import jobs
+
+
+@pytest.fixture
+def spool(db, tmp_path, monkeypatch):
+    monkeypatch.setattr(jobs, "JOB_SPOOL_DIR", str(tmp_path))
+    return tmp_path
+
+
+def _claimed_report(handler, monkeypatch):
+    monkeypatch.setitem(jobs.HANDLERS, "report", handler)
+    job_id = jobs.enqueue_report("a.pdf", b"%PDF-1.4 test", "abc123")
+    return job_id, jobs.claim("test-worker")
+
+
+def test_heartbeat_keeps_a_long_job_fresh(spool, monkeypatch):
+    monkeypatch.setattr(jobs, "HEARTBEAT_INTERVAL", 0.05)
+    beats = []
+
+    def slow_handler(payload, progress):
+        # No progress calls, like a long summarize step
+        time.sleep(0.3)
+        beats.append(jobs.get_job(job_id)["updated_at"])
+        return {}
+
+    job_id, job = _claimed_report(slow_handler, monkeypatch)
+    started = jobs.get_job(job_id)["updated_at"]
+    assert jobs.run_job(job) == "done"
+    assert beats[0] > started
+
+
+@pytest.mark.parametrize("fails", [False, True])
+def test_spool_file_removed_when_job_finishes(spool, monkeypatch, fails):
+    def handler(payload, progress):
+        assert os.path.exists(payload["path"])
+        if fails:
+            raise RuntimeError("boom")
+        return {}
+
+    job_id, job = _claimed_report(handler, monkeypatch)
+    assert jobs.run_job(job) == ("failed" if fails else "done")
+    assert not os.path.exists(job["payload"]["path"])
@@ -0,0 +1,61 @@
+# tests/test_news_api.py
+import pytest
+
+from app.nlp import sentiment
+from app.services import news_api
+from benchmarks.stubs import StubGoogleNews
+
+
+class CountingNews(StubGoogleNews):
+    """Stub client that records every search and fails for queries in `failing`."""
+    latency = 0
+    searches = []
+    failing = set()
+
+    def search(self, query):
+        CountingNews.searches.append(query)
+        if query in self.failing:
+            raise ConnectionError(f"search for {query} failed")
+        super().search(query)
+
+
+@pytest.fixture(autouse=True)
+def stub_news(db):
+    news_api.invalidate()
+    sentiment.set_backend(sentiment.LexiconBackend())
+    CountingNews.searches = []
+    CountingNews.failing = set()
+    yield
+    news_api.invalidate()
+
+
+def test_second_call_within_ttl_is_a_cache_hit():
+    first = news_api.fetch_news("AAPL", page_size=3, client_factory=CountingNews)
+    second = news_api.fetch_news("AAPL", page_size=3, client_factory=CountingNews)
+
+    assert len(first["articles"]) == 3
+    assert second == first
+    assert CountingNews.searches == ["AAPL"]
+
+
+def test_failing_query_does_not_affect_the_others():
+    CountingNews.failing = {"BAD"}
+    news = news_api.fetch_news_many(["AAPL", "BAD", "MSFT"], page_size=3, client_factory=CountingNews)
+
+    assert "error" in news["BAD"]
+    assert len(news["AAPL"]["articles"]) == 3
+    assert len(news["MSFT"]["articles"]) == 3
+    assert all("sentiment_label" in a for a in news["AAPL"]["articles"])
+
+    # Failures are not cached, so the next call retries the failed query only
+    CountingNews.failing = set()
+    news = news_api.fetch_news_many(["AAPL", "BAD", "MSFT"], page_size=3, client_factory=CountingNews)
+    assert len(news["BAD"]["articles"]) == 3
+    assert sorted(CountingNews.searches) == ["AAPL", "BAD", "BAD", "MSFT"]
+
+
+def test_save_articles_dedups_by_url(db):
+    articles = news_api.fetch_news("AAPL", page_size=3, client_factory=CountingNews, persist=False)["articles"]
+
+    assert news_api.save_articles("AAPL", articles, bind=db) == 3
+    assert news_api.save_articles("AAPL", articles, bind=db) == 0
@@ -0,0 +1,35 @@
+# tests/test_price_store.py
+import pandas as pd
+import pytest
+
+from app import price_store, queries
+from app.ingestion import normalize_ohlcv, write_financial_frame
+
+pytest.importorskip("pyarrow")
+
+
+@pytest.mark.parametrize("end", ["2024-01-02", "2024-01-02 12:00"])
+def test_store_and_sql_apply_the_same_end_bound(db, tmp_path, monkeypatch, end):
+    monkeypatch.setattr(price_store, "PRICE_STORE_DIR", str(tmp_path))
+    dates = pd.to_datetime(["2024-01-01 00:00", "2024-01-02 09:30", "2024-01-02 15:30", "2024-01-03 00:00"])
+    write_financial_frame(normalize_ohlcv(pd.DataFrame({"date": dates, "close": [1.0, 2.0, 3.0, 4.0]}), "AAA"))
+
+    stored = queries.load_prices(end=end, columns=("close",))
+    monkeypatch.setattr(price_store, "PRICE_STORE_DIR", None)
+    sql = queries.load_prices(end=end, columns=("close",))
+
+    expected = [1.0, 2.0, 3.0] if end == "2024-01-02" else [1.0, 2.0]
+    assert stored["close"].tolist() == expected
+    assert sql["close"].tolist() == expected
+
+
+def test_store_keeps_columns_missing_from_a_write(tmp_path):
+    dates = pd.to_datetime(["2024-01-01", "2024-01-02"])
+    first = pd.DataFrame({"date": dates, "close": [1.0, 2.0], "volume": [5.0, 6.0]})
+    price_store.write_frame(normalize_ohlcv(first, "AAA"), root=str(tmp_path))
+    price_store.write_frame(normalize_ohlcv(first.iloc[1:][["date"]].assign(close=2.5), "AAA"), root=str(tmp_path))
+
+    stored = price_store.load(root=str(tmp_path))
+    assert stored["close"].tolist() == [1.0, 2.5]
+    assert stored["volume"].tolist() == [5.0, 6.0]
+    assert stored["open"].isna().all()
@@ -0,0 +1,26 @@
+# tests/test_sample_data.py
+from sqlalchemy.orm import Session
+
+from app import queries
+from app.tickers import COMPANIES
+from insert_sample_data import insert_sample_data
+
+
+def test_sample_data_fills_ticker_stats(db):
+    assert insert_sample_data() == 5 * len(COMPANIES)
+
+    stats = queries.ticker_stats()
+    assert sorted(stats["ticker"]) == sorted(COMPANIES)
+    assert queries.dashboard_counts()["tickers"] == len(COMPANIES)
+    assert len(queries.map_points()) == len(COMPANIES)
+
+
+def test_save_financial_data_refreshes_ticker_stats(db):
+    from app.services.finance_api import save_financial_data
+
+    with Session(db) as session:
+        save_financial_data(session, "AAPL", price=190.0, volume=1e6, pe_ratio=None)
+
+    stats = queries.ticker_stats()
+    assert stats["ticker"].tolist() == ["AAPL"]
+    assert stats["latest_close"].iloc[0] == 190.0
@@ -0,0 +1,45 @@
+# tests/test_streamlit_app.py
+import pytest
+import streamlit
+import streamlit_option_menu
+from streamlit.testing.v1 import AppTest
+
+from app import jobs
+from app.cache import file_sha256
+from benchmarks.synthetic import make_pdf
+
+
+class Upload:
+    name = "report.pdf"
+
+    def __init__(self, data):
+        self._data = data
+
+    def getvalue(self):
+        return self._data
+
+
+@pytest.fixture
+def upload_tab(db, monkeypatch):
+    """AppTest of the Upload tab with a PDF already uploaded; yields (app, digest)."""
+    monkeypatch.setattr(jobs, "JOB_WORKERS", 0)
+    monkeypatch.setattr(streamlit_option_menu, "option_menu", lambda *a, **kw: "Upload & Parse")
+    data = make_pdf(2)
+    monkeypatch.setattr(streamlit, "file_uploader", lambda *a, **kw: Upload(data))
+    return AppTest.from_file("../streamlit_app.py", default_timeout=30), file_sha256(data)
+
+
+def test_failed_job_stops_polling_and_keeps_the_error(upload_tab):
+    at, digest = upload_tab
+    job_id = jobs.enqueue("report", {"filename": "report.pdf", "path": "missing", "sha256": digest})
+    jobs._finish(job_id, status="failed", error="boom", message="failed")
+
+    at.session_state[f"report_job:{digest}"] = job_id
+    at.run()
+    assert not at.exception
+    assert f"report_job:{digest}" not in at.session_state
+    assert [e.value for e in at.error] == ["Processing failed: boom"]  # st.error lifts the emoji into its icon
+
+    # Later reruns keep showing the error without a job to poll
+    at.run()
+    assert [e.value for e in at.error] == ["Processing failed: boom"]  # st.error lifts the emoji into its icon
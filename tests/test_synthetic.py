@@ -0,0 +1,10 @@
+# tests/test_synthetic.py
+import subprocess
+import sys
+
+
+def test_make_ohlcv_is_identical_across_processes():
+    code = "from benchmarks.synthetic import make_ohlcv; print(make_ohlcv('T0000', days=5).to_json())"
+    runs = {subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+            for _ in range(2)}
+    assert len(runs) == 1